@@ -138,7 +138,7 @@ CREATE TABLE dbo.Appointments (
 );
 
 -- Performance indexes
-CREATE INDEX IX_Appointments_Date ON dbo.Appointments(appointmentdate);
+CREATE INDEX IX_Appointments_Date ON dbo.Appointments(appointmentdate) INCLUDE (appointmentstatus);
 CREATE INDEX IX_Appointments_DateTime ON dbo.Appointments(appointmentdatetime);
 CREATE INDEX IX_Appointments_Patient ON dbo.Appointments(patientid);
 CREATE INDEX IX_Appointments_Provider_Date ON dbo.Appointments(providerid, appointmentdate);
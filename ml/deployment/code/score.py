@@ -10,12 +10,16 @@ Supports two input formats:
 Returns probability scores from predict_proba().
 """
 
-import json
 import logging
 import os
+import queue
+import threading
+import time
+from typing import Any
 
 import joblib
 import numpy as np
+import orjson
 import pandas as pd
 
 # Set up logging
@@ -25,6 +29,37 @@ logger = logging.getLogger(__name__)
 # Global model reference
 model = None
 
+# Number of top contributing features reported per prediction
+TOP_FEATURE_COUNT = 5
+
+# Whether the model takes positional ndarrays (fitted without feature names)
+_ACCEPTS_ARRAY = False
+
+# Model scoring method resolved once in init(): predict_proba, else predict
+_HAS_PROBA = False
+_PREDICT_FN = None
+
+# TreeSHAP explainer for per-row attributions (optional, SCORE_EXPLAIN=true)
+_EXPLAINER = None
+
+# ONNX Runtime session used for scoring when model.onnx ships with the model
+_SESSION = None
+
+# Per-column pandas dtypes from the MLflow model signature (resolved in init())
+_EXPECTED_DTYPES: dict[str, Any] = {}
+
+# Optional micro-batcher coalescing concurrent requests (SCORE_BATCH_WINDOW_MS > 0)
+_BATCHER = None
+
+# numpy dtypes for ONNX tensor input types
+_ONNX_INPUT_DTYPES = {
+    "tensor(float)": np.float32,
+    "tensor(double)": np.float64,
+    "tensor(int64)": np.int64,
+    "tensor(string)": object,
+    "tensor(bool)": bool,
+}
+
 # Feature columns expected by the model (must match training data)
 FEATURE_COLUMNS = [
     "patient_age_bucket", "patient_gender", "patient_zip_code", "patient_race_ethnicity",
@@ -33,15 +68,22 @@ FEATURE_COLUMNS = [
     "day_of_week", "hour_of_day", "appointmentduration", "webschedulableyn",
     "provider_specialty", "providertype", "departmentspecialty", "placeofservicetype", "market"
 ]
+_FEATURE_COLUMNS_SET = frozenset(FEATURE_COLUMNS)
+
+# Risk buckets: searchsorted over the thresholds indexes straight into the labels
+# (0.6 itself is Medium, so the upper bound is the next float above it)
+_RISK_LABELS = np.array(["Low", "Medium", "High"])
+_RISK_THRESHOLDS = np.array([0.3, np.nextafter(0.6, 1.0)])
 
 
 def init() -> None:
     """Initialize the model.
 
     This function is called once when the deployment starts.
-    Load the model from the registered model directory.
+    Load the model from the registered model directory and precompute
+    any per-model state used on the request path.
     """
-    global model
+    global model, _SESSION, _EXPECTED_DTYPES, _BATCHER
 
     logger.info("Initializing no-show prediction model...")
 
@@ -49,6 +91,27 @@ def init() -> None:
     model_dir = os.environ.get("AZUREML_MODEL_DIR", ".")
     logger.info(f"Model directory: {model_dir}")
 
+    model = _load_model(model_dir)
+    # TreeSHAP costs roughly as much per row as scoring a whole batch, so
+    # per-prediction explanations are opt-in
+    explain = os.environ.get("SCORE_EXPLAIN", "false").lower() == "true"
+    _prepare_model(model, explain=explain)
+    _SESSION = _load_onnx_session(model_dir)
+    if _SESSION is not None and not _onnx_session_matches(_SESSION, model):
+        logger.warning("ONNX model does not match the sklearn model, scoring with sklearn")
+        _SESSION = None
+    _EXPECTED_DTYPES = _load_expected_dtypes(model_dir)
+
+    # Batching only helps when the server runs requests concurrently in-process
+    batch_window_ms = float(os.environ.get("SCORE_BATCH_WINDOW_MS", "0"))
+    if batch_window_ms > 0 and (_SESSION is not None or _HAS_PROBA):
+        max_rows = int(os.environ.get("SCORE_MAX_BATCH_ROWS", "1000"))
+        _BATCHER = _MicroBatcher(_predict_proba, batch_window_ms / 1000, max_rows)
+        logger.info(f"Micro-batching enabled: {batch_window_ms}ms window, {max_rows} max rows")
+
+
+def _load_model(model_dir: str) -> Any:
+    """Load the model from the first known location under model_dir."""
     # List directory contents for debugging
     try:
         for root, dirs, files in os.walk(model_dir):
@@ -70,13 +133,13 @@ def init() -> None:
             import mlflow
             logger.info(f"Trying to load MLflow model from {mlflow_path}")
             if os.path.exists(os.path.join(mlflow_path, "MLmodel")):
-                model = mlflow.sklearn.load_model(mlflow_path)
+                loaded = mlflow.sklearn.load_model(mlflow_path)
                 logger.info("Model loaded successfully via MLflow")
                 
                 # Log model type and capabilities
-                logger.info(f"Model type: {type(model).__name__}")
-                logger.info(f"Has predict_proba: {hasattr(model, 'predict_proba')}")
-                return
+                logger.info(f"Model type: {type(loaded).__name__}")
+                logger.info(f"Has predict_proba: {hasattr(loaded, 'predict_proba')}")
+                return loaded
         except Exception as e:
             logger.warning(f"MLflow load failed from {mlflow_path}: {e}")
 
@@ -92,27 +155,396 @@ def init() -> None:
     for model_path in model_paths:
         if os.path.exists(model_path):
             logger.info(f"Loading model from {model_path}")
-            model = joblib.load(model_path)
-            logger.info(f"Model loaded successfully: {type(model).__name__}")
-            return
+            loaded = joblib.load(model_path)
+            logger.info(f"Model loaded successfully: {type(loaded).__name__}")
+            return loaded
 
     raise RuntimeError("Failed to load model from any known location")
 
 
-def calculate_risk_level(probability: float) -> str:
-    """Calculate risk level from probability.
+def _load_onnx_session(model_dir: str) -> Any:
+    """Load an ONNX Runtime session if a converted model.onnx is available.
+
+    The sklearn model is still loaded for explanations; scoring switches to
+    the ONNX graph when present and falls back to sklearn otherwise.
+    """
+    onnx_paths = [
+        os.path.join(model_dir, "model.onnx"),
+        os.path.join(model_dir, "mlflow-model", "model.onnx"),
+        os.path.join(model_dir, "1", "mlflow-model", "model.onnx"),
+    ]
+
+    for onnx_path in onnx_paths:
+        if os.path.exists(onnx_path):
+            try:
+                import onnxruntime as ort
+                sess_options = ort.SessionOptions()
+                sess_options.intra_op_num_threads = int(os.environ.get("ONNX_INTRA_OP_THREADS", "0"))
+                session = ort.InferenceSession(
+                    onnx_path, sess_options, providers=["CPUExecutionProvider"]
+                )
+                logger.info(f"ONNX model loaded from {onnx_path}")
+                return session
+            except Exception as e:
+                logger.warning(f"ONNX load failed from {onnx_path}: {e}")
+
+    logger.info("No ONNX model found, scoring with sklearn")
+    return None
+
+
+def _load_expected_dtypes(model_dir: str) -> dict[str, Any]:
+    """Read per-column input dtypes from the MLflow model signature.
+
+    Applying these once per request lets pipelines receive correctly typed
+    columns without pandas re-inferring (and copying) every block.
+    """
+    mlflow_model_paths = [
+        model_dir,
+        os.path.join(model_dir, "mlflow-model"),
+        os.path.join(model_dir, "1", "mlflow-model"),
+    ]
+
+    for mlflow_path in mlflow_model_paths:
+        if os.path.exists(os.path.join(mlflow_path, "MLmodel")):
+            try:
+                from mlflow.models import Model
+                signature = Model.load(mlflow_path).signature
+                if signature is None:
+                    return {}
+                dtypes = {
+                    col.name: col.type.to_pandas()
+                    for col in signature.inputs.inputs
+                    if col.name in _FEATURE_COLUMNS_SET
+                }
+                logger.info(f"Expected input dtypes: {dtypes}")
+                return dtypes
+            except Exception as e:
+                logger.warning(f"Could not read model signature from {mlflow_path}: {e}")
+
+    return {}
+
+
+def _onnx_session_matches(session: Any, loaded_model: Any) -> bool:
+    """Check that an ONNX session takes FEATURE_COLUMNS and agrees with the model.
+
+    Scores one placeholder row through both the ONNX graph and the sklearn
+    model; the session is only used when the graph's inputs and output
+    shape fit and, where sklearn can score the row too, the probabilities
+    match.
+    """
+    inputs = session.get_inputs()
+    if len(inputs) == 1:
+        width = inputs[0].shape[-1] if inputs[0].shape else None
+        if isinstance(width, int) and width != len(FEATURE_COLUMNS):
+            logger.warning(f"ONNX input expects {width} features, not {len(FEATURE_COLUMNS)}")
+            return False
+        sample = np.zeros((1, len(FEATURE_COLUMNS)), dtype=object)
+    else:
+        unknown = [inp.name for inp in inputs if inp.name not in _FEATURE_COLUMNS_SET]
+        if unknown:
+            logger.warning(f"ONNX inputs not in FEATURE_COLUMNS: {unknown}")
+            return False
+        sample = np.zeros((1, len(FEATURE_COLUMNS)), dtype=object)
+        for inp in inputs:
+            if inp.type == "tensor(string)":
+                sample[0, FEATURE_COLUMNS.index(inp.name)] = ""
+
+    try:
+        probabilities = _onnx_predict_proba(session, sample)
+    except Exception as e:
+        logger.warning(f"ONNX model failed on a sample row: {e}")
+        return False
+
+    n_classes = len(getattr(loaded_model, "classes_", ())) or probabilities.shape[-1]
+    if probabilities.shape != (1, n_classes):
+        logger.warning(f"ONNX output shape {probabilities.shape}, expected (1, {n_classes})")
+        return False
+
+    if _HAS_PROBA:
+        features = sample if _ACCEPTS_ARRAY else pd.DataFrame(sample, columns=FEATURE_COLUMNS)
+        try:
+            expected = _PREDICT_FN(features)
+        except Exception:
+            # The placeholder row isn't valid sklearn input; shape checks stand
+            return True
+        if not np.allclose(probabilities, expected, atol=1e-3):
+            logger.warning("ONNX probabilities differ from the sklearn model on a sample row")
+            return False
+
+    return True
+
+
+def _onnx_predict_proba(session: Any, matrix: np.ndarray) -> np.ndarray:
+    """Score an (n, F) matrix in FEATURE_COLUMNS order with an ONNX session."""
+    inputs = session.get_inputs()
+    if len(inputs) == 1:
+        # Single tensor input: the whole feature matrix
+        dtype = _ONNX_INPUT_DTYPES.get(inputs[0].type, np.float32)
+        feeds = {inputs[0].name: np.asarray(matrix, dtype=dtype)}
+    else:
+        # One input per feature column (converted preprocessing pipelines)
+        feeds = {
+            inp.name: np.asarray(
+                matrix[:, FEATURE_COLUMNS.index(inp.name)],
+                dtype=_ONNX_INPUT_DTYPES.get(inp.type, np.float32),
+            ).reshape(-1, 1)
+            for inp in inputs
+        }
+
+    # skl2onnx classifiers emit [label, probabilities]
+    probabilities = session.run(None, feeds)[-1]
+    if isinstance(probabilities, list):
+        # ZipMap output: one {class: probability} dict per row
+        probabilities = np.array([[row[k] for k in sorted(row)] for row in probabilities])
+    return np.asarray(probabilities, dtype=np.float64)
+
+
+def _apply_expected_dtypes(features: pd.DataFrame) -> tuple[pd.DataFrame, bool]:
+    """Cast columns to the model signature's dtypes one column at a time.
+
+    Columns that don't convert (e.g. nulls in an integer column) keep their
+    current dtype, and bool columns are only cast when every value is a
+    boolean, since astype(bool) would turn None into False. Returns the frame
+    and whether every signature column was cast.
+    """
+    cast = {}
+    complete = True
+    for col, dtype in _EXPECTED_DTYPES.items():
+        column = features[col]
+        if column.dtype == dtype:
+            continue
+        if pd.api.types.is_bool_dtype(dtype) and not column.isin([True, False]).all():
+            complete = False
+            continue
+        try:
+            cast[col] = column.astype(dtype)
+        except (TypeError, ValueError):
+            complete = False
+
+    if cast:
+        features = pd.DataFrame(
+            {col: cast.get(col, features[col]) for col in features.columns},
+            index=features.index,
+            copy=False,
+        )
+    return features, complete
+
+
+def _predict_proba(features: Any) -> np.ndarray:
+    """Score features with the ONNX session if loaded, else the sklearn model."""
+    if _SESSION is not None:
+        matrix = features.to_numpy() if isinstance(features, pd.DataFrame) else features
+        return _onnx_predict_proba(_SESSION, matrix)
+    return _PREDICT_FN(features)
+
+
+class _MicroBatcher:
+    """Coalesce concurrent run() calls into a single model invocation.
+
+    A background thread collects pending requests for up to window_s
+    seconds (or max_rows rows), scores the combined batch once, and hands
+    each caller back its slice of the probabilities. Only requests with
+    matching dtypes are combined, and if a combined call fails each request
+    is retried alone so errors reach only the caller that caused them.
+    """
+
+    def __init__(self, predict_fn: Any, window_s: float, max_rows: int) -> None:
+        self._predict_fn = predict_fn
+        self._window_s = window_s
+        self._max_rows = max_rows
+        self._queue: queue.Queue = queue.Queue()
+        threading.Thread(target=self._worker, daemon=True).start()
+
+    def submit(self, features: Any) -> np.ndarray:
+        """Queue features for the next batch and wait for their probabilities."""
+        pending = {"features": features, "done": threading.Event()}
+        self._queue.put(pending)
+        pending["done"].wait()
+        if "error" in pending:
+            raise pending["error"]
+        return pending["result"]
+
+    def _worker(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            rows = len(batch[0]["features"])
+            deadline = time.monotonic() + self._window_s
+            while rows < self._max_rows:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    pending = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                batch.append(pending)
+                rows += len(pending["features"])
+            self._score(batch)
+
+    def _score(self, batch: list[dict]) -> None:
+        try:
+            # Only coalesce requests whose columns share dtypes: concatenating
+            # mismatched frames would upcast the whole batch to object
+            groups: dict[Any, list[dict]] = {}
+            for pending in batch:
+                groups.setdefault(self._batch_key(pending["features"]), []).append(pending)
+            for group in groups.values():
+                self._score_group(group)
+        finally:
+            for pending in batch:
+                pending["done"].set()
+
+    @staticmethod
+    def _batch_key(features: Any) -> Any:
+        if isinstance(features, pd.DataFrame):
+            return tuple(features.columns), tuple(features.dtypes)
+        return features.dtype, features.shape[1:]
+
+    def _score_group(self, group: list[dict]) -> None:
+        if len(group) > 1:
+            parts = [pending["features"] for pending in group]
+            try:
+                if isinstance(parts[0], pd.DataFrame):
+                    combined = pd.concat(parts, ignore_index=True)
+                else:
+                    combined = np.concatenate(parts)
+                probabilities = self._predict_fn(combined)
+            except Exception:
+                # Fall through to scoring each request on its own, so one
+                # malformed request only fails its own caller
+                pass
+            else:
+                offset = 0
+                for pending in group:
+                    n = len(pending["features"])
+                    pending["result"] = probabilities[offset:offset + n]
+                    offset += n
+                return
+
+        for pending in group:
+            try:
+                pending["result"] = self._predict_fn(pending["features"])
+            except Exception as e:
+                pending["error"] = e
+
+
+def _prepare_model(loaded_model: Any, explain: bool = False) -> None:
+    """Precompute request-invariant state for the loaded model.
+
+    Estimators fitted on plain arrays are fed ndarrays directly, skipping
+    DataFrame construction and per-column dtype inference on every request.
+    With explain set, tree models on raw features also get a cached
+    TreeSHAP explainer.
+    """
+    global _ACCEPTS_ARRAY, _EXPLAINER, _HAS_PROBA, _PREDICT_FN
+
+    _EXPLAINER = None
+    _HAS_PROBA = hasattr(loaded_model, "predict_proba")
+    _PREDICT_FN = loaded_model.predict_proba if _HAS_PROBA else loaded_model.predict
+
+    _ACCEPTS_ARRAY = hasattr(loaded_model, "n_features_in_") and not hasattr(
+        loaded_model, "feature_names_in_"
+    )
+    logger.info(f"Accepts positional arrays: {_ACCEPTS_ARRAY}")
+
+    # AutoML/sklearn pipelines keep importances on the final estimator
+    estimator = loaded_model[-1] if hasattr(loaded_model, "steps") else loaded_model
+    importances = getattr(estimator, "feature_importances_", None)
+    if importances is None or len(importances) != len(FEATURE_COLUMNS):
+        logger.info("Feature importances unavailable for raw input features")
+        return
+
+    ranked = np.argsort(-np.asarray(importances))[:TOP_FEATURE_COUNT]
+    logger.info(f"Top features: {[FEATURE_COLUMNS[index] for index in ranked]}")
+
+    # TreeSHAP needs the tree model itself, not a preprocessing pipeline
+    if explain and not hasattr(loaded_model, "steps"):
+        try:
+            import shap
+            _EXPLAINER = shap.TreeExplainer(loaded_model)
+            logger.info("TreeSHAP explainer initialized")
+        except Exception as e:
+            logger.warning(f"TreeSHAP unavailable, predictions will omit feature importances: {e}")
+
+
+def explain_predictions(features: Any) -> list[list[dict]] | None:
+    """Rank the top contributing features for every row in the batch.
+
+    Uses one TreeSHAP call for the whole batch. Returns None when no
+    explainer is available or it fails: global importances carry no
+    per-row direction, so they can't fill the contract's FeatureImportance.
+    """
+    if _EXPLAINER is None:
+        return None
+
+    matrix = features.to_numpy() if isinstance(features, pd.DataFrame) else features
+    try:
+        values = _EXPLAINER.shap_values(np.asarray(matrix, dtype=float), check_additivity=False)
+        # Binary classifiers return per-class attributions; keep the no-show class
+        if isinstance(values, list):
+            values = values[-1]
+        elif values.ndim == 3:
+            values = values[:, :, -1]
+        # Report each feature's share of the row's total attribution, so
+        # importances are relative (0.0-1.0) whatever the model's output units
+        magnitudes = np.abs(values)
+        totals = magnitudes.sum(axis=1, keepdims=True)
+        shares = np.divide(
+            magnitudes, totals, out=np.zeros_like(magnitudes), where=totals > 0
+        )
+        top = np.argsort(-magnitudes, axis=1)[:, :TOP_FEATURE_COUNT]
+        return [
+            [
+                {
+                    "feature": FEATURE_COLUMNS[j],
+                    "importance": round(float(shares[i, j]), 3),
+                    "direction": "Increases" if values[i, j] > 0 else "Decreases",
+                    "value": matrix[i, j],
+                }
+                for j in top[i]
+            ]
+            for i in range(len(top))
+        ]
+    except Exception as e:
+        logger.warning(f"TreeSHAP failed, omitting feature importances: {e}")
+        return None
+
+
+def _rows_to_array(rows: list[list], columns: list[str]) -> np.ndarray:
+    """Arrange positional rows into an (n, F) object array in FEATURE_COLUMNS order."""
+    source = np.array(rows, dtype=object).reshape(len(rows), len(columns))
+    if list(columns) == FEATURE_COLUMNS:
+        return source
+
+    arr = np.full((len(rows), len(FEATURE_COLUMNS)), None, dtype=object)
+    for i, col in enumerate(FEATURE_COLUMNS):
+        if col in columns:
+            arr[:, i] = source[:, columns.index(col)]
+    return arr
+
+
+def _records_to_array(records: list[dict]) -> np.ndarray:
+    """Fill an (n, F) object array column-by-column from appointment dicts."""
+    arr = np.empty((len(records), len(FEATURE_COLUMNS)), dtype=object)
+    for i, col in enumerate(FEATURE_COLUMNS):
+        arr[:, i] = [record.get(col) for record in records]
+    return arr
+
+
+def calculate_risk_levels(probabilities: np.ndarray) -> np.ndarray:
+    """Calculate risk levels for a vector of probabilities.
 
     Thresholds from data-model.md:
     - Low: < 0.3
     - Medium: 0.3-0.6
     - High: > 0.6
     """
-    if probability < 0.3:
-        return "Low"
-    elif probability <= 0.6:
-        return "Medium"
-    else:
-        return "High"
+    return _RISK_LABELS[np.searchsorted(_RISK_THRESHOLDS, probabilities, side="right")]
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a response with orjson, passing numpy values through natively."""
+    return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
 
 
 def run(raw_data: str) -> str:
@@ -127,75 +559,118 @@ def run(raw_data: str) -> str:
     global model
 
     if model is None:
-        return json.dumps({"error": "Model not initialized"})
+        return _dumps({"error": "Model not initialized"})
 
     try:
-        data = json.loads(raw_data)
-        logger.info(f"Received request with keys: {list(data.keys())}")
+        data = orjson.loads(raw_data)
+        logger.debug(f"Received request with keys: {list(data.keys())}")
+
+        # Appointment IDs echoed back in the response (appointments format only)
+        appointment_ids = None
+        # Callers sending FEATURE_COLUMNS in training order skip realignment
+        columns_match = False
 
         # Parse input based on format
-        if "input_data" in data:
-            # MLflow dataframe_split format
-            input_data = data["input_data"]
+        input_data = data.get("input_data")
+        if input_data is not None:
+            # MLflow dataframe_split format (the agent's deployed contract)
             columns = input_data.get("columns", FEATURE_COLUMNS)
             rows = input_data.get("data", [])
-            df = pd.DataFrame(rows, columns=columns)
-            logger.info(f"Parsed dataframe_split format: {len(df)} rows, columns: {list(df.columns)}")
+            columns_match = list(columns) == FEATURE_COLUMNS
+            if _ACCEPTS_ARRAY:
+                features = _rows_to_array(rows, columns)
+            elif columns_match and len(_EXPECTED_DTYPES) == len(FEATURE_COLUMNS):
+                # Known column order and dtypes: wrap the row matrix without
+                # per-column inference, but only keep it if every signature
+                # cast succeeds; otherwise let pandas infer as usual
+                features, complete = _apply_expected_dtypes(
+                    pd.DataFrame(
+                        _rows_to_array(rows, columns), columns=FEATURE_COLUMNS, copy=False
+                    )
+                )
+                if not complete:
+                    features = pd.DataFrame(rows, columns=columns)
+            else:
+                features = pd.DataFrame(rows, columns=columns)
+            logger.info(f"Parsed dataframe_split format: {len(rows)} rows")
+            logger.debug(f"dataframe_split columns: {list(columns)}")
         elif "appointments" in data:
-            # Custom appointments format
+            # Custom appointments format: build one matrix for the whole
+            # batch so the model is invoked once rather than per appointment
             appointments = data["appointments"]
-            df = pd.DataFrame(appointments)
-            # Remove appointment_id if present
-            if "appointment_id" in df.columns:
-                df = df.drop(columns=["appointment_id"])
-            logger.info(f"Parsed appointments format: {len(df)} rows")
+            if _ACCEPTS_ARRAY:
+                features = _records_to_array(appointments)
+                if any("appointment_id" in appt for appt in appointments):
+                    appointment_ids = [appt.get("appointment_id") for appt in appointments]
+            else:
+                features = pd.DataFrame(appointments)
+                # Remove appointment_id in place if present, keeping it for the response
+                if "appointment_id" in features.columns:
+                    appointment_ids = features.pop("appointment_id").tolist()
+            logger.info(f"Parsed appointments format: {len(appointments)} rows")
         else:
-            return json.dumps({"error": f"Unknown input format. Keys: {list(data.keys())}"})
+            return _dumps({"error": f"Unknown input format. Keys: {list(data.keys())}"})
+
+        if isinstance(features, pd.DataFrame) and not columns_match:
+            # Ensure all required columns are present
+            missing_cols = _FEATURE_COLUMNS_SET.difference(features.columns)
+            if missing_cols:
+                logger.warning(f"Missing columns: {missing_cols}")
+                # Add missing columns with defaults
+                for col in missing_cols:
+                    features[col] = None
 
-        # Ensure all required columns are present
-        missing_cols = set(FEATURE_COLUMNS) - set(df.columns)
-        if missing_cols:
-            logger.warning(f"Missing columns: {missing_cols}")
-            # Add missing columns with defaults
-            for col in missing_cols:
-                df[col] = None
+            # Reorder columns to match training order
+            features = features[FEATURE_COLUMNS]
 
-        # Reorder columns to match training order
-        df = df[FEATURE_COLUMNS]
+        if isinstance(features, pd.DataFrame) and _EXPECTED_DTYPES:
+            features, complete = _apply_expected_dtypes(features)
+            if not complete:
+                logger.warning("Some columns could not be cast to their expected dtypes")
 
         # Get predictions with probabilities
-        if hasattr(model, "predict_proba"):
-            probabilities = model.predict_proba(df)
+        if _SESSION is not None or _HAS_PROBA:
+            if _BATCHER is not None:
+                probabilities = _BATCHER.submit(features)
+            else:
+                probabilities = _predict_proba(features)
             # probabilities is shape (n_samples, n_classes)
             # For binary classification, column 1 is the no-show probability
             if probabilities.shape[1] > 1:
-                no_show_probs = probabilities[:, 1].tolist()
+                no_show_probs = probabilities[:, 1]
             else:
-                no_show_probs = probabilities[:, 0].tolist()
+                no_show_probs = probabilities[:, 0]
             logger.info(f"Using predict_proba, got {len(no_show_probs)} probabilities")
         else:
             # Fallback to binary predictions
-            predictions = model.predict(df)
-            no_show_probs = [1.0 if p == 1 else 0.0 for p in predictions]
+            predictions = _PREDICT_FN(features)
+            no_show_probs = (np.asarray(predictions) == 1).astype(float)
             logger.warning("Model does not support predict_proba, using binary predictions")
 
-        # Build response with probabilities
-        result = {
-            "predictions": [
-                {
-                    "no_show_probability": round(float(prob), 3),
-                    "risk_level": calculate_risk_level(prob)
-                }
-                for prob in no_show_probs
-            ]
-        }
+        # Build response with probabilities in a single pass over the batch
+        n = len(no_show_probs)
+        rounded_probs = np.round(no_show_probs, 3).tolist()
+        risk_levels = calculate_risk_levels(no_show_probs).tolist()
+        explanations = explain_predictions(features)
+        predictions = [None] * n
+        for i in range(n):
+            prediction = {
+                "no_show_probability": rounded_probs[i],
+                "risk_level": risk_levels[i],
+            }
+            if explanations is not None:
+                prediction["feature_importances"] = explanations[i]
+            if appointment_ids is not None:
+                prediction["appointment_id"] = appointment_ids[i]
+            predictions[i] = prediction
+        result = {"predictions": predictions}
 
         logger.info(f"Returning {len(result['predictions'])} predictions")
-        return json.dumps(result)
+        return _dumps(result)
 
     except Exception as e:
         logger.error(f"Prediction error: {str(e)}", exc_info=True)
-        return json.dumps({"error": str(e)})
+        return _dumps({"error": str(e)})
 
 
 # For local testing
@@ -238,11 +713,12 @@ if __name__ == "__main__":
         X[col] = X[col].astype('category').cat.codes
     
     model.fit(X, y)
+    _prepare_model(model)
     print(f"Mock model trained: {type(model).__name__}")
     print(f"Has predict_proba: {hasattr(model, 'predict_proba')}")
     
     # Test with dataframe_split format
-    test_input = json.dumps({
+    test_input = orjson.dumps({
         "input_data": {
             "columns": FEATURE_COLUMNS,
             "data": [
@@ -254,8 +730,8 @@ if __name__ == "__main__":
                  "Internal Medicine", "Office", "Madison"]
             ]
         }
-    })
+    }).decode()
     
     result = run(test_input)
     print("\nTest result:")
-    print(json.dumps(json.loads(result), indent=2))
+    print(orjson.dumps(orjson.loads(result), option=orjson.OPT_INDENT_2).decode())
@@ -12,13 +12,18 @@ Data volumes (from spec):
 """
 
 import random
-from dataclasses import asdict
+from dataclasses import fields
 from datetime import date, datetime, timedelta, timezone
+from enum import Enum
+from functools import lru_cache
+from itertools import accumulate
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator, NamedTuple, get_args, get_type_hints
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from faker import Faker
 
 from .schema import (
@@ -42,6 +47,7 @@ fake = Faker()
 Faker.seed(42)
 np.random.seed(42)
 random.seed(42)
+rng = np.random.default_rng(42)
 
 
 # =============================================================================
@@ -97,6 +103,24 @@ JOURNEY_TYPE_WEIGHTS = {
     "care_abandonment": 0.05,
 }
 
+# Appointments per patient per pass (inclusive range) by journey type
+JOURNEY_VISIT_RANGES = {
+    "routine_care": (2, 6),
+    "chronic_management": (6, 24),
+    "episodic": (1, 4),
+    "referral_chain": (3, 8),
+    "care_abandonment": (3, 6),
+}
+
+# Days between consecutive appointments within a pass (inclusive range) by journey type
+JOURNEY_INTERVAL_RANGES = {
+    "routine_care": (7, 180),
+    "chronic_management": (21, 90),  # Monthly to quarterly
+    "episodic": (7, 180),
+    "referral_chain": (7, 180),
+    "care_abandonment": (14, 45),
+}
+
 # No-show base rate calibrated to achieve ~20-22% overall rate
 # after applying feature-based modifiers matching Kaggle real-world patterns
 # Note: Lead time is the dominant factor - most appointments are 7-30 days out
@@ -151,6 +175,20 @@ APPOINTMENT_TYPES = {
     ],
 }
 
+# Dense appointment type IDs, one per distinct type name
+APPOINTMENT_TYPE_IDS = {
+    name: type_id
+    for type_id, name in enumerate(
+        dict.fromkeys(name for types in APPOINTMENT_TYPES.values() for name, _ in types),
+        start=1,
+    )
+}
+
+# Appointment type names per category, indexed by uniform draws in the planner
+_PRIMARY_CARE_TYPES = tuple(name for name, _ in APPOINTMENT_TYPES["primary_care"])
+_SPECIALTY_TYPES = tuple(name for name, _ in APPOINTMENT_TYPES["specialty"])
+_TELEHEALTH_TYPES = tuple(name for name, _ in APPOINTMENT_TYPES["telehealth"])
+
 # Insurance companies by payer group
 INSURANCE_COMPANIES = {
     PayerGrouping.COMMERCIAL: [
@@ -178,23 +216,57 @@ INSURANCE_COMPANIES = {
 # Market regions for departments
 MARKETS = ["Region A", "Region B", "Region C", "Region D"]
 
+# Faker value pool sizes (sampled with replacement instead of per-row Faker calls)
+EMAIL_POOL_SIZE = 10_000
+NAME_POOL_SIZE = 2_000
+
 
 # =============================================================================
 # Weighted Random Selection Helpers
 # =============================================================================
 
 
-def weighted_choice(options: dict) -> Any:
-    """Select an option based on weighted probabilities."""
+def weighted_table(options: dict) -> tuple[list, list[float]]:
+    """Precompute (items, cumulative weights) for repeated weighted_choice calls."""
+    return list(options.keys()), list(accumulate(options.values()))
+
+
+def weighted_choice(table: tuple[list, list[float]]) -> Any:
+    """Select an option from a weighted_table based on weighted probabilities."""
+    items, cum_weights = table
+    return random.choices(items, cum_weights=cum_weights, k=1)[0]
+
+
+# Weight tables built once at import instead of on every draw
+_PAYER_TABLE = weighted_table(PAYER_WEIGHTS)
+_JOURNEY_TYPE_TABLE = weighted_table(JOURNEY_TYPE_WEIGHTS)
+
+
+def weighted_choices(options: dict, size: int, generator: Any = np.random) -> list:
+    """Select `size` options at once based on weighted probabilities."""
     items = list(options.keys())
-    weights = list(options.values())
-    return random.choices(items, weights=weights, k=1)[0]
+    weights = np.fromiter(options.values(), dtype=float)
+    indices = generator.choice(len(items), size=size, p=weights / weights.sum())
+    return [items[i] for i in indices]
+
+
+def gamma_lead_times(n: int, generator: Any = np.random) -> np.ndarray:
+    """Generate n lead times using gamma distribution, clipped 0-90 days."""
+    values = generator.gamma(shape=2, scale=7, size=n)
+    return np.clip(values, 0, 90).astype(np.int32)
+
+
+@lru_cache(maxsize=None)
+def faker_pool(method: str, size: int) -> np.ndarray:
+    """Build (once) a pool of Faker values, e.g. faker_pool("email", 10_000)."""
+    generate = getattr(fake, method)
+    return np.array([generate() for _ in range(size)], dtype=object)
 
 
-def gamma_lead_time() -> int:
-    """Generate lead time using gamma distribution, clipped 0-90 days."""
-    value = np.random.gamma(shape=2, scale=7)
-    return int(np.clip(value, 0, 90))
+def sample_faker(method: str, pool_size: int, count: int) -> np.ndarray:
+    """Draw count Faker values from a shared pool instead of calling Faker per row."""
+    pool = faker_pool(method, pool_size)
+    return pool[np.random.randint(0, pool_size, size=count)]
 
 
 # =============================================================================
@@ -203,53 +275,60 @@ def gamma_lead_time() -> int:
 
 
 def generate_patients(count: int = 5000) -> list[Patient]:
-    """Generate synthetic patient records with realistic distributions."""
+    """Generate synthetic patient records with realistic distributions.
+
+    Attributes are sampled for all patients at once with NumPy; the
+    Patient records are assembled from those columns afterwards.
+    """
     patients = []
 
     # Pre-generate zip codes from diverse regions
     zip_codes = [
-        str(random.randint(10001, 99999)).zfill(5)
-        for _ in range(100)
+        str(zip_code).zfill(5)
+        for zip_code in np.random.randint(10001, 100000, size=100)
     ]
 
-    race_ethnicity_options = [
-        "White",
-        "Black or African American",
-        "Hispanic or Latino",
-        "Asian",
-        "American Indian",
-        "Native Hawaiian",
-        "Two or More Races",
-        "Other",
-        None,  # Unknown/declined
-    ]
-    race_weights = [0.60, 0.13, 0.12, 0.06, 0.01, 0.01, 0.03, 0.02, 0.02]
-
-    for patient_id in range(1, count + 1):
-        gender = weighted_choice(GENDER_WEIGHTS)
-        age_bucket = weighted_choice(AGE_BUCKET_WEIGHTS)
-
-        # Generate portal engagement (70% have portal access, 50% of those are active)
-        has_portal = random.random() < 0.70
-        portal_login = None
-        if has_portal:
-            # Active users logged in recently, inactive users longer ago
-            if random.random() < 0.50:
-                days_ago = random.randint(1, 60)  # Active
-            else:
-                days_ago = random.randint(91, 365)  # Inactive
-            portal_login = datetime.now(timezone.utc) - timedelta(days=days_ago)
+    race_ethnicity_weights = {
+        "White": 0.60,
+        "Black or African American": 0.13,
+        "Hispanic or Latino": 0.12,
+        "Asian": 0.06,
+        "American Indian": 0.01,
+        "Native Hawaiian": 0.01,
+        "Two or More Races": 0.03,
+        "Other": 0.02,
+        None: 0.02,  # Unknown/declined
+    }
 
+    genders = weighted_choices(GENDER_WEIGHTS, count)
+    age_buckets = weighted_choices(AGE_BUCKET_WEIGHTS, count)
+    races = weighted_choices(race_ethnicity_weights, count)
+    has_email = np.random.random(count) < 0.80
+    emails = sample_faker("email", EMAIL_POOL_SIZE, count)
+    zip_indices = np.random.randint(0, len(zip_codes), size=count)
+
+    # Generate portal engagement (70% have portal access, 50% of those are active)
+    has_portal = np.random.random(count) < 0.70
+    # Active users logged in recently, inactive users longer ago
+    days_ago = np.where(
+        np.random.random(count) < 0.50,
+        np.random.randint(1, 61, size=count),  # Active
+        np.random.randint(91, 366, size=count),  # Inactive
+    )
+    now = datetime.now(timezone.utc)
+
+    for i in range(count):
+        patient_id = i + 1
         patient = Patient(
             patientid=patient_id,
             enterpriseid=1000000 + patient_id,
-            patient_gender=gender,
-            patient_age_bucket=age_bucket,
-            patient_race_ethnicity=random.choices(race_ethnicity_options, weights=race_weights)[0],
-            patient_email=fake.email() if random.random() < 0.80 else None,
-            patient_zip_code=random.choice(zip_codes),
-            portal_enterpriseid=patient_id if has_portal else None,
-            portal_last_login=portal_login,
+            patient_gender=genders[i],
+            patient_age_bucket=age_buckets[i],
+            patient_race_ethnicity=races[i],
+            patient_email=emails[i] if has_email[i] else None,
+            patient_zip_code=zip_codes[zip_indices[i]],
+            portal_enterpriseid=patient_id if has_portal[i] else None,
+            portal_last_login=now - timedelta(days=int(days_ago[i])) if has_portal[i] else None,
             historical_no_show_count=0,
             historical_no_show_rate=0.0,
         )
@@ -269,15 +348,19 @@ def generate_providers(count: int = 100) -> list[Provider]:
         ProviderType.PHYSICIAN_ASSISTANT: 0.15,
     }
 
+    provider_type_table = weighted_table(provider_type_weights)
+
     affiliations = ["Employed", "Affiliated", "Locum Tenens"]
 
-    for provider_id in range(1, count + 1):
-        provider_type = weighted_choice(provider_type_weights)
-        specialty = random.choice(SPECIALTIES)
+    # Use pooled Faker names
+    first_names = sample_faker("first_name", NAME_POOL_SIZE, count)
+    last_names = sample_faker("last_name", NAME_POOL_SIZE, count)
 
-        # Use Faker for names
-        first_name = fake.first_name()
-        last_name = fake.last_name()
+    for i, provider_id in enumerate(range(1, count + 1)):
+        provider_type = weighted_choice(provider_type_table)
+        specialty = random.choice(SPECIALTIES)
+        first_name = first_names[i]
+        last_name = last_names[i]
 
         provider = Provider(
             providerid=provider_id,
@@ -340,7 +423,7 @@ def generate_insurance(patients: list[Patient]) -> list[Insurance]:
     insurance_records = []
 
     for patient in patients:
-        payer_group = weighted_choice(PAYER_WEIGHTS)
+        payer_group = weighted_choice(_PAYER_TABLE)
         company = random.choice(INSURANCE_COMPANIES[payer_group])
 
         insurance = Insurance(
@@ -360,20 +443,61 @@ def generate_insurance(patients: list[Patient]) -> list[Insurance]:
 # No-Show Probability Calculation
 # =============================================================================
 
+# Lead time modifiers indexed by lead_time_days clipped to 0-31
+# Real data shows: same-day ~7%, 1-7d ~25%, 8-14d ~31%, 15-30d ~33%, 30d+ ~33%
+_LEAD_TIME_MODIFIERS = np.repeat(
+    [-0.12, -0.06, 0.04, 0.10, 0.14, 0.16],  # same-day, 1-3d, 4-7d, 8-14d, 15-30d, 31d+
+    [1, 3, 4, 7, 16, 1],
+)
 
-def calculate_no_show_probability(
-    patient: Patient,
-    appointment_date: date,
-    lead_time_days: int,
-    hour_of_day: int,
-    day_of_week: int,
-    virtual_flag: VirtualFlag,
-    new_patient_flag: NewPatientFlag,
-    payer_group: PayerGrouping,
-    web_scheduled: bool,
-    journey_stage: str,
-) -> float:
-    """Calculate no-show probability based on evidence-based factors.
+# Age modifiers indexed by AgeBucket.code
+# Real data: 0-18 (22.5%), 18-40 (23.2%), 40-65 (17.9%), 65+ (15.5%)
+_AGE_MODIFIERS = np.array([
+    0.03,   # Pediatric: parents forget
+    0.04,   # Young adults: highest no-show
+    -0.02,  # Middle-aged: more reliable
+    -0.05,  # Seniors: most reliable
+])
+
+# Payer modifiers indexed by PayerGrouping.code
+_PAYER_MODIFIERS = np.array([
+    0.0,    # Commercial
+    -0.03,  # Medicare: seniors, more reliable
+    0.06,   # Medicaid
+    0.08,   # Self-pay: highest risk
+])
+
+# Day-of-week modifiers (Monday=0); Monday and Friday have higher no-shows
+_DAY_OF_WEEK_MODIFIERS = np.array([0.03, 0.0, 0.0, 0.0, 0.02, 0.0, 0.0])
+
+# Hour-of-day modifiers: early morning = committed, afternoon slump
+_HOUR_MODIFIERS = np.zeros(24)
+_HOUR_MODIFIERS[7:10] = -0.03
+_HOUR_MODIFIERS[14:17] = 0.02
+
+# Virtual flag modifiers indexed by VirtualFlag.code (virtual is easier to attend)
+_VIRTUAL_FLAG_MODIFIERS = np.array([
+    0.0,    # Non-virtual
+    -0.05,  # Video
+    -0.03,  # Telephone
+])
+
+
+def calculate_no_show_probability_batch(
+    lead_time_days: np.ndarray,
+    age_codes: np.ndarray,
+    payer_codes: np.ndarray,
+    day_of_week: np.ndarray,
+    hour_of_day: np.ndarray,
+    is_new_patient: np.ndarray,
+    virtual_codes: np.ndarray,
+    portal_engaged: np.ndarray,
+    web_scheduled: np.ndarray,
+    months: np.ndarray,
+    days: np.ndarray,
+    escalating: np.ndarray,
+) -> np.ndarray:
+    """Calculate base no-show probabilities for a batch of appointments.
 
     Calibrated against Kaggle Medical Appointment No-Shows dataset patterns:
     - Lead time is strongest predictor (corr +0.19 in real data)
@@ -385,135 +509,163 @@ def calculate_no_show_probability(
     - lead_time_days: +0.15 to +0.20
     - age: -0.05 to -0.07
     - historical_no_show_rate: +0.10 to +0.15
+
+    Patient history depends on the outcomes of earlier appointments, so it is
+    applied while rolling outcomes by `apply_no_show_history`, which also
+    clamps the result. The values returned here are unclamped.
+
+    Every factor is a table gather or a flag times its weight, accumulated
+    in place into one output array.
     """
-    probability = BASE_NO_SHOW_RATE  # 0.18
+    probability = np.full(len(lead_time_days), BASE_NO_SHOW_RATE)
 
     # ==========================================================================
     # LEAD TIME - Strongest predictor (Kaggle: corr +0.186)
-    # Real data shows: same-day ~7%, 1-7d ~25%, 8-14d ~31%, 15-30d ~33%, 30d+ ~33%
     # ==========================================================================
-    if lead_time_days <= 0:
-        probability -= 0.12  # Same-day appointments have very low no-show
-    elif lead_time_days <= 3:
-        probability -= 0.06  # Short lead time = lower no-show
-    elif lead_time_days <= 7:
-        probability += 0.04  # ~1 week out
-    elif lead_time_days <= 14:
-        probability += 0.10  # ~2 weeks out
-    elif lead_time_days <= 30:
-        probability += 0.14  # ~1 month out
-    else:
-        probability += 0.16  # 30+ days - highest risk
+    probability += _LEAD_TIME_MODIFIERS[np.clip(lead_time_days, 0, len(_LEAD_TIME_MODIFIERS) - 1)]
 
     # ==========================================================================
     # AGE - Moderate predictor (Kaggle: corr -0.060)
-    # Real data: 0-18 (22.5%), 18-40 (23.2%), 40-65 (17.9%), 65+ (15.5%)
     # ==========================================================================
-    if patient.patient_age_bucket == AgeBucket.PEDIATRIC:
-        probability += 0.03  # Kids: parents forget
-    elif patient.patient_age_bucket == AgeBucket.YOUNG_ADULT:
-        probability += 0.04  # Young adults: highest no-show
-    elif patient.patient_age_bucket == AgeBucket.MIDDLE_AGED:
-        probability -= 0.02  # Middle-aged: more reliable
-    elif patient.patient_age_bucket == AgeBucket.SENIOR:
-        probability -= 0.05  # Seniors: most reliable
-
-    # ==========================================================================
-    # PATIENT HISTORY - Strong predictor when available
-    # ==========================================================================
-    if patient.historical_no_show_count > 0:
-        # Scale impact by historical rate, capped to avoid runaway values
-        history_impact = min(0.20, patient.historical_no_show_rate * 0.5)
-        probability += history_impact
-    elif patient.historical_no_show_count == 0 and hasattr(patient, '_has_history') and patient._has_history:
-        # Perfect attendance bonus
-        probability -= 0.08
+    probability += _AGE_MODIFIERS[age_codes]
 
     # ==========================================================================
     # PAYER TYPE - Moderate predictor
     # ==========================================================================
-    if payer_group == PayerGrouping.MEDICAID:
-        probability += 0.06
-    elif payer_group == PayerGrouping.SELF_PAY:
-        probability += 0.08  # Highest risk
-    elif payer_group == PayerGrouping.MEDICARE:
-        probability -= 0.03  # Seniors, more reliable
+    probability += _PAYER_MODIFIERS[payer_codes]
 
     # ==========================================================================
     # DAY OF WEEK - Minor predictor
     # Monday=0, Friday=4 tend to have higher no-shows
     # ==========================================================================
-    if day_of_week == 0:  # Monday
-        probability += 0.03
-    elif day_of_week == 4:  # Friday
-        probability += 0.02
+    probability += _DAY_OF_WEEK_MODIFIERS[day_of_week]
 
     # ==========================================================================
     # TIME OF DAY - Minor predictor
     # ==========================================================================
-    if 14 <= hour_of_day <= 16:
-        probability += 0.02  # Afternoon slump
-    elif 7 <= hour_of_day <= 9:
-        probability -= 0.03  # Early morning = committed
+    probability += _HOUR_MODIFIERS[hour_of_day]
 
     # ==========================================================================
     # APPOINTMENT TYPE FACTORS
     # ==========================================================================
     # New patient
-    if new_patient_flag == NewPatientFlag.NEW_PATIENT:
-        probability += 0.04
+    probability += is_new_patient * 0.04
 
     # Virtual appointments (lower no-show - easier to attend)
-    if virtual_flag == VirtualFlag.VIRTUAL_VIDEO:
-        probability -= 0.05
-    elif virtual_flag == VirtualFlag.VIRTUAL_TELEPHONE:
-        probability -= 0.03
+    probability += _VIRTUAL_FLAG_MODIFIERS[virtual_codes]
 
     # Portal engagement (proxy for patient engagement)
-    if not patient.portal_engaged:
-        probability += 0.03
+    probability += ~portal_engaged * 0.03
 
     # Web scheduled (engaged patients)
-    if web_scheduled:
-        probability -= 0.02
+    probability += web_scheduled * -0.02
 
     # ==========================================================================
     # SEASONALITY
     # ==========================================================================
-    probability += _get_seasonality_modifier(appointment_date)
+    probability += _SEASONALITY_TABLE[months, days]
 
     # ==========================================================================
     # JOURNEY STAGE (care abandonment pattern)
     # ==========================================================================
-    if journey_stage == "care_abandonment_escalating":
-        probability += 0.20
+    probability += escalating * 0.20
+
+    return probability
+
+
+def apply_no_show_history(
+    base_probabilities: np.ndarray,
+    no_shows: np.ndarray,
+    prior_visits: np.ndarray,
+) -> np.ndarray:
+    """Add the patient-history factor to base probabilities and clamp them."""
+    # PATIENT HISTORY - Strong predictor when available
+    # Scale impact by historical rate, capped to avoid runaway values
+    history_impact = np.minimum(0.20, no_shows / np.maximum(1, prior_visits) * 0.5)
+    probabilities = base_probabilities + np.where(no_shows > 0, history_impact, 0.0)
 
     # Clamp to valid range
-    return max(0.03, min(0.85, probability))
+    return np.clip(probabilities, 0.03, 0.85)
+
+
+# Outcome codes returned by roll_appointment_outcomes
+OUTCOME_SCHEDULED, OUTCOME_NO_SHOW, OUTCOME_CANCELLED, OUTCOME_COMPLETE = range(4)
 
 
-def _get_seasonality_modifier(appointment_date: date) -> float:
-    """Calculate seasonality modifier for a given date."""
-    month = appointment_date.month
-    day = appointment_date.day
+def roll_appointment_outcomes(
+    base_probabilities: np.ndarray,
+    patient_index: np.ndarray,
+    visit_number: np.ndarray,
+    prior_visits: np.ndarray,
+    is_past: np.ndarray,
+    rolls: np.ndarray,
+    no_shows: np.ndarray,
+) -> np.ndarray:
+    """Roll outcomes for a batch of planned appointments.
+
+    A patient's no-show history depends on their earlier outcomes, so the
+    batch is processed in waves: wave k holds the k-th planned visit of every
+    patient and is rolled with one set of vector operations. `no_shows` is
+    indexed by `patient_index` and updated in place.
+
+    Returns an int8 array of OUTCOME_* codes; future appointments stay
+    OUTCOME_SCHEDULED.
+    """
+    outcomes = np.full(len(base_probabilities), OUTCOME_SCHEDULED, dtype=np.int8)
+    past_rows = np.flatnonzero(is_past)
+    past_rows = past_rows[np.argsort(visit_number[past_rows], kind="stable")]
+    wave_ends = np.cumsum(np.bincount(visit_number[past_rows]))
+
+    for wave in np.split(past_rows, wave_ends[:-1]):
+        patients_in_wave = patient_index[wave]
+        probabilities = apply_no_show_history(
+            base_probabilities[wave], no_shows[patients_in_wave], prior_visits[wave]
+        )
+        roll = rolls[wave]
+        wave_outcomes = np.where(
+            roll < probabilities,
+            OUTCOME_NO_SHOW,
+            np.where(roll < probabilities + 0.10, OUTCOME_CANCELLED, OUTCOME_COMPLETE),
+        )
+        outcomes[wave] = wave_outcomes
+        no_shows[patients_in_wave] += wave_outcomes == OUTCOME_NO_SHOW
+
+    return outcomes
+
+
+def _build_seasonality_table() -> np.ndarray:
+    """Tabulate seasonality modifiers by (month, day).
+
+    The first matching season in SEASONALITY_MODIFIERS wins. Indexing the
+    table with month and day arrays replaces per-appointment range checks.
+    """
+    months, days = np.meshgrid(np.arange(13), np.arange(32), indexing="ij")
+    table = np.zeros(months.shape)
+    unmatched = np.ones(months.shape, dtype=bool)
 
     for season, config in SEASONALITY_MODIFIERS.items():
         start_month, start_day = config["start"]
         end_month, end_day = config["end"]
-        modifier = config["modifier"]
 
         # Handle year-wrap (e.g., Dec 20 - Jan 5)
         if start_month > end_month:
-            if month >= start_month and day >= start_day:
-                return modifier
-            if month <= end_month and day <= end_day:
-                return modifier
+            in_season = ((months >= start_month) & (days >= start_day)) | ((months <= end_month) & (days <= end_day))
         else:
-            if start_month <= month <= end_month:
-                if (month > start_month or day >= start_day) and (month < end_month or day <= end_day):
-                    return modifier
+            in_season = (
+                (months >= start_month)
+                & (months <= end_month)
+                & ((months > start_month) | (days >= start_day))
+                & ((months < end_month) | (days <= end_day))
+            )
 
-    return 0.0
+        in_season &= unmatched
+        table[in_season] = config["modifier"]
+        unmatched &= ~in_season
+
+    return table
+
+
+_SEASONALITY_TABLE = _build_seasonality_table()
 
 
 # =============================================================================
@@ -521,6 +673,29 @@ def _get_seasonality_modifier(appointment_date: date) -> float:
 # =============================================================================
 
 
+class _PlannedAppointment(NamedTuple):
+    """Appointment skeleton drawn before its outcome is rolled."""
+
+    appointmentid: int
+    patient: Patient
+    patient_index: int  # Position in the patients list
+    specialty_code: int  # Index into SPECIALTIES
+    appointment_day: int  # Days since 1970-01-01
+    hour: int
+    minute: int
+    duration: int
+    lead_time: int
+    appt_type_name: str
+    virtual_flag: VirtualFlag
+    new_patient_flag: NewPatientFlag
+    web_scheduled: bool
+    escalating: bool
+    parentappointmentid: int | None
+    is_referral: bool
+    prior_visits: int
+    visit_number: int
+
+
 def generate_appointments(
     patients: list[Patient],
     providers: list[Provider],
@@ -532,14 +707,44 @@ def generate_appointments(
 ) -> list[Appointment]:
     """Generate synthetic appointments with patient journey patterns.
 
+    Collects every chunk from `iter_appointment_chunks` into one list.
+    """
+    return [
+        appointment
+        for chunk in iter_appointment_chunks(
+            patients, providers, departments, insurance_records, count, start_date, end_date
+        )
+        for appointment in chunk
+    ]
+
+
+def iter_appointment_chunks(
+    patients: list[Patient],
+    providers: list[Provider],
+    departments: list[Department],
+    insurance_records: list[Insurance],
+    count: int = 100000,
+    start_date: date | None = None,
+    end_date: date | None = None,
+    chunk_size: int = 10_000,
+) -> Iterator[list[Appointment]]:
+    """Generate synthetic appointments with patient journey patterns, in chunks.
+
     Implements journey types from data-model.md:
     - Routine Care (40%): Annual wellness + PRN follow-ups
     - Chronic Management (25%): Monthly/quarterly visits
     - Episodic (20%): 1-3 visit episodes
     - Referral Chain (10%): PCP -> Specialist
     - Care Abandonment (5%): 2-4 appts -> no-shows -> dropout
+
+    Each pass first plans the appointment skeletons, scores them with one
+    call to `calculate_no_show_probability_batch`, then rolls outcomes with
+    `roll_appointment_outcomes` so patient history reflects earlier no-shows.
+
+    Appointments are yielded in lists of at most `chunk_size`. Patient
+    historical no-show statistics are set from running counters once the
+    last chunk has been consumed.
     """
-    appointments: list[Appointment] = []
 
     # Calculate date range (24 months history + 6 weeks future)
     if end_date is None:
@@ -547,130 +752,156 @@ def generate_appointments(
     if start_date is None:
         start_date = end_date - timedelta(days=730)  # 24 months
 
+    # Dates are planned as integer days since the Unix epoch (datetime64[D])
+    epoch = date(1970, 1, 1).toordinal()
+    start_day = start_date.toordinal() - epoch
+    end_day = end_date.toordinal() - epoch
+    today = date.today().toordinal() - epoch
+    first_day_span = (end_day - start_day) - 30  # First appointments leave a month of room
+
     # Build lookup maps
     insurance_by_patient = {ins.patientid: ins for ins in insurance_records}
-    providers_by_specialty: dict[str, list[Provider]] = {}
-    for provider in providers:
+    providers_by_specialty: dict[str, list[int]] = {}
+    for i, provider in enumerate(providers):
         specialty = provider.provider_specialty
         if specialty not in providers_by_specialty:
             providers_by_specialty[specialty] = []
-        providers_by_specialty[specialty].append(provider)
+        providers_by_specialty[specialty].append(i)
 
-    departments_by_specialty: dict[str, list[Department]] = {}
-    for dept in departments:
+    departments_by_specialty: dict[str, list[int]] = {}
+    for i, dept in enumerate(departments):
         specialty = dept.departmentspecialty or "General"
         if specialty not in departments_by_specialty:
             departments_by_specialty[specialty] = []
-        departments_by_specialty[specialty].append(dept)
+        departments_by_specialty[specialty].append(i)
+
+    # Candidate indices per specialty code, falling back to everyone when a
+    # specialty has no match; picks are gathered per pass with pre-drawn uniforms
+    specialty_codes = {specialty: code for code, specialty in enumerate(SPECIALTIES)}
+    provider_ids = np.array([provider.providerid for provider in providers])
+    department_ids = np.array([dept.departmentid for dept in departments])
+    provider_candidates = [
+        np.array(providers_by_specialty.get(specialty) or range(len(providers))) for specialty in SPECIALTIES
+    ]
+    department_candidates = [
+        np.array(departments_by_specialty.get(specialty) or range(len(departments))) for specialty in SPECIALTIES
+    ]
 
     # Primary care specialties for referral chains
     primary_care_specialties = ["Family Medicine", "Internal Medicine", "Pediatrics"]
+    specialist_specialties = [s for s in SPECIALTIES if s not in primary_care_specialties]
 
     appointment_id = 1
     appointments_created = 0
 
+    # Lead times for every appointment drawn in one call
+    lead_times = gamma_lead_times(count, rng)
+
     # Assign journey types to patients
     patient_journeys = {}
     for patient in patients:
-        patient_journeys[patient.patientid] = weighted_choice(JOURNEY_TYPE_WEIGHTS)
+        patient_journeys[patient.patientid] = weighted_choice(_JOURNEY_TYPE_TABLE)
+
+    # Visit-count range of each patient's journey, in patient order
+    visit_ranges = np.array([JOURNEY_VISIT_RANGES[patient_journeys[p.patientid]] for p in patients])
+
+    # Per-patient scoring inputs, indexed by position in `patients`
+    portal_engaged = np.fromiter((p.portal_engaged for p in patients), bool, len(patients))
+    age_codes = np.fromiter((p.patient_age_bucket.code for p in patients), np.int8, len(patients))
+    payer_codes = np.fromiter(
+        (
+            (ins.sipg2 if (ins := insurance_by_patient.get(p.patientid)) else PayerGrouping.SELF_PAY).code
+            for p in patients
+        ),
+        np.int8,
+        len(patients),
+    )
 
-    # Track patient history across multiple passes
-    patient_stats: dict[int, dict[str, Any]] = {
-        p.patientid: {"no_shows": 0, "total": 0, "last_appt_date": None}
-        for p in patients
-    }
+    # Track patient history across multiple passes, indexed the same way
+    patient_past_visits = np.zeros(len(patients), dtype=np.int64)
+    patient_no_shows = np.zeros(len(patients), dtype=np.int64)
+    patient_last_day: list[int | None] = [None] * len(patients)
 
     # Keep generating until we reach the target count
     # Multiple passes through patients if needed
     pass_number = 0
     while appointments_created < count:
         pass_number += 1
-        patients_this_pass = random.sample(patients, len(patients))  # Shuffle for variety
-        
-        for patient in patients_this_pass:
-            if appointments_created >= count:
+        order = rng.permutation(len(patients))  # Shuffle for variety
+        remaining = count - appointments_created
+        planned: list[_PlannedAppointment] = []
+
+        # Number of appointments per patient this pass
+        # Scale up for subsequent passes to reach target faster
+        base_multiplier = 1 + (pass_number - 1) * 0.5
+        low, high = visit_ranges[order].T
+        visit_counts = (rng.integers(low, high + 1) * base_multiplier).astype(int).tolist()
+
+        # Per-appointment draws; a pass plans at most `remaining` appointments,
+        # each consuming the draws at its own position
+        specialty_draws = rng.random(remaining).tolist()
+        provider_draws = rng.random(remaining)
+        department_draws = rng.random(remaining)
+        hours = rng.integers(7, 17, size=remaining).tolist()  # Business hours 7:00-17:00
+        minutes = rng.choice([0, 15, 30, 45], size=remaining).tolist()
+        virtual_flags = weighted_choices(VIRTUAL_FLAG_WEIGHTS, remaining, rng)
+        durations = weighted_choices(DURATION_WEIGHTS, remaining, rng)
+        web_rolls = rng.random(remaining).tolist()
+        type_draws = rng.random(remaining).tolist()
+        first_day_offsets = rng.integers(0, first_day_span + 1, size=remaining).tolist()
+        return_intervals = rng.integers(7, 91, size=remaining).tolist()
+        follow_up_intervals = {
+            journey: rng.integers(low, high + 1, size=remaining).tolist()
+            for journey, (low, high) in JOURNEY_INTERVAL_RANGES.items()
+        }
+        wrap_offsets = rng.integers(0, 366, size=remaining).tolist()
+
+        for idx, num_appointments in zip(order.tolist(), visit_counts):
+            if len(planned) >= remaining:
                 break
-                
+
+            patient = patients[idx]
             journey_type = patient_journeys[patient.patientid]
-            payer_group = insurance_by_patient.get(patient.patientid)
-            payer = payer_group.sipg2 if payer_group else PayerGrouping.SELF_PAY
-
-            # Determine number of appointments for this patient this pass
-            # Scale up for subsequent passes to reach target faster
-            base_multiplier = 1 + (pass_number - 1) * 0.5
-            if journey_type == "routine_care":
-                num_appointments = int(random.randint(2, 6) * base_multiplier)
-            elif journey_type == "chronic_management":
-                num_appointments = int(random.randint(6, 24) * base_multiplier)
-            elif journey_type == "episodic":
-                num_appointments = int(random.randint(1, 4) * base_multiplier)
-            elif journey_type == "referral_chain":
-                num_appointments = int(random.randint(3, 8) * base_multiplier)
-            else:  # care_abandonment
-                num_appointments = int(random.randint(3, 6) * base_multiplier)
-
-            # Track patient's appointment history for no-show calculation
-            patient_no_shows = patient_stats[patient.patientid]["no_shows"]
-            patient_total = patient_stats[patient.patientid]["total"]
-            last_appt_date = patient_stats[patient.patientid]["last_appt_date"]
+            intervals = follow_up_intervals[journey_type]
+            engaged = portal_engaged[idx]
+
+            # Past visits so far; outcomes are rolled after the pass is planned
+            patient_total = int(patient_past_visits[idx])
+            last_appt_day = patient_last_day[idx]
             parent_appointment_id = None
 
             for appt_num in range(num_appointments):
-                if appointments_created >= count:
+                k = len(planned)
+                if k >= remaining:
                     break
 
                 # Select specialty based on journey type
                 if journey_type == "referral_chain":
                     if appt_num == 0:
-                        specialty = random.choice(primary_care_specialties)
+                        specialty_pool = primary_care_specialties
                     else:
-                        specialty = random.choice([s for s in SPECIALTIES if s not in primary_care_specialties])
+                        specialty_pool = specialist_specialties
                 else:
-                    specialty = random.choice(SPECIALTIES)
-
-                # Select provider and department
-                available_providers = providers_by_specialty.get(specialty)
-                if not available_providers:
-                    available_providers = providers
-                provider = random.choice(available_providers)
-
-                available_depts = departments_by_specialty.get(specialty)
-                if not available_depts:
-                    available_depts = departments
-                department = random.choice(available_depts)
+                    specialty_pool = SPECIALTIES
+                specialty = specialty_pool[int(specialty_draws[k] * len(specialty_pool))]
 
                 # Generate appointment date within range
-                if appt_num == 0 and last_appt_date is None:
+                if appt_num == 0 and last_appt_day is None:
                     # First appointment ever: random within range
-                    days_from_start = random.randint(0, (end_date - start_date).days - 30)
-                    appt_date = start_date + timedelta(days=days_from_start)
-                elif appt_num == 0 and last_appt_date is not None:
+                    appt_day = start_day + first_day_offsets[k]
+                elif appt_num == 0 and last_appt_day is not None:
                     # Continuation from previous pass: after last appointment
-                    interval = random.randint(7, 90)
-                    appt_date = last_appt_date + timedelta(days=interval)
-                    if appt_date > end_date:
-                        appt_date = start_date + timedelta(days=random.randint(0, 365))
+                    appt_day = last_appt_day + return_intervals[k]
+                    if appt_day > end_day:
+                        appt_day = start_day + wrap_offsets[k]
                 else:
                     # Subsequent appointments: after previous with journey-specific intervals
-                    if journey_type == "chronic_management":
-                        interval = random.randint(21, 90)  # Monthly to quarterly
-                    elif journey_type == "care_abandonment":
-                        interval = random.randint(14, 45)
-                    else:
-                        interval = random.randint(7, 180)
-
-                    appt_date = appt_date + timedelta(days=interval)
-                    if appt_date > end_date:
+                    appt_day = appt_day + intervals[k]
+                    if appt_day > end_day:
                         # Wrap around to fill more dates
-                        appt_date = start_date + timedelta(days=random.randint(0, 365))
+                        appt_day = start_day + wrap_offsets[k]
 
-                # Appointment time (business hours 7:00-17:00)
-                hour = random.randint(7, 16)
-                minute = random.choice([0, 15, 30, 45])
-                appt_time = f"{hour:02d}:{minute:02d}"
-
-                # Virtual flag
-                virtual_flag = weighted_choice(VIRTUAL_FLAG_WEIGHTS)
+                virtual_flag = virtual_flags[k]
 
                 # New patient flag (based on patient's total history, not just this pass)
                 if patient_total == 0 and appt_num == 0:
@@ -678,141 +909,175 @@ def generate_appointments(
                 else:
                     new_patient_flag = NewPatientFlag.ESTABLISHED
 
-                # Duration
-                duration = weighted_choice(DURATION_WEIGHTS)
-
-                # Lead time
-                lead_time = gamma_lead_time()
-                scheduled_datetime = datetime.combine(appt_date, datetime.min.time()) - timedelta(days=lead_time)
-
                 # Web scheduled (more likely for portal-engaged patients)
-                web_scheduled = random.random() < (0.40 if patient.portal_engaged else 0.15)
+                web_scheduled = web_rolls[k] < (0.40 if engaged else 0.15)
 
                 # Appointment type
                 if virtual_flag != VirtualFlag.NON_VIRTUAL:
-                    appt_type = random.choice(APPOINTMENT_TYPES["telehealth"])
+                    type_pool = _TELEHEALTH_TYPES
                 elif specialty in primary_care_specialties:
-                    appt_type = random.choice(APPOINTMENT_TYPES["primary_care"])
+                    type_pool = _PRIMARY_CARE_TYPES
                 else:
-                    appt_type = random.choice(APPOINTMENT_TYPES["specialty"])
-
-                appt_type_name, _ = appt_type
-
-                # Calculate no-show probability
-                journey_stage = "care_abandonment_escalating" if (
-                    journey_type == "care_abandonment" and appt_num >= 2
-                ) else "normal"
+                    type_pool = _SPECIALTY_TYPES
+                appt_type_name = type_pool[int(type_draws[k] * len(type_pool))]
 
-                # Update patient stats for calculation
-                patient.historical_no_show_count = patient_no_shows
-                patient.historical_no_show_rate = patient_no_shows / max(1, patient_total)
-
-                no_show_prob = calculate_no_show_probability(
+                planned.append(_PlannedAppointment(
+                    appointmentid=appointment_id,
                     patient=patient,
-                    appointment_date=appt_date,
-                    lead_time_days=lead_time,
-                    hour_of_day=hour,
-                    day_of_week=appt_date.weekday(),
+                    patient_index=idx,
+                    specialty_code=specialty_codes[specialty],
+                    appointment_day=appt_day,
+                    hour=hours[k],
+                    minute=minutes[k],
+                    duration=durations[k],
+                    lead_time=int(lead_times[appointments_created + k]),
+                    appt_type_name=appt_type_name,
                     virtual_flag=virtual_flag,
                     new_patient_flag=new_patient_flag,
-                    payer_group=payer,
                     web_scheduled=web_scheduled,
-                    journey_stage=journey_stage,
-                )
+                    escalating=journey_type == "care_abandonment" and appt_num >= 2,
+                    parentappointmentid=parent_appointment_id,
+                    is_referral=journey_type == "referral_chain" and appt_num > 0,
+                    prior_visits=patient_total,
+                    visit_number=appt_num,
+                ))
 
-                # Determine appointment outcome
-                is_future = appt_date > date.today()
-                is_no_show = False
+                if appt_day <= today:
+                    patient_total += 1
+                parent_appointment_id = appointment_id
+                appointment_id += 1
 
-                if is_future:
+            # Update patient stats for next pass
+            patient_past_visits[idx] = patient_total
+            patient_last_day[idx] = appt_day
+
+        # Calendar fields of the planned dates
+        size = len(planned)
+        patient_indices = np.fromiter((p.patient_index for p in planned), np.int64, size)
+        appointment_days = np.fromiter((p.appointment_day for p in planned), np.int64, size)
+        appointment_dates = appointment_days.astype("datetime64[D]")
+        month_starts = appointment_dates.astype("datetime64[M]")
+
+        # Provider and department picks, gathered one specialty at a time
+        specialties = np.fromiter((p.specialty_code for p in planned), np.int64, size)
+        provider_picks = np.empty(size, dtype=np.int64)
+        department_picks = np.empty(size, dtype=np.int64)
+        for code in range(len(SPECIALTIES)):
+            rows = np.flatnonzero(specialties == code)
+            candidates = provider_candidates[code]
+            provider_picks[rows] = candidates[(provider_draws[rows] * len(candidates)).astype(np.int64)]
+            candidates = department_candidates[code]
+            department_picks[rows] = candidates[(department_draws[rows] * len(candidates)).astype(np.int64)]
+        appointment_provider_ids = provider_ids[provider_picks].tolist()
+        appointment_department_ids = department_ids[department_picks].tolist()
+
+        # Score the whole pass at once
+        base_probabilities = calculate_no_show_probability_batch(
+            lead_time_days=np.fromiter((p.lead_time for p in planned), np.int32, size),
+            age_codes=age_codes[patient_indices],
+            payer_codes=payer_codes[patient_indices],
+            day_of_week=(appointment_days + 3) % 7,  # 1970-01-01 was a Thursday
+            hour_of_day=np.fromiter((p.hour for p in planned), np.int8, size),
+            is_new_patient=np.fromiter(
+                (p.new_patient_flag == NewPatientFlag.NEW_PATIENT for p in planned), bool, size
+            ),
+            virtual_codes=np.fromiter((p.virtual_flag.code for p in planned), np.int8, size),
+            portal_engaged=portal_engaged[patient_indices],
+            web_scheduled=np.fromiter((p.web_scheduled for p in planned), bool, size),
+            months=month_starts.astype(np.int64) % 12 + 1,
+            days=(appointment_dates - month_starts).astype(np.int64) + 1,
+            escalating=np.fromiter((p.escalating for p in planned), bool, size),
+        )
+
+        # Roll outcomes in visit order so each patient's history is current
+        outcome_rolls = rng.random(size)
+        checkin_offsets = rng.integers(5, 31, size=size)
+        checkout_offsets = rng.integers(5, 46, size=size)
+        created_offsets = rng.integers(0, 6, size=size)
+
+        outcomes = roll_appointment_outcomes(
+            base_probabilities=base_probabilities,
+            patient_index=patient_indices,
+            visit_number=np.fromiter((p.visit_number for p in planned), np.int64, size),
+            prior_visits=np.fromiter((p.prior_visits for p in planned), np.int64, size),
+            is_past=appointment_days <= today,
+            rolls=outcome_rolls,
+            no_shows=patient_no_shows,
+        )
+
+        # Timestamps in whole minutes since the epoch, converted to datetimes in bulk
+        start_minutes = (
+            appointment_days * 1440
+            + np.fromiter((p.hour * 60 + p.minute for p in planned), np.int64, size)
+        )
+        durations = np.fromiter((p.duration for p in planned), np.int64, size)
+        scheduled_minutes = (
+            appointment_days - np.fromiter((p.lead_time for p in planned), np.int64, size)
+        ) * 1440
+        appointment_dates = appointment_dates.tolist()
+        scheduled_times = scheduled_minutes.astype("datetime64[m]").tolist()
+        created_times = (scheduled_minutes - created_offsets * 1440).astype("datetime64[m]").tolist()
+        checkin_times = (start_minutes - checkin_offsets).astype("datetime64[m]").tolist()
+        checkout_times = (start_minutes + durations + checkout_offsets).astype("datetime64[m]").tolist()
+
+        outcomes = outcomes.tolist()
+
+        for chunk_start in range(0, size, chunk_size):
+            chunk: list[Appointment] = []
+            for i in range(chunk_start, min(size, chunk_start + chunk_size)):
+                plan = planned[i]
+                outcome = outcomes[i]
+                checkin_time = None
+                checkout_time = None
+
+                if outcome == OUTCOME_SCHEDULED:
                     status = AppointmentStatus.SCHEDULED
-                    checkin_time = None
-                    checkout_time = None
+                elif outcome == OUTCOME_NO_SHOW:
+                    status = AppointmentStatus.NO_SHOW
+                elif outcome == OUTCOME_CANCELLED:
+                    status = AppointmentStatus.CANCELLED
                 else:
-                    # Past appointment - determine outcome
-                    roll = random.random()
-                    if roll < no_show_prob:
-                        status = AppointmentStatus.NO_SHOW
-                        is_no_show = True
-                        checkin_time = None
-                        checkout_time = None
-                    elif roll < no_show_prob + 0.10:
-                        status = AppointmentStatus.CANCELLED
-                        checkin_time = None
-                        checkout_time = None
-                    else:
-                        status = AppointmentStatus.COMPLETE
-                        appt_datetime = datetime.combine(appt_date, datetime.min.time().replace(hour=hour, minute=minute))
-                        checkin_time = appt_datetime - timedelta(minutes=random.randint(5, 30))
-                        checkout_time = appt_datetime + timedelta(minutes=duration + random.randint(5, 45))
-
-                # Update patient history
-                if not is_future:
-                    patient_total += 1
-                    if is_no_show:
-                        patient_no_shows += 1
+                    status = AppointmentStatus.COMPLETE
+                    checkin_time = checkin_times[i]
+                    checkout_time = checkout_times[i]
 
                 # Create appointment record
-                appt_datetime_created = scheduled_datetime - timedelta(days=random.randint(0, 5))
+                scheduled_datetime = scheduled_times[i]
 
                 appointment = Appointment(
-                    appointmentid=appointment_id,
-                    patientid=patient.patientid,
-                    providerid=provider.providerid,
-                    departmentid=department.departmentid,
-                    appointmentdate=appt_date,
-                    appointmentstarttime=appt_time,
-                    appointmentduration=duration,
-                    appointmenttypeid=hash(appt_type_name) % 1000,
-                    appointmenttypename=appt_type_name,
+                    appointmentid=plan.appointmentid,
+                    patientid=plan.patient.patientid,
+                    providerid=appointment_provider_ids[i],
+                    departmentid=appointment_department_ids[i],
+                    appointmentdate=appointment_dates[i],
+                    appointmentstarttime=f"{plan.hour:02d}:{plan.minute:02d}",
+                    appointmentduration=plan.duration,
+                    appointmenttypeid=APPOINTMENT_TYPE_IDS[plan.appt_type_name],
+                    appointmenttypename=plan.appt_type_name,
                     appointmentstatus=status,
-                    appointmentcreateddatetime=appt_datetime_created,
+                    appointmentcreateddatetime=created_times[i],
                     appointmentscheduleddatetime=scheduled_datetime,
-                    parentappointmentid=parent_appointment_id,
-                    referringproviderid=provider.providerid if journey_type == "referral_chain" and appt_num > 0 else None,
+                    parentappointmentid=plan.parentappointmentid,
+                    referringproviderid=appointment_provider_ids[i] if plan.is_referral else None,
                     appointmentcheckindatetime=checkin_time,
                     appointmentcheckoutdatetime=checkout_time,
                     appointmentcancelleddatetime=scheduled_datetime if status == AppointmentStatus.CANCELLED else None,
-                    webschedulableyn=1 if web_scheduled else 0,
-                    virtual_flag=virtual_flag,
-                    new_patient_flag=new_patient_flag,
+                    webschedulableyn=1 if plan.web_scheduled else 0,
+                    virtual_flag=plan.virtual_flag,
+                    new_patient_flag=plan.new_patient_flag,
                 )
 
-                appointments.append(appointment)
-                parent_appointment_id = appointment_id
-                appointment_id += 1
-                appointments_created += 1
-            
-            # Update patient stats for next pass
-            patient_stats[patient.patientid]["no_shows"] = patient_no_shows
-            patient_stats[patient.patientid]["total"] = patient_total
-            patient_stats[patient.patientid]["last_appt_date"] = appt_date
-
-        if appointments_created >= count:
-            break
-
-    # Update final patient stats
-    _update_patient_statistics(patients, appointments)
-
-    return appointments
-
+                chunk.append(appointment)
 
-def _update_patient_statistics(patients: list[Patient], appointments: list[Appointment]) -> None:
-    """Update patient historical no-show statistics."""
-    patient_stats: dict[int, dict[str, int]] = {}
+            yield chunk
 
-    for appt in appointments:
-        if appt.appointmentdate <= date.today():
-            if appt.patientid not in patient_stats:
-                patient_stats[appt.patientid] = {"total": 0, "no_shows": 0}
-            patient_stats[appt.patientid]["total"] += 1
-            if appt.no_show:
-                patient_stats[appt.patientid]["no_shows"] += 1
+        appointments_created += size
 
-    for patient in patients:
-        stats = patient_stats.get(patient.patientid, {"total": 0, "no_shows": 0})
-        patient.historical_no_show_count = stats["no_shows"]
-        patient.historical_no_show_rate = stats["no_shows"] / max(1, stats["total"])
+    # Final patient statistics from the running counters
+    no_show_rates = patient_no_shows / np.maximum(1, patient_past_visits)
+    for patient, no_shows, rate in zip(patients, patient_no_shows.tolist(), no_show_rates.tolist()):
+        patient.historical_no_show_count = no_shows
+        patient.historical_no_show_rate = rate
 
 
 # =============================================================================
@@ -821,17 +1086,131 @@ def _update_patient_statistics(patients: list[Patient], appointments: list[Appoi
 
 
 def entities_to_dataframe(entities: list, exclude_computed: bool = False) -> pd.DataFrame:
-    """Convert a list of dataclass entities to a pandas DataFrame."""
-    records = []
-    for entity in entities:
-        record = {}
-        for key, value in asdict(entity).items():
-            # Convert enums to their values
-            if hasattr(value, 'value'):
-                value = value.value
-            record[key] = value
-        records.append(record)
-    return pd.DataFrame(records)
+    """Convert a list of dataclass entities to a pandas DataFrame.
+
+    Columns are gathered field by field straight from the entities, with
+    enum-typed fields converted to their values.
+    """
+    if not entities:
+        return pd.DataFrame()
+
+    enum_fields = _enum_fields(type(entities[0]))
+    columns = {}
+    for entity_field in fields(entities[0]):
+        values = [getattr(entity, entity_field.name) for entity in entities]
+        if entity_field.name in enum_fields:
+            values = [value.value if value is not None else None for value in values]
+        columns[entity_field.name] = values
+    return pd.DataFrame(columns, copy=False)
+
+
+@lru_cache(maxsize=None)
+def _enum_fields(entity_type: type) -> frozenset[str]:
+    """Names of the fields of a dataclass type annotated as Enum (or Optional[Enum])."""
+    enum_fields = set()
+    for name, annotation in get_type_hints(entity_type).items():
+        candidates = get_args(annotation) or (annotation,)
+        if any(isinstance(candidate, type) and issubclass(candidate, Enum) for candidate in candidates):
+            enum_fields.add(name)
+    return frozenset(enum_fields)
+
+
+# Arrow column types for the scalar annotations used by the schema dataclasses
+_ARROW_TYPES = {
+    int: pa.int64(),
+    float: pa.float64(),
+    str: pa.string(),
+    date: pa.date32(),
+}
+
+# Enum fields: every enum in the schema has far fewer than 128 members
+_ENUM_ARROW_TYPE = pa.dictionary(pa.int8(), pa.string())
+
+# 0/1 flag fields written as one-byte columns rather than int64
+_FLAG_FIELDS = frozenset({"webschedulableyn"})
+
+# Datetime fields generated as timezone-aware UTC values
+_UTC_FIELDS = frozenset({"portal_last_login"})
+
+
+@lru_cache(maxsize=None)
+def _arrow_schema(entity_type: type) -> pa.Schema:
+    """Build the Arrow schema for a dataclass type from its field annotations.
+
+    Column types come from the annotations alone, never from sampled values,
+    so every chunk of a streamed table fits the same schema. Enums are
+    written as dictionary-encoded string values with int8 indices, so readers
+    get categoricals rather than per-row strings; 0/1 flag fields are uint8.
+    """
+    enum_fields = _enum_fields(entity_type)
+    type_hints = get_type_hints(entity_type)
+    arrow_fields = []
+    for entity_field in fields(entity_type):
+        hint = type_hints[entity_field.name]
+        annotation = next((arg for arg in get_args(hint) if arg is not type(None)), hint)
+        if entity_field.name in enum_fields:
+            arrow_type = _ENUM_ARROW_TYPE
+        elif entity_field.name in _FLAG_FIELDS:
+            arrow_type = pa.uint8()
+        elif annotation is datetime:
+            arrow_type = pa.timestamp("ns", tz="UTC" if entity_field.name in _UTC_FIELDS else None)
+        else:
+            arrow_type = _ARROW_TYPES[annotation]
+        arrow_fields.append(pa.field(entity_field.name, arrow_type))
+    return pa.schema(arrow_fields)
+
+
+def write_entities_parquet(entities: list, path: Path, chunk_size: int = 10_000) -> None:
+    """Write a list of dataclass entities to a parquet file in Arrow record batches.
+
+    Columns are built per chunk straight from the entities, so no pandas
+    DataFrame of the full table is ever held in memory.
+    """
+    if not entities:
+        pd.DataFrame().to_parquet(path, index=False)
+        return
+
+    chunks = (entities[start:start + chunk_size] for start in range(0, len(entities), chunk_size))
+    write_entity_chunks_parquet(chunks, path, schema=_arrow_schema(type(entities[0])))
+
+
+def write_entity_chunks_parquet(chunks: Iterable[list], path: Path, schema: pa.Schema | None = None) -> int:
+    """Stream chunks of dataclass entities to a parquet file, one record batch per chunk.
+
+    Only one chunk is held at a time. Without an explicit schema it is built
+    from the entity type's annotations. Returns the number of rows written.
+    """
+    writer = None
+    rows = 0
+    try:
+        for chunk in chunks:
+            if not chunk:
+                continue
+            if writer is None:
+                schema = schema or _arrow_schema(type(chunk[0]))
+                enum_fields = _enum_fields(type(chunk[0]))
+                writer = pq.ParquetWriter(path, schema)
+
+            arrays = []
+            for arrow_field in schema:
+                values = [getattr(entity, arrow_field.name) for entity in chunk]
+                if arrow_field.name in enum_fields:
+                    values = [value.value if value is not None else None for value in values]
+                elif arrow_field.type == pa.uint8():
+                    flags = np.fromiter((value or 0 for value in values), dtype=np.uint8, count=len(values))
+                    missing = np.fromiter((value is None for value in values), dtype=np.bool_, count=len(values))
+                    arrays.append(pa.array(flags, mask=missing if missing.any() else None))
+                    continue
+                arrays.append(pa.array(values, type=arrow_field.type))
+            writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+            rows += len(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    if writer is None:
+        pd.DataFrame().to_parquet(path, index=False)
+    return rows
 
 
 def save_to_parquet(
@@ -840,7 +1219,7 @@ def save_to_parquet(
     providers: list[Provider],
     departments: list[Department],
     insurance_records: list[Insurance],
-    appointments: list[Appointment],
+    appointments: list[Appointment] | Iterable[list[Appointment]],
 ) -> dict[str, Path]:
     """Save all generated data to parquet files.
 
@@ -850,7 +1229,9 @@ def save_to_parquet(
         providers: List of Provider entities
         departments: List of Department entities
         insurance_records: List of Insurance entities
-        appointments: List of Appointment entities
+        appointments: List of Appointment entities, or chunks from
+            iter_appointment_chunks (streamed, and written first because
+            they finalise the patients' historical statistics)
 
     Returns:
         Dictionary mapping entity names to file paths
@@ -860,36 +1241,34 @@ def save_to_parquet(
 
     files = {}
 
+    # Save appointments
+    path = output_dir / "appointments.parquet"
+    if isinstance(appointments, list):
+        write_entities_parquet(appointments, path)
+    else:
+        write_entity_chunks_parquet(appointments, path)
+    files["appointments"] = path
+
     # Save patients
-    df_patients = entities_to_dataframe(patients)
     path = output_dir / "patients.parquet"
-    df_patients.to_parquet(path, index=False)
+    write_entities_parquet(patients, path)
     files["patients"] = path
 
     # Save providers
-    df_providers = entities_to_dataframe(providers)
     path = output_dir / "providers.parquet"
-    df_providers.to_parquet(path, index=False)
+    write_entities_parquet(providers, path)
     files["providers"] = path
 
     # Save departments
-    df_departments = entities_to_dataframe(departments)
     path = output_dir / "departments.parquet"
-    df_departments.to_parquet(path, index=False)
+    write_entities_parquet(departments, path)
     files["departments"] = path
 
     # Save insurance
-    df_insurance = entities_to_dataframe(insurance_records)
     path = output_dir / "insurance.parquet"
-    df_insurance.to_parquet(path, index=False)
+    write_entities_parquet(insurance_records, path)
     files["insurance"] = path
 
-    # Save appointments
-    df_appointments = entities_to_dataframe(appointments)
-    path = output_dir / "appointments.parquet"
-    df_appointments.to_parquet(path, index=False)
-    files["appointments"] = path
-
     return files
 
 
@@ -929,7 +1308,7 @@ def generate_all_data(
     insurance_records = generate_insurance(patients)
 
     print(f"Generating {num_appointments} appointments with patient journeys...")
-    appointments = generate_appointments(
+    appointment_chunks = iter_appointment_chunks(
         patients=patients,
         providers=providers,
         departments=departments,
@@ -937,6 +1316,19 @@ def generate_all_data(
         count=num_appointments,
     )
 
+    # Tally the summary while the chunks stream to disk
+    today = date.today()
+    appointment_counts = {"total": 0, "past": 0, "no_shows": 0}
+
+    def tally(chunks: Iterable[list[Appointment]]) -> Iterator[list[Appointment]]:
+        for chunk in chunks:
+            appointment_counts["total"] += len(chunk)
+            for appointment in chunk:
+                if appointment.appointmentdate <= today:
+                    appointment_counts["past"] += 1
+                    appointment_counts["no_shows"] += appointment.appointmentstatus == AppointmentStatus.NO_SHOW
+            yield chunk
+
     print(f"Saving data to {output_dir}...")
     files = save_to_parquet(
         output_dir=output_dir,
@@ -944,7 +1336,7 @@ def generate_all_data(
         providers=providers,
         departments=departments,
         insurance_records=insurance_records,
-        appointments=appointments,
+        appointments=tally(appointment_chunks),
     )
 
     # Print summary
@@ -953,12 +1345,11 @@ def generate_all_data(
     print(f"Providers:    {len(providers):,}")
     print(f"Departments:  {len(departments):,}")
     print(f"Insurance:    {len(insurance_records):,}")
-    print(f"Appointments: {len(appointments):,}")
+    print(f"Appointments: {appointment_counts['total']:,}")
 
-    # Calculate no-show rate
-    past_appts = [a for a in appointments if a.appointmentdate <= date.today()]
-    no_shows = sum(1 for a in past_appts if a.no_show)
-    no_show_rate = no_shows / max(1, len(past_appts))
+    # Calculate no-show rate (past appointments are always rolled, so a
+    # no-show is exactly a NO_SHOW status)
+    no_show_rate = appointment_counts["no_shows"] / max(1, appointment_counts["past"])
     print(f"\nNo-show rate: {no_show_rate:.1%}")
 
     return files
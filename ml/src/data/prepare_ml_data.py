@@ -9,110 +9,192 @@ Usage:
 
 import argparse
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterable
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
+# Integer type for the patient/provider/department join keys
+JOIN_KEY_DTYPE = np.int32
 
-def load_synthetic_data(data_dir: Path) -> dict[str, pd.DataFrame]:
+# Columns read from each table: join keys, feature inputs, and features
+TABLE_COLUMNS = {
+    "appointments": [
+        "appointmentid",
+        "patientid",
+        "providerid",
+        "departmentid",
+        "appointmentdate",
+        "appointmentstarttime",
+        "appointmentstatus",
+        "appointmentscheduleddatetime",
+        "appointmentduration",
+        "appointmenttypename",
+        "virtual_flag",
+        "new_patient_flag",
+        "webschedulableyn",
+    ],
+    "patients": [
+        "patientid",
+        "patient_gender",
+        "patient_age_bucket",
+        "patient_race_ethnicity",
+        "patient_zip_code",
+        "portal_last_login",
+    ],
+    "providers": ["providerid", "providertype", "provider_specialty"],
+    "departments": ["departmentid", "departmentspecialty", "placeofservicetype", "market"],
+    "insurance": ["patientid", "sipg2", "sipg1"],
+}
+
+# Low-cardinality string features, stored as categoricals (dictionary-encoded in parquet)
+CATEGORICAL_FEATURES = [
+    "patient_age_bucket",
+    "patient_gender",
+    "sipg2",
+    "appointmenttypename",
+    "virtual_flag",
+    "new_patient_flag",
+    "provider_specialty",
+    "providertype",
+    "departmentspecialty",
+    "placeofservicetype",
+    "market",
+]
+
+# Output parquet layout: bounded row groups with min/max statistics so readers
+# can prune and parallelize, zstd, and dictionary-encoded categoricals
+PARQUET_WRITE_OPTIONS = {
+    "compression": "zstd",
+    "compression_level": 3,
+    "row_group_size": 256_000,
+    "use_dictionary": True,
+    "write_statistics": True,
+}
+
+
+def load_synthetic_data(
+    data_dir: Path,
+    columns: dict[str, list[str]] | None = None,
+    filters: dict[str, list[tuple]] | None = None,
+) -> dict[str, pd.DataFrame]:
     """Load all synthetic data parquet files.
     
     Args:
         data_dir: Path to synthetic data directory
+        columns: Optional table name -> columns to read; columns missing from
+            a file are skipped, tables not listed are read in full
+        filters: Optional table name -> pyarrow row filters, applied while
+            reading so row groups outside them are skipped
         
     Returns:
         Dictionary of table name -> DataFrame
     """
-    tables = {}
-    for name in ["appointments", "patients", "providers", "departments", "insurance"]:
+    columns = columns or {}
+    filters = filters or {}
+    
+    def read_table(name: str) -> pd.DataFrame | None:
         path = data_dir / f"{name}.parquet"
-        if path.exists():
-            tables[name] = pd.read_parquet(path)
-            logger.info(f"Loaded {name}: {len(tables[name]):,} rows, {len(tables[name].columns)} columns")
-        else:
+        if not path.exists():
             logger.warning(f"Missing {path}")
+            return None
+        read_columns = None
+        if name in columns:
+            available = set(pq.read_schema(path).names)
+            read_columns = [col for col in columns[name] if col in available]
+        return pd.read_parquet(path, columns=read_columns, filters=filters.get(name))
+    
+    # The tables are independent; pyarrow releases the GIL while reading, so
+    # the reads overlap
+    names = ["appointments", "patients", "providers", "departments", "insurance"]
+    tables = {}
+    with ThreadPoolExecutor(max_workers=len(names)) as executor:
+        for name, table in zip(names, executor.map(read_table, names)):
+            if table is not None:
+                tables[name] = table
+                logger.info(f"Loaded {name}: {len(table):,} rows, {len(table.columns)} columns")
     return tables
 
 
-def compute_historical_no_show_features(appointments: pd.DataFrame) -> pd.DataFrame:
-    """Compute per-patient historical no-show statistics.
-    
-    Calculates features based on appointments BEFORE each appointment's date
-    to avoid data leakage.
+def available_columns(df: pd.DataFrame, columns: Iterable[str]) -> list[str]:
+    """Return the given columns that exist in df, in the given order.
     
-    Args:
-        appointments: Appointments DataFrame with patientid and appointmentdate
-        
-    Returns:
-        DataFrame with patientid, appointmentid, historical_no_show_count, historical_no_show_rate
+    The frame's columns are hashed into a frozenset once, so each membership
+    test is a set lookup rather than a pandas Index lookup.
     """
-    logger.info("Computing historical no-show features per patient...")
-    
-    # Ensure date types
-    appointments = appointments.copy()
-    appointments["appointmentdate"] = pd.to_datetime(appointments["appointmentdate"])
-    
-    # Sort by patient and date
-    appointments = appointments.sort_values(["patientid", "appointmentdate"])
-    
-    # Create no_show flag
-    appointments["no_show"] = (appointments["appointmentstatus"] == "No Show").astype(int)
-    
-    # For each appointment, compute stats from prior appointments only
-    results = []
-    
-    for patient_id, group in appointments.groupby("patientid"):
-        group = group.sort_values("appointmentdate")
-        
-        # Cumulative count and sum (shifted to exclude current row)
-        group["cumulative_appointments"] = range(len(group))
-        group["cumulative_no_shows"] = group["no_show"].cumsum().shift(1, fill_value=0)
-        
-        # Historical rate (avoid division by zero)
-        group["historical_no_show_count"] = group["cumulative_no_shows"]
-        group["historical_no_show_rate"] = group.apply(
-            lambda row: row["cumulative_no_shows"] / row["cumulative_appointments"] 
-            if row["cumulative_appointments"] > 0 else 0.0,
-            axis=1
-        )
-        
-        results.append(group[["appointmentid", "patientid", "historical_no_show_count", "historical_no_show_rate"]])
-    
-    return pd.concat(results, ignore_index=True)
+    present = frozenset(df.columns)
+    return [col for col in columns if col in present]
 
 
-def extract_time_features(appointments: pd.DataFrame) -> pd.DataFrame:
-    """Extract time-based features from appointment dates/times.
+def compute_all_features(appointments: pd.DataFrame) -> pd.DataFrame:
+    """Compute the time-based and per-patient historical no-show features.
+    
+    Historical statistics are based on appointments BEFORE each appointment
+    (in date order per patient) to avoid data leakage. All features come from
+    one sort of the join keys and are added in a single assign, so the
+    appointments frame is neither re-sorted nor merged back.
     
     Args:
-        appointments: Appointments DataFrame
+        appointments: Appointments DataFrame with patientid, no_show,
+            appointmentstarttime, and datetime-typed appointmentdate and
+            appointmentscheduleddatetime (as read from parquet)
         
     Returns:
-        DataFrame with appointmentid and time features
+        Appointments with day_of_week, hour_of_day, lead_time_days,
+        historical_no_show_count and historical_no_show_rate added
     """
-    logger.info("Extracting time-based features...")
+    logger.info("Computing time-based and historical no-show features...")
     
-    df = appointments.copy()
-    
-    # Parse dates
-    df["appointmentdate"] = pd.to_datetime(df["appointmentdate"])
-    df["appointmentcreateddatetime"] = pd.to_datetime(df["appointmentcreateddatetime"])
-    df["appointmentscheduleddatetime"] = pd.to_datetime(df["appointmentscheduleddatetime"])
-    
-    # Day of week (Monday=0, Sunday=6)
-    df["day_of_week"] = df["appointmentdate"].dt.dayofweek
-    
-    # Hour of day from start time string (e.g., "09:30" -> 9)
-    df["hour_of_day"] = df["appointmentstarttime"].str.split(":").str[0].astype(int)
+    appointment_dates = appointments["appointmentdate"]
     
     # Lead time: days between scheduling and appointment
-    df["lead_time_days"] = (df["appointmentdate"] - df["appointmentscheduleddatetime"].dt.normalize()).dt.days
-    df["lead_time_days"] = df["lead_time_days"].clip(lower=0)  # Can't be negative
+    lead_time = appointment_dates - appointments["appointmentscheduleddatetime"].dt.normalize()
+    
+    # One stable sort by patient and date; same-day appointments keep their order
+    order = np.lexsort((appointment_dates.to_numpy(), appointments["patientid"].to_numpy()))
+    patient_ids = appointments["patientid"].to_numpy()[order]
+    no_show = appointments["no_show"].to_numpy()[order]
+    
+    # Position of the first appointment of each row's patient in sorted order
+    positions = np.arange(len(order))
+    is_first = np.ones(len(order), dtype=bool)
+    is_first[1:] = patient_ids[1:] != patient_ids[:-1]
+    patient_starts = np.maximum.accumulate(np.where(is_first, positions, 0))
+    
+    # For each appointment, compute stats from prior appointments only:
+    # running totals excluding the current row, minus those before the patient
+    prior_no_shows = np.cumsum(no_show) - no_show
+    cumulative_appointments = np.empty(len(appointments), dtype=np.int64)
+    cumulative_appointments[order] = positions - patient_starts
+    historical_no_show_count = np.empty(len(appointments), dtype=np.int32)
+    historical_no_show_count[order] = prior_no_shows - prior_no_shows[patient_starts]
+    
+    # Historical rate (avoid division by zero)
+    historical_no_show_rate = np.zeros(len(appointments), dtype=np.float32)
+    np.divide(
+        historical_no_show_count,
+        cumulative_appointments,
+        out=historical_no_show_rate,
+        where=cumulative_appointments > 0,
+        casting="unsafe",
+    )
     
-    return df[["appointmentid", "day_of_week", "hour_of_day", "lead_time_days"]]
+    return appointments.assign(
+        # Day of week (Monday=0, Sunday=6)
+        day_of_week=appointment_dates.dt.dayofweek,
+        # Hour of day from the zero-padded start time string (e.g., "09:30" -> 9)
+        hour_of_day=appointments["appointmentstarttime"].str.slice(0, 2).astype("int8"),
+        lead_time_days=lead_time.dt.days.clip(lower=0),  # Can't be negative
+        historical_no_show_count=historical_no_show_count,
+        historical_no_show_rate=historical_no_show_rate,
+    )
 
 
 def compute_patient_age_bucket(patients: pd.DataFrame) -> pd.DataFrame:
@@ -137,6 +219,40 @@ def compute_patient_age_bucket(patients: pd.DataFrame) -> pd.DataFrame:
     return df[["patientid"]].assign(patient_age_bucket="Unknown")
 
 
+def stratified_split_indices(
+    target: np.ndarray,
+    test_size: float = 0.2,
+    random_state: int = 42,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Positional train/test indices for a split stratified on the target.
+    
+    Each class contributes round(test_size * class size) rows to the test
+    set; both index arrays come back in shuffled order.
+    
+    Args:
+        target: Target values, one per row
+        test_size: Fraction for test split
+        random_state: Random seed for reproducibility
+        
+    Returns:
+        Tuple of (train, test) row positions
+    """
+    rng = np.random.default_rng(random_state)
+    classes, class_codes = np.unique(target, return_inverse=True)
+    
+    train_parts = []
+    test_parts = []
+    for code in range(len(classes)):
+        members = rng.permutation(np.flatnonzero(class_codes == code))
+        n_test = round(test_size * len(members))
+        test_parts.append(members[:n_test])
+        train_parts.append(members[n_test:])
+    
+    train_idx = rng.permutation(np.concatenate(train_parts)) if train_parts else np.empty(0, dtype=np.intp)
+    test_idx = rng.permutation(np.concatenate(test_parts)) if test_parts else np.empty(0, dtype=np.intp)
+    return train_idx, test_idx
+
+
 def prepare_ml_dataset(
     data_dir: Path,
     output_dir: Path,
@@ -151,101 +267,111 @@ def prepare_ml_dataset(
         test_size: Fraction for test split
         random_state: Random seed for reproducibility
     """
-    from sklearn.model_selection import train_test_split
+    today = pd.Timestamp.today().normalize()
     
-    # Load all tables
-    tables = load_synthetic_data(data_dir)
+    # Load only the columns the pipeline uses, and skip future appointments
+    # while reading, so the joins below never carry anything else
+    tables = load_synthetic_data(
+        data_dir,
+        columns=TABLE_COLUMNS,
+        filters={"appointments": [("appointmentdate", "<", today.date())]},
+    )
     
     if "appointments" not in tables:
         raise ValueError("appointments.parquet is required")
     
-    appointments = tables["appointments"].copy()
-    logger.info(f"Starting with {len(appointments):,} appointments")
+    appointments = tables["appointments"]
+    logger.info(f"Starting with {len(appointments):,} past appointments")
+    
+    # Status has a handful of values; as a categorical, the filter below copies
+    # small codes and the target comparison runs on them instead of strings
+    appointments["appointmentstatus"] = appointments["appointmentstatus"].astype("category")
     
     # Filter to past appointments only (can't train on future outcomes)
     appointments["appointmentdate"] = pd.to_datetime(appointments["appointmentdate"])
-    today = pd.Timestamp.today().normalize()
     appointments = appointments[appointments["appointmentdate"] < today].copy()
     logger.info(f"After filtering to past: {len(appointments):,} appointments")
     
     # Create target column
-    appointments["no_show"] = (appointments["appointmentstatus"] == "No Show").astype(int)
+    appointments["no_show"] = (appointments["appointmentstatus"] == "No Show").astype(np.int8)
     logger.info(f"No-show rate: {appointments['no_show'].mean():.1%}")
     
     # =========================================================================
     # Join with related tables
     # =========================================================================
     
+    # Narrow join keys on both sides so the merge hash tables are smaller;
+    # every dimension table is unique on its key (validate="m:1")
+    appointments = appointments.astype({key: JOIN_KEY_DTYPE for key in ("patientid", "providerid", "departmentid")})
+    
     # Join patients
     if "patients" in tables:
         patients = tables["patients"]
         # Select relevant patient columns
-        patient_cols = ["patientid"]
-        for col in ["patient_gender", "patient_age_bucket", "patient_race_ethnicity", 
-                    "patient_zip_code", "portal_last_login"]:
-            if col in patients.columns:
-                patient_cols.append(col)
+        patient_cols = available_columns(patients, TABLE_COLUMNS["patients"])
         
         appointments = appointments.merge(
-            patients[patient_cols],
+            patients[patient_cols].astype({"patientid": JOIN_KEY_DTYPE}),
             on="patientid",
-            how="left"
+            how="left",
+            validate="m:1",
+            sort=False,
+            copy=False,
         )
         logger.info(f"Joined patients: {len(appointments):,} rows")
         
         # Compute portal_engaged (login within 90 days of appointment)
         if "portal_last_login" in appointments.columns:
-            appointments["portal_last_login"] = pd.to_datetime(appointments["portal_last_login"], utc=True)
-            appointments["appointmentdate_tz"] = appointments["appointmentdate"].dt.tz_localize("UTC")
+            # Compare as naive UTC; a missing login gives NaN days, which is not engaged
+            portal_last_login = pd.to_datetime(appointments["portal_last_login"], utc=True).dt.tz_convert(None)
             appointments["portal_engaged"] = (
-                (appointments["appointmentdate_tz"] - appointments["portal_last_login"]).dt.days.abs() <= 90
-            ).fillna(False).astype(int)
-            appointments = appointments.drop(columns=["appointmentdate_tz"])
+                (appointments["appointmentdate"] - portal_last_login).dt.days.abs() <= 90
+            ).astype(np.int8)
         else:
-            appointments["portal_engaged"] = 0
+            appointments["portal_engaged"] = np.int8(0)
     
     # Join insurance
     if "insurance" in tables:
         insurance = tables["insurance"]
-        insurance_cols = ["patientid"]
-        for col in ["sipg2", "sipg1"]:
-            if col in insurance.columns:
-                insurance_cols.append(col)
+        insurance_cols = available_columns(insurance, TABLE_COLUMNS["insurance"])
         
         appointments = appointments.merge(
-            insurance[insurance_cols],
+            insurance[insurance_cols].astype({"patientid": JOIN_KEY_DTYPE}),
             on="patientid",
-            how="left"
+            how="left",
+            validate="m:1",
+            sort=False,
+            copy=False,
         )
         logger.info(f"Joined insurance: {len(appointments):,} rows")
     
     # Join providers
     if "providers" in tables:
         providers = tables["providers"]
-        provider_cols = ["providerid"]
-        for col in ["providertype", "provider_specialty"]:
-            if col in providers.columns:
-                provider_cols.append(col)
+        provider_cols = available_columns(providers, TABLE_COLUMNS["providers"])
         
         appointments = appointments.merge(
-            providers[provider_cols],
+            providers[provider_cols].astype({"providerid": JOIN_KEY_DTYPE}),
             on="providerid",
-            how="left"
+            how="left",
+            validate="m:1",
+            sort=False,
+            copy=False,
         )
         logger.info(f"Joined providers: {len(appointments):,} rows")
     
     # Join departments
     if "departments" in tables:
         departments = tables["departments"]
-        dept_cols = ["departmentid"]
-        for col in ["departmentspecialty", "placeofservicetype", "market"]:
-            if col in departments.columns:
-                dept_cols.append(col)
+        dept_cols = available_columns(departments, TABLE_COLUMNS["departments"])
         
         appointments = appointments.merge(
-            departments[dept_cols],
+            departments[dept_cols].astype({"departmentid": JOIN_KEY_DTYPE}),
             on="departmentid",
-            how="left"
+            how="left",
+            validate="m:1",
+            sort=False,
+            copy=False,
         )
         logger.info(f"Joined departments: {len(appointments):,} rows")
     
@@ -253,17 +379,8 @@ def prepare_ml_dataset(
     # Compute derived features
     # =========================================================================
     
-    # Time features
-    time_features = extract_time_features(appointments)
-    appointments = appointments.merge(time_features, on="appointmentid", how="left")
-    
-    # Historical no-show features (computed per patient from prior appointments)
-    history_features = compute_historical_no_show_features(appointments)
-    appointments = appointments.merge(
-        history_features[["appointmentid", "historical_no_show_count", "historical_no_show_rate"]],
-        on="appointmentid",
-        how="left"
-    )
+    # Time and historical no-show features (history per patient from prior appointments)
+    appointments = compute_all_features(appointments)
     
     # =========================================================================
     # Select final feature set
@@ -303,7 +420,7 @@ def prepare_ml_dataset(
     target_column = "no_show"
     
     # Keep only available features
-    available_features = [f for f in feature_columns if f in appointments.columns]
+    available_features = available_columns(appointments, feature_columns)
     missing_features = set(feature_columns) - set(available_features)
     
     if missing_features:
@@ -317,12 +434,20 @@ def prepare_ml_dataset(
     # Drop rows with missing target
     df_final = df_final.dropna(subset=[target_column])
     
-    # Fill missing values for features
-    for col in df_final.columns:
-        if df_final[col].dtype == "object":
-            df_final[col] = df_final[col].fillna("Unknown")
-        else:
-            df_final[col] = df_final[col].fillna(0)
+    # Fill missing values for features in one pass: "Unknown" for strings and
+    # categoricals (enum columns arrive dictionary-encoded), 0 otherwise
+    string_cols = df_final.select_dtypes(include=["object", "category"]).columns
+    other_cols = df_final.select_dtypes(exclude=["object", "category"]).columns
+    for col in df_final.select_dtypes(include="category").columns:
+        if "Unknown" not in df_final[col].cat.categories:
+            df_final[col] = df_final[col].cat.add_categories("Unknown")
+    df_final.fillna({col: "Unknown" for col in string_cols} | {col: 0 for col in other_cols}, inplace=True)
+    
+    # Compact dtypes: categorical codes instead of per-row strings ("Unknown" is
+    # already filled in), and int16 for day counts and durations in minutes
+    compact_dtypes = {col: "category" for col in CATEGORICAL_FEATURES}
+    compact_dtypes |= {"lead_time_days": np.int16, "appointmentduration": np.int16}
+    df_final = df_final.astype({col: compact_dtypes[col] for col in available_columns(df_final, compact_dtypes)})
     
     logger.info(f"Final dataset: {len(df_final):,} rows, {len(df_final.columns)} columns")
     logger.info(f"Final no-show rate: {df_final[target_column].mean():.1%}")
@@ -331,15 +456,14 @@ def prepare_ml_dataset(
     # Train/test split
     # =========================================================================
     
-    train_df, test_df = train_test_split(
-        df_final,
+    train_idx, test_idx = stratified_split_indices(
+        df_final[target_column].to_numpy(),
         test_size=test_size,
         random_state=random_state,
-        stratify=df_final[target_column],
     )
     
-    logger.info(f"Training set: {len(train_df):,} rows")
-    logger.info(f"Test set: {len(test_df):,} rows")
+    logger.info(f"Training set: {len(train_idx):,} rows")
+    logger.info(f"Test set: {len(test_idx):,} rows")
     
     # =========================================================================
     # Save outputs
@@ -350,8 +474,11 @@ def prepare_ml_dataset(
     train_path = output_dir / "train.parquet"
     test_path = output_dir / "test.parquet"
     
-    train_df.to_parquet(train_path, index=False)
-    test_df.to_parquet(test_path, index=False)
+    # Convert to Arrow once and write each side as a take of that table,
+    # instead of slicing two pandas frames and converting each of them
+    table = pa.Table.from_pandas(df_final, preserve_index=False)
+    pq.write_table(table.take(train_idx), train_path, **PARQUET_WRITE_OPTIONS)
+    pq.write_table(table.take(test_idx), test_path, **PARQUET_WRITE_OPTIONS)
     
     logger.info(f"Saved training data to {train_path}")
     logger.info(f"Saved test data to {test_path}")
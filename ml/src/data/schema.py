@@ -12,6 +12,22 @@ from typing import Optional
 from uuid import UUID, uuid4
 
 
+class CodedEnum(str, Enum):
+    """String enum whose members also carry a dense integer code.
+
+    Codes follow declaration order, so they can index NumPy lookup tables
+    while the string values stay what is stored and exported.
+    """
+
+    code: int
+
+    def __new__(cls, value: str):
+        member = str.__new__(cls, value)
+        member._value_ = value
+        member.code = len(cls.__members__)
+        return member
+
+
 class Gender(str, Enum):
     """Patient gender options."""
 
@@ -20,7 +36,7 @@ class Gender(str, Enum):
     OTHER = "Other"
 
 
-class AgeBucket(str, Enum):
+class AgeBucket(CodedEnum):
     """Patient age range categories."""
 
     PEDIATRIC = "0-17"
@@ -39,7 +55,7 @@ class ProviderType(str, Enum):
     MEDICAL_ASSISTANT = "MA"
 
 
-class AppointmentStatus(str, Enum):
+class AppointmentStatus(CodedEnum):
     """Appointment status values from EHR systems."""
 
     SCHEDULED = "Scheduled"
@@ -51,7 +67,7 @@ class AppointmentStatus(str, Enum):
     RESCHEDULED = "Rescheduled"
 
 
-class VirtualFlag(str, Enum):
+class VirtualFlag(CodedEnum):
     """Appointment modality classification."""
 
     NON_VIRTUAL = "Non-Virtual"
@@ -59,7 +75,7 @@ class VirtualFlag(str, Enum):
     VIRTUAL_TELEPHONE = "Virtual-Telephone"
 
 
-class NewPatientFlag(str, Enum):
+class NewPatientFlag(CodedEnum):
     """Patient type for the appointment."""
 
     NEW_PATIENT = "NEW PATIENT"
@@ -109,7 +125,7 @@ class Priority(str, Enum):
     LOW = "Low"
 
 
-class PayerGrouping(str, Enum):
+class PayerGrouping(CodedEnum):
     """Insurance payer groupings (SIPG2)."""
 
     COMMERCIAL = "Commercial"
@@ -118,7 +134,7 @@ class PayerGrouping(str, Enum):
     SELF_PAY = "Self-Pay"
 
 
-@dataclass
+@dataclass(slots=True)
 class Patient:
     """Represents a patient with demographic and behavioral attributes."""
 
@@ -150,7 +166,7 @@ class Patient:
         return days_since_login <= 90
 
 
-@dataclass
+@dataclass(slots=True)
 class Provider:
     """Represents a healthcare provider."""
 
@@ -174,7 +190,7 @@ class Provider:
         return f"{self.providerfirstname} {self.providerlastname}, {self.provider_specialty}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Department:
     """Represents a clinic/department location."""
 
@@ -193,7 +209,7 @@ class Department:
     business_unit: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Insurance:
     """Represents patient insurance information."""
 
@@ -205,7 +221,7 @@ class Insurance:
     insurance_group_id: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Appointment:
     """Represents a scheduled medical appointment.
 
@@ -253,8 +269,9 @@ class Appointment:
     @property
     def appointmentdatetime(self) -> datetime:
         """Combined appointment date and start time."""
-        hour, minute = map(int, self.appointmentstarttime.split(":"))
-        return datetime.combine(self.appointmentdate, datetime.min.time().replace(hour=hour, minute=minute))
+        hour, _, minute = self.appointmentstarttime.partition(":")
+        appt_date = self.appointmentdate
+        return datetime(appt_date.year, appt_date.month, appt_date.day, int(hour), int(minute))
 
     @property
     def lead_time_days(self) -> int:
@@ -272,7 +289,7 @@ class Appointment:
     @property
     def hour_of_day(self) -> int:
         """Hour of appointment (0-23)."""
-        return int(self.appointmentstarttime.split(":")[0])
+        return int(self.appointmentstarttime.partition(":")[0])
 
     @property
     def is_past(self) -> bool:
@@ -287,17 +304,18 @@ class Appointment:
         """Determine if appointment was a no-show."""
         if self.appointmentstatus == AppointmentStatus.NO_SHOW:
             return True
-        # Past scheduled appointment with no check-in
+        # Past scheduled appointment with no check-in (cheap checks first, so
+        # the datetime is only built for scheduled appointments)
         if (
-            self.is_past
-            and self.appointmentstatus == AppointmentStatus.SCHEDULED
+            self.appointmentstatus == AppointmentStatus.SCHEDULED
             and self.appointmentcheckindatetime is None
+            and self.is_past
         ):
             return True
         return False
 
 
-@dataclass
+@dataclass(slots=True)
 class RiskFactor:
     """Represents a contributing factor to a prediction."""
 
@@ -307,7 +325,7 @@ class RiskFactor:
     direction: RiskDirection
 
 
-@dataclass
+@dataclass(slots=True)
 class Prediction:
     """Represents an ML model prediction for an appointment."""
 
@@ -330,7 +348,7 @@ class Prediction:
             return RiskLevel.HIGH
 
 
-@dataclass
+@dataclass(slots=True)
 class Recommendation:
     """Represents a suggested action based on prediction analysis."""
 
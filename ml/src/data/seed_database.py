@@ -7,12 +7,22 @@ Uses credential-less authentication via DefaultAzureCredential.
 import argparse
 import logging
 import os
+import queue
 import struct
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
+from typing import Any, Iterable, Iterator
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 import pyodbc
 from azure.identity import DefaultAzureCredential
 
@@ -33,8 +43,9 @@ logger = logging.getLogger(__name__)
 # =============================================================================
 
 
+@lru_cache(maxsize=None)
 def get_odbc_driver() -> str:
-    """Get the best available ODBC driver for SQL Server.
+    """Get the best available ODBC driver for SQL Server (looked up once).
 
     Returns:
         ODBC driver name string
@@ -73,15 +84,32 @@ def get_connection_string(server: str, database: str) -> str:
     )
 
 
+# Credential and last token are shared by every connection (including
+# reconnects from worker threads); the token is refreshed shortly before expiry
+_credential: DefaultAzureCredential | None = None
+_token_cache = {"token": None, "expires_on": 0}
+_token_lock = threading.Lock()
+TOKEN_REFRESH_MARGIN_SECONDS = 300
+
+
 def get_access_token_struct() -> bytes:
     """Get access token for Azure SQL Database as pyodbc-compatible struct.
 
+    The token is cached and reused until five minutes before it expires.
+
     Returns:
         Token bytes in the format expected by pyodbc attrs_before
     """
-    credential = DefaultAzureCredential()
-    token = credential.get_token("https://database.windows.net/.default")
-    token_bytes = token.token.encode("utf-16-le")
+    global _credential
+    with _token_lock:
+        if time.time() > _token_cache["expires_on"] - TOKEN_REFRESH_MARGIN_SECONDS:
+            if _credential is None:
+                _credential = DefaultAzureCredential()
+            access_token = _credential.get_token("https://database.windows.net/.default")
+            _token_cache["token"] = access_token.token
+            _token_cache["expires_on"] = access_token.expires_on
+        token = _token_cache["token"]
+    token_bytes = token.encode("utf-16-le")
     # Pack as 4-byte little-endian length prefix + token bytes
     return struct.pack("<I", len(token_bytes)) + token_bytes
 
@@ -102,43 +130,76 @@ def create_connection(server: str, database: str) -> pyodbc.Connection:
     # SQL_COPT_SS_ACCESS_TOKEN = 1256
     connection = pyodbc.connect(connection_string, attrs_before={1256: token_struct})
     connection.autocommit = False
+    # Suppress the "rows affected" message the server sends back for every statement
+    connection.cursor().execute("SET NOCOUNT ON").close()
     return connection
 
 
+def create_connection_pool(server: str, database: str, size: int) -> list[pyodbc.Connection]:
+    """Open `size` independent connections for concurrent table loads.
+
+    Args:
+        server: SQL Server hostname
+        database: Database name
+        size: Number of connections to open
+
+    Returns:
+        List of pyodbc Connection objects
+    """
+    return [create_connection(server, database) for _ in range(size)]
+
+
 # =============================================================================
 # Data Loading
 # =============================================================================
 
 
-def load_parquet_files(data_dir: Path) -> dict[str, pd.DataFrame]:
-    """Load all parquet files from the data directory.
+PARQUET_FILES = {
+    "patients": "patients.parquet",
+    "providers": "providers.parquet",
+    "departments": "departments.parquet",
+    "insurance": "insurance.parquet",
+    "appointments": "appointments.parquet",
+}
+
+
+def parquet_paths(data_dir: Path) -> dict[str, Path]:
+    """Resolve the parquet file for every entity, failing early if any is missing.
 
     Args:
         data_dir: Path to directory containing parquet files
 
     Returns:
-        Dictionary mapping table names to DataFrames
+        Dictionary mapping table names to parquet paths
     """
     data_dir = Path(data_dir)
-    files = {
-        "patients": "patients.parquet",
-        "providers": "providers.parquet",
-        "departments": "departments.parquet",
-        "insurance": "insurance.parquet",
-        "appointments": "appointments.parquet",
-    }
-
-    dataframes = {}
-    for table_name, filename in files.items():
-        filepath = data_dir / filename
-        if filepath.exists():
-            logger.info(f"Loading {filepath}...")
-            dataframes[table_name] = pd.read_parquet(filepath)
-            logger.info(f"  Loaded {len(dataframes[table_name]):,} records")
-        else:
+    paths = {table_name: data_dir / filename for table_name, filename in PARQUET_FILES.items()}
+    for filepath in paths.values():
+        if not filepath.exists():
             raise FileNotFoundError(f"Required file not found: {filepath}")
+    return paths
+
+
+def parquet_batches(
+    parquet_file: pq.ParquetFile, table_name: str, batch_size: int = 50_000
+) -> Iterator[pd.DataFrame]:
+    """Stream a parquet file as DataFrames of at most `batch_size` rows.
 
-    return dataframes
+    Only the columns that get inserted into `table_name` are read, and only
+    one batch is held in memory at a time.
+
+    Args:
+        parquet_file: Open parquet file
+        table_name: Target SQL table name
+        batch_size: Number of records per yielded DataFrame
+
+    Yields:
+        DataFrames with the insertable columns present in the file
+    """
+    available = set(parquet_file.schema_arrow.names)
+    columns = [c for c in TABLE_COLUMNS[table_name] if c in available]
+    for batch in parquet_file.iter_batches(batch_size=batch_size, columns=columns):
+        yield batch.to_pandas()
 
 
 # =============================================================================
@@ -223,6 +284,29 @@ TABLE_COLUMNS = {
     ],
 }
 
+# SQL Server accepts at most 2100 parameters per statement
+MAX_SQL_PARAMETERS = 2100
+
+# Tables with at least this many rows are bulk inserted through OPENJSON
+BULK_COPY_MIN_ROWS = 10_000
+
+# Tables whose secondary indexes are disabled during the load and rebuilt after
+INDEX_REBUILD_TABLES = frozenset({"Appointments"})
+
+# Tables loaded through a staging heap and moved over with INSERT ... SELECT
+STAGED_TABLES = frozenset({"Appointments"})
+
+# Insert stages: tables within a stage can load concurrently; each stage only
+# references tables from earlier stages. Appointments has a foreign key to
+# Insurance (FK_Appointments_Insurance), but primarypatientinsuranceid is not
+# in TABLE_COLUMNS["Appointments"], so it is always NULL and never checked.
+# Loading that column would require moving appointments into a later stage.
+LOAD_STAGES = [
+    ("departments", "providers"),
+    ("patients",),
+    ("insurance", "appointments"),
+]
+
 # Parquet file to SQL table name mapping
 PARQUET_TO_TABLE = {
     "departments": "Departments",
@@ -241,8 +325,11 @@ PARQUET_TO_TABLE = {
 def truncate_tables(connection: pyodbc.Connection) -> None:
     """Truncate all tables before loading fresh data.
 
-    Uses DELETE with foreign key handling instead of TRUNCATE
-    to work around FK constraints.
+    TRUNCATE is refused on any table referenced by a foreign key, even a
+    disabled one, so the foreign keys between the tables are read from
+    sys.foreign_keys, dropped, and re-created around the truncates in one
+    transaction. If that fails (e.g. the identity lacks ALTER permission),
+    the transaction is rolled back and the tables are cleared with DELETE.
     """
     cursor = connection.cursor()
 
@@ -257,6 +344,38 @@ def truncate_tables(connection: pyodbc.Connection) -> None:
     ]
 
     logger.info("Clearing existing data...")
+    try:
+        table_list = ", ".join(f"'{table}'" for table in tables_to_clear)
+        cursor.execute(f"""
+            SELECT
+                fk.name,
+                OBJECT_NAME(fk.parent_object_id),
+                COL_NAME(fkc.parent_object_id, fkc.parent_column_id),
+                OBJECT_NAME(fk.referenced_object_id),
+                COL_NAME(fkc.referenced_object_id, fkc.referenced_column_id)
+            FROM sys.foreign_keys fk
+            JOIN sys.foreign_key_columns fkc ON fkc.constraint_object_id = fk.object_id
+            WHERE OBJECT_NAME(fk.referenced_object_id) IN ({table_list})
+        """)
+        foreign_keys = cursor.fetchall()
+
+        for name, table, _, _, _ in foreign_keys:
+            cursor.execute(f"ALTER TABLE dbo.{table} DROP CONSTRAINT {name}")
+        for table in tables_to_clear:
+            cursor.execute(f"TRUNCATE TABLE dbo.{table}")
+        for name, table, column, ref_table, ref_column in foreign_keys:
+            cursor.execute(
+                f"ALTER TABLE dbo.{table} WITH CHECK ADD CONSTRAINT {name} "
+                f"FOREIGN KEY ({column}) REFERENCES dbo.{ref_table}({ref_column})"
+            )
+        connection.commit()
+        logger.info(f"  Truncated {', '.join(tables_to_clear)}")
+        cursor.close()
+        return
+    except pyodbc.Error as e:
+        logger.warning(f"  TRUNCATE failed, falling back to DELETE: {e}")
+        connection.rollback()
+
     for table in tables_to_clear:
         try:
             cursor.execute(f"DELETE FROM dbo.{table}")
@@ -269,61 +388,182 @@ def truncate_tables(connection: pyodbc.Connection) -> None:
     cursor.close()
 
 
-def prepare_dataframe(df: pd.DataFrame, table_name: str) -> pd.DataFrame:
-    """Prepare DataFrame for insertion by handling computed columns and type conversions.
+def project_dataframe(df: pd.DataFrame, table_name: str) -> pd.DataFrame:
+    """Select the columns to insert into a table, deriving computed columns.
 
     Args:
         df: Input DataFrame
         table_name: Target SQL table name
 
     Returns:
-        Prepared DataFrame with only columns that should be inserted
+        DataFrame with only columns that should be inserted
     """
-    df = df.copy()
+    # Derived columns are computed into a dict so the input frame is never copied or mutated
+    derived = {}
 
     # Handle appointments specially - create appointmentdatetime from date + time
+    # as datetime64 arithmetic, without building or parsing datetime strings
     if table_name == "Appointments":
-        df["appointmentstarttime"] = df["appointmentstarttime"].astype(str)
-        df["appointmentdate_str"] = df["appointmentdate"].astype(str)
-        df["appointmentdatetime"] = pd.to_datetime(
-            df["appointmentdate_str"] + " " + df["appointmentstarttime"],
-            format="%Y-%m-%d %H:%M",
-            errors="coerce",
+        dates = pa.array(df["appointmentdate"])
+        # Start times are fixed-width HH:MM; read the characters as UTF-32 code
+        # points (one extra slot, so longer strings aren't silently truncated)
+        start = df["appointmentstarttime"].to_numpy(dtype="U6")
+        codes = start.view(np.uint32).reshape(-1, 6).astype(np.int64)
+        digits = codes[:, [0, 1, 3, 4]] - ord("0")
+        hours = digits[:, 0] * 10 + digits[:, 1]
+        minutes = digits[:, 2] * 10 + digits[:, 3]
+        # Anything else (None, non-digits, out-of-range times) becomes NULL,
+        # as unparseable values always have
+        valid = (
+            ((digits >= 0) & (digits <= 9)).all(axis=1)
+            & (codes[:, 2] == ord(":"))
+            & (codes[:, 5] == 0)
+            & (hours < 24)
+            & (minutes < 60)
         )
+        datetimes = (
+            dates.to_numpy(zero_copy_only=False).astype("datetime64[s]")
+            + (hours * 3600 + minutes * 60).astype("timedelta64[s]")
+        )
+        datetimes[~valid] = np.datetime64("NaT")
+        derived["appointmentdatetime"] = datetimes
         # Convert appointmentdate to string format SQL expects
-        df["appointmentdate"] = df["appointmentdate"].astype(str)
+        derived["appointmentdate"] = pc.cast(dates, pa.string()).to_numpy(zero_copy_only=False)
 
     # Filter to only columns that exist in both parquet and table definition
     expected_cols = TABLE_COLUMNS.get(table_name, [])
-    available_cols = [c for c in expected_cols if c in df.columns]
-    df = df[available_cols]
+    available_cols = [c for c in expected_cols if c in derived or c in df.columns]
+    return pd.DataFrame(
+        {c: derived[c] if c in derived else df[c] for c in available_cols},
+        index=df.index,
+        copy=False,
+    )
+
+
+def prepare_dataframe(df: pd.DataFrame, table_name: str) -> pd.DataFrame:
+    """Prepare DataFrame for insertion by handling computed columns and type conversions.
+
+    Args:
+        df: Input DataFrame
+        table_name: Target SQL table name
+
+    Returns:
+        Prepared DataFrame with only columns that should be inserted
+    """
+    df = project_dataframe(df, table_name)
+
+    # Only columns with missing values become object columns, holding None for
+    # SQL NULL; the rest keep their dtype, and tolist() turns either kind into
+    # Python scalars (no numpy int64) for pyodbc
+    nulls = {
+        col: df[col].astype(object).where(df[col].notna(), None)
+        for col in df.columns
+        if df[col].hasnans
+    }
+    return df.assign(**nulls) if nulls else df
 
-    # Replace NaN with None for SQL
-    df = df.replace({np.nan: None, pd.NaT: None})
 
-    # Convert numpy int64 to Python int for pyodbc compatibility
+def dataframe_to_json_rows(df: pd.DataFrame) -> str:
+    """Serialize DataFrame rows as a JSON array of arrays for OPENJSON.
+
+    Values are written so that SQL Server's implicit conversion from the
+    JSON_VALUE text accepts them: integral float columns (nullable integers
+    read from parquet) as integers, and timestamps as naive UTC ISO strings.
+    Missing values become JSON null.
+    """
+    converted = {}
     for col in df.columns:
-        if df[col].dtype == "int64":
-            df[col] = df[col].astype(object).where(df[col].notna(), None)
+        series = df[col]
+        if isinstance(series.dtype, pd.DatetimeTZDtype):
+            converted[col] = series.dt.tz_convert(None)
+        elif series.dtype.kind == "f":
+            values = series.dropna()
+            if (values == np.floor(values)).all():
+                converted[col] = series.astype("Int64")
+    if converted:
+        df = df.assign(**converted)
+    return df.to_json(orient="values", date_format="iso", date_unit="us")
+
+
+def prefetch(items: Iterable[Any], maxsize: int = 2) -> Iterator[Any]:
+    """Produce `items` on a background thread, up to `maxsize` ahead of the consumer.
+
+    Overlaps the CPU work of building items (parquet reads, conversions)
+    with whatever the consumer blocks on. Exceptions raised while producing
+    are re-raised in the consumer; if the consumer stops early, the producer
+    is told to stop at its next item.
 
-    return df
+    Args:
+        items: Iterable to produce
+        maxsize: Number of produced items that may wait in the queue
 
+    Yields:
+        The items, in order
+    """
+    buffer: queue.Queue = queue.Queue(maxsize=maxsize)
+    done = object()
+    stop = threading.Event()
 
-def insert_dataframe(
+    def put(item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for item in items:
+                if not put((item, None)):
+                    return
+            put((done, None))
+        except BaseException as e:
+            put((done, e))
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    try:
+        while True:
+            item, error = buffer.get()
+            if error is not None:
+                raise error
+            if item is done:
+                return
+            yield item
+    finally:
+        stop.set()
+        producer.join()
+
+
+def execute_batches(
     connection: pyodbc.Connection,
-    df: pd.DataFrame,
-    table_name: str,
-    batch_size: int = 100,
+    batches: Iterable[tuple[int, list[tuple[str, Any, bool]]]],
+    total: int,
+    commit_every: int = 100_000,
     server: str = "",
     database: str = "",
 ) -> tuple[int, pyodbc.Connection]:
-    """Insert DataFrame records into a SQL table using fast_executemany.
+    """Execute batches of statements inside transactions of `commit_every` rows.
+
+    The connection runs with autocommit off, so every statement joins the
+    open transaction until it is committed. If the connection drops, the
+    server rolls that transaction back, so all batches since the last commit
+    are replayed on the new connection.
+
+    Each distinct statement text gets its own cursor, so a full-size
+    multi-row INSERT and the single-row INSERT for remainders each stay
+    prepared instead of being re-prepared whenever they alternate.
 
     Args:
         connection: Database connection
-        df: DataFrame to insert
-        table_name: Target table name
-        batch_size: Number of records per batch
+        batches: (row count, statements) per batch; each statement is
+            (sql, parameters, many), run with executemany over a list of
+            parameter tuples when `many` is set, else with execute
+        total: Total number of records across all batches
+        commit_every: Commit once at least this many rows are pending; the
+            rest is committed at the end
         server: SQL Server hostname (for reconnection)
         database: Database name (for reconnection)
 
@@ -331,34 +571,42 @@ def insert_dataframe(
         Tuple of (number of records inserted, connection) — connection may be
         refreshed if the original was dropped by the server.
     """
-    cursor = connection.cursor()
-    cursor.fast_executemany = True  # Critical for performance!
+    cursors: dict[str, pyodbc.Cursor] = {}
 
-    # Prepare DataFrame
-    df = prepare_dataframe(df, table_name)
+    def cursor_for(sql: str) -> pyodbc.Cursor:
+        if sql not in cursors:
+            cursor = connection.cursor()
+            cursor.fast_executemany = True  # Critical for performance!
+            cursors[sql] = cursor
+        return cursors[sql]
 
-    # Build parameterized INSERT statement
-    cols = list(df.columns)
-    placeholders = ", ".join(["?" for _ in cols])
-    column_list = ", ".join(cols)
-    insert_sql = f"INSERT INTO dbo.{table_name} ({column_list}) VALUES ({placeholders})"
-
-    # Convert DataFrame to list of tuples, handling NaN properly
-    rows = [tuple(None if pd.isna(v) else v for v in row) for row in df.values]
-
-    total = len(rows)
-    inserted = 0
+    committed = 0
+    pending: list[tuple[int, list[tuple[str, Any, bool]]]] = []
     max_retries = 3
 
-    for i in range(0, total, batch_size):
-        batch = rows[i : i + batch_size]
+    def run(statements: list[tuple[str, Any, bool]]) -> None:
+        for sql, params, many in statements:
+            if many:
+                cursor_for(sql).executemany(sql, params)
+            else:
+                cursor_for(sql).execute(sql, params)
+
+    def flush() -> None:
+        nonlocal committed
+        connection.commit()
+        committed += sum(count for count, _ in pending)
+        pending.clear()
+        logger.info(f"    Progress: {committed:,}/{total:,} ({100 * committed // total}%)")
+
+    # Batches are read and converted on a producer thread while this one waits on the server
+    for batch in prefetch(batches):
+        pending.append(batch)
+        # First attempt runs the new batch; retries replay the whole open transaction
+        to_run = [batch]
         for attempt in range(max_retries):
             try:
-                cursor.executemany(insert_sql, batch)
-                connection.commit()
-                inserted += len(batch)
-                if inserted % 1000 == 0 or inserted == total:
-                    logger.info(f"    Progress: {inserted:,}/{total:,} ({100 * inserted // total}%)")
+                for _, statements in to_run:
+                    run(statements)
                 break
             except pyodbc.Error as e:
                 error_code = getattr(e, 'args', [('',)])[0] if e.args else ''
@@ -366,72 +614,425 @@ def insert_dataframe(
                     code in str(error_code) for code in ['08S01', '08001', '01000']
                 )
                 if is_connection_error and attempt < max_retries - 1 and server:
-                    logger.warning(f"    Connection lost at offset {i}, reconnecting (attempt {attempt + 2}/{max_retries})...")
-                    import time
+                    logger.warning(f"    Connection lost after {committed} committed rows, reconnecting (attempt {attempt + 2}/{max_retries})...")
                     time.sleep(5 * (attempt + 1))
                     try:
-                        connection = create_connection(server, database)
-                        cursor = connection.cursor()
-                        cursor.fast_executemany = True
+                        fresh = create_connection(server, database)
+                        # Release the dropped connection's handles before replacing it
+                        for handle in [*cursors.values(), connection]:
+                            try:
+                                handle.close()
+                            except Exception:
+                                pass
+                        connection = fresh
+                        cursors.clear()
+                        to_run = list(pending)
                         continue
                     except Exception as reconnect_err:
                         logger.error(f"    Reconnection failed: {reconnect_err}")
-                logger.error(f"Error inserting batch at offset {i}: {e}")
-                logger.error(f"Columns: {cols}")
+                logger.error(f"Error inserting batch after {committed} committed rows: {e}")
+                logger.error(f"Statement: {batch[1][0][0][:200]}")
                 try:
                     connection.rollback()
                 except Exception:
                     pass
                 raise
+        if sum(count for count, _ in pending) >= commit_every:
+            flush()
+
+    if pending:
+        flush()
+
+    for cursor in cursors.values():
+        cursor.close()
+    return committed, connection
+
+
+@lru_cache(maxsize=None)
+def values_insert_sql(table_name: str, cols: tuple[str, ...], rows: int) -> str:
+    """Build a parameterized INSERT with `rows` VALUES rows for the given columns."""
+    values_clause = "(" + ", ".join(["?"] * len(cols)) + ")"
+    return f"INSERT INTO dbo.{table_name} ({', '.join(cols)}) VALUES " + ", ".join([values_clause] * rows)
+
+
+def insert_frames(
+    connection: pyodbc.Connection,
+    frames: Iterable[pd.DataFrame],
+    table_name: str,
+    total: int,
+    batch_size: int = 10_000,
+    commit_every: int = 100_000,
+    server: str = "",
+    database: str = "",
+    target_table: str | None = None,
+) -> tuple[int, pyodbc.Connection]:
+    """Insert DataFrame records into a SQL table using multi-row VALUES statements.
+
+    Rows are grouped into INSERT statements carrying as many VALUES rows as
+    fit under SQL Server's 2100-parameter limit, and the groups of a batch
+    are sent with fast_executemany. Rows left over at the end of a batch go
+    through the single-row statement.
+
+    Args:
+        connection: Database connection
+        frames: DataFrames to insert, consumed one at a time
+        table_name: Target table name
+        total: Total number of records across all frames
+        batch_size: Number of records per executemany round
+        commit_every: Number of records per transaction
+        server: SQL Server hostname (for reconnection)
+        database: Database name (for reconnection)
+        target_table: Table to insert into, if not `table_name` itself
+            (e.g. its staging table)
+
+    Returns:
+        Tuple of (number of records inserted, connection) — connection may be
+        refreshed if the original was dropped by the server.
+    """
+    target = target_table or table_name
+
+    def statements(df: pd.DataFrame) -> Iterator[tuple[int, list[tuple[str, Any, bool]]]]:
+        df = prepare_dataframe(df, table_name)
+
+        # Build parameterized INSERT statements for one row and for a full group
+        cols = list(df.columns)
+        rows_per_stmt = max(1, MAX_SQL_PARAMETERS // len(cols) - 1)
+        single_sql = values_insert_sql(target, tuple(cols), 1)
+        multi_sql = values_insert_sql(target, tuple(cols), rows_per_stmt)
+
+        # Rows are zipped from per-column lists, so no row-major object array
+        # is built; prepare_dataframe already replaced missing values with None
+        rows = list(zip(*(df[col].tolist() for col in df.columns)))
+
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start : start + batch_size]
+            full = len(batch) - len(batch) % rows_per_stmt
+            groups = [
+                tuple(chain.from_iterable(batch[i : i + rows_per_stmt]))
+                for i in range(0, full, rows_per_stmt)
+            ]
+            stmts = [(multi_sql, groups, True)] if groups else []
+            if full < len(batch):
+                stmts.append((single_sql, batch[full:], True))
+            yield len(batch), stmts
+
+    batches = chain.from_iterable(statements(df) for df in frames)
+    return execute_batches(
+        connection, batches, total, commit_every, server=server, database=database,
+    )
+
+
+def bulk_copy_frames(
+    connection: pyodbc.Connection,
+    frames: Iterable[pd.DataFrame],
+    table_name: str,
+    total: int,
+    commit_every: int = 100_000,
+    server: str = "",
+    database: str = "",
+    target_table: str | None = None,
+) -> tuple[int, pyodbc.Connection]:
+    """Bulk insert DataFrame records into a SQL table through OPENJSON.
+
+    Each frame is sent as a single JSON document parameter and inserted
+    set-based on the server, so rows are neither bound nor sent one
+    parameter set at a time.
 
+    Args:
+        connection: Database connection
+        frames: DataFrames to insert, one JSON document each
+        table_name: Target table name
+        total: Total number of records across all frames
+        commit_every: Number of records per transaction
+        server: SQL Server hostname (for reconnection)
+        database: Database name (for reconnection)
+        target_table: Table to insert into, if not `table_name` itself
+            (e.g. its staging table)
+
+    Returns:
+        Tuple of (number of records inserted, connection) — connection may be
+        refreshed if the original was dropped by the server.
+    """
+    target = target_table or table_name
+
+    def statements(df: pd.DataFrame) -> tuple[int, list[tuple[str, Any, bool]]]:
+        df = project_dataframe(df, table_name)
+
+        # Row i of the document is a JSON array holding the values in column order
+        cols = list(df.columns)
+        column_list = ", ".join(cols)
+        values = ", ".join(f"JSON_VALUE(r.[value], '$[{i}]')" for i in range(len(cols)))
+        insert_sql = f"INSERT INTO dbo.{target} ({column_list}) SELECT {values} FROM OPENJSON(?) AS r"
+        return len(df), [(insert_sql, dataframe_to_json_rows(df), False)]
+
+    batches = (statements(df) for df in frames)
+    return execute_batches(
+        connection, batches, total, commit_every, server=server, database=database,
+    )
+
+
+def disable_indexes(connection: pyodbc.Connection, table_name: str) -> list[str]:
+    """Disable the non-clustered indexes of a table ahead of a bulk load.
+
+    Primary key and unique constraint indexes stay enabled: disabling them
+    would also disable the foreign keys that reference them.
+
+    Args:
+        connection: Database connection
+        table_name: Table whose indexes to disable
+
+    Returns:
+        Names of the disabled indexes, for rebuild_indexes
+    """
+    cursor = connection.cursor()
+    cursor.execute(
+        """
+        SELECT name
+        FROM sys.indexes
+        WHERE object_id = OBJECT_ID(?)
+          AND type = 2
+          AND is_primary_key = 0
+          AND is_unique_constraint = 0
+          AND is_disabled = 0
+        """,
+        f"dbo.{table_name}",
+    )
+    names = [row[0] for row in cursor.fetchall()]
+    for name in names:
+        cursor.execute(f"ALTER INDEX {name} ON dbo.{table_name} DISABLE")
+    connection.commit()
+    cursor.close()
+    if names:
+        logger.info(f"  Disabled {len(names)} indexes on {table_name} for the load")
+    return names
+
+
+def rebuild_indexes(connection: pyodbc.Connection, table_name: str, names: list[str]) -> None:
+    """Rebuild indexes disabled by disable_indexes, re-enabling them.
+
+    Args:
+        connection: Database connection
+        table_name: Table owning the indexes
+        names: Index names to rebuild
+    """
+    cursor = connection.cursor()
+    for name in names:
+        cursor.execute(f"ALTER INDEX {name} ON dbo.{table_name} REBUILD")
+    connection.commit()
+    cursor.close()
+    logger.info(f"  Rebuilt {len(names)} indexes on {table_name}")
+
+
+def ensure_date_status_index(connection: pyodbc.Connection) -> None:
+    """Make IX_Appointments_Date cover appointmentstatus.
+
+    Databases created from an older schema.sql have the index on
+    appointmentdate alone; it is re-created in place with the INCLUDE so
+    date-range status counts are answered from the index.
+
+    Args:
+        connection: Database connection
+    """
+    cursor = connection.cursor()
+    cursor.execute("""
+        IF NOT EXISTS (
+            SELECT 1
+            FROM sys.indexes i
+            JOIN sys.index_columns ic ON ic.object_id = i.object_id AND ic.index_id = i.index_id
+            WHERE i.object_id = OBJECT_ID('dbo.Appointments')
+              AND i.name = 'IX_Appointments_Date'
+              AND ic.is_included_column = 1
+              AND COL_NAME(ic.object_id, ic.column_id) = 'appointmentstatus'
+        )
+        BEGIN
+            IF EXISTS (
+                SELECT 1 FROM sys.indexes
+                WHERE object_id = OBJECT_ID('dbo.Appointments') AND name = 'IX_Appointments_Date'
+            )
+                CREATE INDEX IX_Appointments_Date ON dbo.Appointments(appointmentdate)
+                    INCLUDE (appointmentstatus) WITH (DROP_EXISTING = ON);
+            ELSE
+                CREATE INDEX IX_Appointments_Date ON dbo.Appointments(appointmentdate)
+                    INCLUDE (appointmentstatus);
+        END
+    """)
+    connection.commit()
+    cursor.close()
+
+
+def create_stage_table(connection: pyodbc.Connection, table_name: str, columns: list[str]) -> str:
+    """(Re)create an empty heap with the given columns of a table, for staging a load.
+
+    SELECT TOP 0 ... INTO copies column types and nullability but no
+    indexes or constraints, so inserts into the heap skip all index and
+    foreign key work.
+
+    Args:
+        connection: Database connection
+        table_name: Table being staged
+        columns: Columns the load will insert
+
+    Returns:
+        Name of the staging table
+    """
+    stage_table = f"{table_name}_Stage"
+    cursor = connection.cursor()
+    cursor.execute(f"DROP TABLE IF EXISTS dbo.{stage_table}")
+    cursor.execute(f"SELECT TOP 0 {', '.join(columns)} INTO dbo.{stage_table} FROM dbo.{table_name}")
+    connection.commit()
     cursor.close()
-    return inserted, connection
+    return stage_table
+
+
+def move_stage_table(connection: pyodbc.Connection, table_name: str, columns: list[str]) -> None:
+    """Move staged rows into the table with one INSERT ... SELECT and drop the heap.
+
+    Args:
+        connection: Database connection
+        table_name: Table that was staged
+        columns: Columns loaded into the staging table
+    """
+    stage_table = f"{table_name}_Stage"
+    column_list = ", ".join(columns)
+    cursor = connection.cursor()
+    cursor.execute(
+        f"INSERT INTO dbo.{table_name} WITH (TABLOCK) ({column_list}) "
+        f"SELECT {column_list} FROM dbo.{stage_table}"
+    )
+    cursor.execute(f"DROP TABLE dbo.{stage_table}")
+    connection.commit()
+    cursor.close()
+    logger.info(f"  Moved staged rows from {stage_table} into {table_name}")
+
+
+def load_table(
+    connection: pyodbc.Connection,
+    parquet_name: str,
+    path: Path,
+    server: str = "",
+    database: str = "",
+) -> tuple[int, pyodbc.Connection]:
+    """Stream one parquet file into its SQL table.
+
+    Args:
+        connection: Database connection used only by this load
+        parquet_name: Entity name (key of PARQUET_TO_TABLE)
+        path: Parquet file to read
+        server: SQL Server hostname (for reconnection)
+        database: Database name (for reconnection)
+
+    Returns:
+        Tuple of (number of records inserted, connection)
+    """
+    table_name = PARQUET_TO_TABLE[parquet_name]
+    parquet_file = pq.ParquetFile(path)
+    total = parquet_file.metadata.num_rows
+    logger.info(f"\nLoading {parquet_name}: streaming {total:,} records from {path} into {table_name}...")
+
+    # Staged tables are streamed into an index-free heap first and moved over in one statement
+    staged = table_name in STAGED_TABLES
+    if staged:
+        columns = list(project_dataframe(parquet_file.schema_arrow.empty_table().to_pandas(), table_name).columns)
+        stage_table = create_stage_table(connection, table_name, columns)
+
+    # Secondary indexes are rebuilt once after the load instead of maintained per row
+    disabled = disable_indexes(connection, table_name) if table_name in INDEX_REBUILD_TABLES else []
+
+    # Large tables go through the OPENJSON bulk path, small ones through executemany
+    insert = bulk_copy_frames if total >= BULK_COPY_MIN_ROWS else insert_frames
+    try:
+        count, connection = insert(
+            connection=connection,
+            frames=parquet_batches(parquet_file, table_name),
+            table_name=table_name,
+            total=total,
+            server=server,
+            database=database,
+            target_table=stage_table if staged else None,
+        )
+        if staged:
+            move_stage_table(connection, table_name, columns)
+    except Exception:
+        # The load's connection may be dead; re-enable the indexes on a fresh
+        # one without masking the original error
+        if disabled:
+            try:
+                rebuild_connection = create_connection(server, database) if server else connection
+                try:
+                    rebuild_indexes(rebuild_connection, table_name, disabled)
+                finally:
+                    if rebuild_connection is not connection:
+                        rebuild_connection.close()
+            except Exception as rebuild_err:
+                logger.error(f"  Could not rebuild indexes on {table_name}: {rebuild_err}")
+        raise
+    if disabled:
+        rebuild_indexes(connection, table_name, disabled)
+    logger.info(f"  Inserted {count:,} records into {table_name}")
+    return count, connection
 
 
 def seed_database(
     connection: pyodbc.Connection,
-    dataframes: dict[str, pd.DataFrame],
+    data_dir: Path | str,
     truncate: bool = True,
     server: str = "",
     database: str = "",
+    max_connections: int = 2,
 ) -> tuple[dict[str, int], pyodbc.Connection]:
-    """Seed the database with all entity data.
+    """Seed the database with all entity data, streaming each parquet file.
+
+    Tables within a stage of LOAD_STAGES are loaded concurrently, each on its
+    own connection. Stages run in order so parent rows exist before their
+    children are inserted; the one foreign key within a stage, Appointments
+    to Insurance, is on a column that is not loaded and so always NULL.
 
     Args:
         connection: Database connection
-        dataframes: Dictionary of entity DataFrames (keyed by parquet name)
+        data_dir: Directory containing parquet files
         truncate: Whether to truncate tables before loading
-        server: SQL Server hostname (for reconnection)
-        database: Database name (for reconnection)
+        server: SQL Server hostname (for reconnection and extra connections)
+        database: Database name (for reconnection and extra connections)
+        max_connections: Upper bound on concurrent connections; keep it at
+            or below the database's vCore count to avoid throttling. Without
+            a server every table is loaded on `connection` in turn.
 
     Returns:
         Tuple of (dict mapping table names to record counts, connection)
     """
+    paths = parquet_paths(data_dir)
+
     if truncate:
         truncate_tables(connection)
 
-    # Insert order matters due to foreign key constraints
-    insert_order = ["departments", "providers", "patients", "insurance", "appointments"]
+    widest_stage = max(len(stage) for stage in LOAD_STAGES)
+    pool_size = min(max_connections, widest_stage) if server else 1
+    pool = [connection] + create_connection_pool(server, database, pool_size - 1)
     results = {}
 
-    for parquet_name in insert_order:
-        if parquet_name in dataframes:
-            table_name = PARQUET_TO_TABLE[parquet_name]
-            logger.info(f"\nLoading {parquet_name}...")
-            logger.info(f"  Read {len(dataframes[parquet_name]):,} records from parquet")
-            logger.info(f"  Starting insert into {table_name}...")
-
-            count, connection = insert_dataframe(
-                connection=connection,
-                df=dataframes[parquet_name],
-                table_name=table_name,
-                server=server,
-                database=database,
-            )
-            results[table_name] = count
-            logger.info(f"  Inserted {count:,} records into {table_name}")
+    try:
+        for stage in LOAD_STAGES:
+            if len(stage) > len(pool):
+                # Not enough connections to run the stage concurrently
+                for parquet_name in stage:
+                    count, pool[0] = load_table(pool[0], parquet_name, paths[parquet_name], server, database)
+                    results[PARQUET_TO_TABLE[parquet_name]] = count
+                continue
+
+            with ThreadPoolExecutor(max_workers=len(stage)) as executor:
+                futures = [
+                    executor.submit(load_table, conn, parquet_name, paths[parquet_name], server, database)
+                    for conn, parquet_name in zip(pool, stage)
+                ]
+                for i, (parquet_name, future) in enumerate(zip(stage, futures)):
+                    count, pool[i] = future.result()
+                    results[PARQUET_TO_TABLE[parquet_name]] = count
+    finally:
+        for extra in pool[1:]:
+            extra.close()
 
-    return results, connection
+    ensure_date_status_index(pool[0])
+    return results, pool[0]
 
 
 # =============================================================================
@@ -453,22 +1054,37 @@ def validate_data(connection: pyodbc.Connection) -> dict[str, int]:
     counts = {}
 
     logger.info("\nValidating data...")
+    # Row counts from partition metadata (heap or clustered index only), so
+    # no table is scanned; needs VIEW DATABASE STATE, else fall back to COUNT
+    table_list = ", ".join(f"'{table}'" for table in tables)
+    try:
+        cursor.execute(f"""
+            SELECT OBJECT_NAME(object_id), SUM(row_count)
+            FROM sys.dm_db_partition_stats
+            WHERE index_id IN (0, 1)
+              AND object_id IN (SELECT object_id FROM sys.tables WHERE name IN ({table_list}))
+            GROUP BY object_id
+        """)
+        row_counts = dict(cursor.fetchall())
+    except pyodbc.Error as e:
+        logger.warning(f"  Partition stats unavailable, counting rows instead: {e}")
+        row_counts = {}
+        for table in tables:
+            cursor.execute(f"SELECT COUNT(*) FROM dbo.{table} WITH (NOLOCK)")
+            row_counts[table] = cursor.fetchone()[0]
+
     for table in tables:
-        cursor.execute(f"SELECT COUNT(*) FROM dbo.{table}")
-        count = cursor.fetchone()[0]
+        count = row_counts.get(table, 0)
         counts[table] = count
         logger.info(f"  {table}: {count:,} records")
 
-    # Validate no-show rate
-    cursor.execute("""
-        SELECT
-            COUNT(*) as total,
-            SUM(CASE WHEN appointmentstatus = 'No Show' THEN 1 ELSE 0 END) as no_shows
-        FROM dbo.Appointments
-        WHERE appointmentdate < GETDATE()
-    """)
-    row = cursor.fetchone()
-    total, no_shows = row
+    # Validate no-show rate; both counts are range seeks on IX_Appointments_Date,
+    # which covers appointmentstatus (see ensure_date_status_index)
+    past = "FROM dbo.Appointments WITH (NOLOCK) WHERE appointmentdate < GETDATE()"
+    cursor.execute(f"SELECT COUNT_BIG(*) {past}")
+    total = cursor.fetchone()[0]
+    cursor.execute(f"SELECT COUNT_BIG(*) {past} AND appointmentstatus = 'No Show'")
+    no_shows = cursor.fetchone()[0]
     if total > 0:
         no_show_rate = no_shows / total
         logger.info(f"\nNo-show rate for past appointments: {no_show_rate:.1%} ({no_shows:,}/{total:,})")
@@ -488,6 +1104,7 @@ def seed_from_parquet(
     data_dir: Path | str,
     truncate: bool = True,
     validate: bool = True,
+    max_connections: int = 2,
 ) -> dict[str, int]:
     """Main function to seed database from parquet files.
 
@@ -497,26 +1114,26 @@ def seed_from_parquet(
         data_dir: Directory containing parquet files
         truncate: Whether to truncate tables before loading
         validate: Whether to validate data after loading
+        max_connections: Upper bound on concurrent connections
 
     Returns:
         Dictionary mapping table names to record counts
     """
     data_dir = Path(data_dir)
+    # Fail on missing files before connecting
+    parquet_paths(data_dir)
 
     logger.info(f"Connecting to {server}/{database}...")
     logger.info(f"Using driver: {get_odbc_driver()}")
 
-    # Load data
-    dataframes = load_parquet_files(data_dir)
-
-    # Connect and seed
+    # Connect and seed; parquet files are streamed table by table
     connection = create_connection(server, database)
     logger.info("Connected successfully!")
 
     try:
         results, connection = seed_database(
-            connection, dataframes, truncate=truncate,
-            server=server, database=database,
+            connection, data_dir, truncate=truncate,
+            server=server, database=database, max_connections=max_connections,
         )
 
         if validate:
@@ -560,6 +1177,13 @@ if __name__ == "__main__":
         help="Skip validation after loading",
     )
 
+    parser.add_argument(
+        "--max-connections",
+        type=int,
+        default=2,
+        help="Maximum concurrent connections for independent tables (keep at or below vCore count)",
+    )
+
     args = parser.parse_args()
 
     if not args.server:
@@ -573,4 +1197,5 @@ if __name__ == "__main__":
         data_dir=args.data_dir,
         truncate=not args.no_truncate,
         validate=not args.no_validate,
+        max_connections=args.max_connections,
     )
@@ -24,8 +24,12 @@ Environment Variables:
 
 import argparse
 import os
+import signal
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from azure.ai.ml import MLClient
 from azure.ai.ml.entities import (
     Model,
@@ -37,7 +41,20 @@ from azure.ai.ml.entities import (
     ProbeSettings,
 )
 from azure.ai.ml.constants import AssetTypes
+from azure.core.exceptions import ResourceNotFoundError
 from azure.identity import DefaultAzureCredential
+import mlflow
+from mlflow.tracking import MlflowClient
+
+
+# Set on Ctrl-C so waits on any thread return immediately
+_cancel = threading.Event()
+
+
+def _handle_sigint(signum, frame) -> None:
+    """Wake every pending wait, then interrupt the main thread as usual."""
+    _cancel.set()
+    raise KeyboardInterrupt
 
 
 def get_ml_client() -> MLClient:
@@ -62,50 +79,76 @@ def get_ml_client() -> MLClient:
     )
 
 
+# Metrics tried in order to rank AutoML child runs (higher is better)
+BEST_RUN_METRICS = ["norm_macro_recall", "AUC_weighted", "accuracy"]
+
+
+@lru_cache(maxsize=1)
+def _tracking_uri(ml_client: MLClient) -> str:
+    """MLflow tracking URI of the client's workspace."""
+    # Azure ML compute already exports the workspace URI, no need to look it
+    # up; the full resource path must match, since workspace names are only
+    # unique within a resource group (ARM names compare case-insensitively)
+    env_uri = os.environ.get("MLFLOW_TRACKING_URI", "")
+    workspace_path = (
+        f"/subscriptions/{ml_client.subscription_id}"
+        f"/resourceGroups/{ml_client.resource_group_name}"
+        f"/providers/Microsoft.MachineLearningServices"
+        f"/workspaces/{ml_client.workspace_name}"
+    )
+    if env_uri.startswith("azureml://") and env_uri.rstrip("/").lower().endswith(
+        workspace_path.lower()
+    ):
+        return env_uri
+    return ml_client.workspaces.get(ml_client.workspace_name).mlflow_tracking_uri
+
+
+@lru_cache(maxsize=1)
+def _experiment_id_for_job(ml_client: MLClient, job_name: str) -> str:
+    """MLflow experiment ID of a job (tracking URI must already be set)."""
+    job = ml_client.jobs.get(job_name)
+    experiment = MlflowClient().get_experiment_by_name(job.experiment_name)
+    if experiment is None:
+        raise ValueError(f"Experiment {job.experiment_name} not found")
+    return experiment.experiment_id
+
+
 def find_best_child_run(ml_client: MLClient, parent_job_name: str) -> str:
     """Find the best child run from an AutoML job.
     
     Returns the child run name (e.g., 'calm_bulb_0gtr3bskvp_3').
     """
-    import mlflow
-    
     # Set MLflow tracking URI
-    workspace = ml_client.workspaces.get(ml_client.workspace_name)
-    mlflow.set_tracking_uri(workspace.mlflow_tracking_uri)
+    tracking_uri = _tracking_uri(ml_client)
+    if mlflow.get_tracking_uri() != tracking_uri:
+        mlflow.set_tracking_uri(tracking_uri)
+    client = MlflowClient()
+    experiment_id = _experiment_id_for_job(ml_client, parent_job_name)
     
-    # Get the parent job to find its experiment
-    parent_job = ml_client.jobs.get(parent_job_name)
-    experiment_name = parent_job.experiment_name
+    # Let the server rank child runs and return only the top one, trying the
+    # metrics in order of preference (prefer norm_macro_recall for balanced
+    # classification). Only runs that logged the metric are ranked, so the
+    # backend's placement of missing/NaN values can't hide the best run.
+    filter_string = f"tags.mlflow.parentRunId = '{parent_job_name}'"
+    for metric in BEST_RUN_METRICS:
+        runs = client.search_runs(
+            experiment_ids=[experiment_id],
+            filter_string=f"{filter_string} and metrics.{metric} > -1e9",
+            order_by=[f"metrics.{metric} DESC"],
+            max_results=1,
+        )
+        if runs:
+            return runs[0].info.run_id
     
-    # Search for child runs, ordered by primary metric
-    # AutoML jobs use different metrics; try common ones
-    runs = mlflow.search_runs(
-        experiment_names=[experiment_name],
-        filter_string=f"tags.mlflow.parentRunId = '{parent_job_name}'",
-        max_results=50,
+    # Fallback: no run has any ranking metric, take the first child run
+    runs = client.search_runs(
+        experiment_ids=[experiment_id],
+        filter_string=filter_string,
+        max_results=1,
     )
-    
-    if runs.empty:
+    if not runs:
         raise ValueError(f"No child runs found for job {parent_job_name}")
-    
-    # Filter to actual model runs (exclude setup, featurize, etc.)
-    model_runs = runs[runs["run_id"].str.contains("_\\d+$", regex=True, na=False) == False]
-    
-    # Try to find best by various metrics
-    metric_columns = [col for col in runs.columns if col.startswith("metrics.")]
-    
-    # Prefer norm_macro_recall for balanced classification
-    if "metrics.norm_macro_recall" in metric_columns:
-        best_run = runs.loc[runs["metrics.norm_macro_recall"].idxmax()]
-    elif "metrics.AUC_weighted" in metric_columns:
-        best_run = runs.loc[runs["metrics.AUC_weighted"].idxmax()]
-    elif "metrics.accuracy" in metric_columns:
-        best_run = runs.loc[runs["metrics.accuracy"].idxmax()]
-    else:
-        # Fallback: take the first run that has model outputs
-        best_run = runs.iloc[0]
-    
-    return best_run["run_id"]
+    return runs[0].info.run_id
 
 
 def register_model(
@@ -168,44 +211,131 @@ def ensure_endpoint(ml_client: MLClient, endpoint_name: str) -> ManagedOnlineEnd
                 "environment": "development",
             },
         )
-        ml_client.online_endpoints.begin_create_or_update(endpoint).result()
+        poller = ml_client.online_endpoints.begin_create_or_update(endpoint)
+        # Wait in short slices so Ctrl-C isn't stuck behind this worker thread
+        while not poller.done():
+            poller.wait(timeout=5)
+            if _cancel.is_set():
+                raise KeyboardInterrupt
+        endpoint = poller.result()
         print(f"Endpoint '{endpoint_name}' created")
-        return ml_client.online_endpoints.get(endpoint_name)
+        return endpoint
+
+
+def retry_after_seconds(error: Exception) -> float | None:
+    """Read a numeric Retry-After header from an Azure HTTP error, if any."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        return float(headers["Retry-After"])
+    except (KeyError, TypeError, ValueError):
+        return None
 
 
 def wait_for_deployment(
     ml_client: MLClient,
     endpoint_name: str,
     deployment_name: str,
-    poll_interval: int = 30,
+    initial_delay: float = 1,
+    max_delay: float = 10,
     max_wait_minutes: int = 20,
-) -> str:
-    """Poll deployment status until complete or failed."""
-    import time
-    
-    max_iterations = (max_wait_minutes * 60) // poll_interval
-    for i in range(max_iterations):
+) -> ManagedOnlineDeployment:
+    """Poll deployment status until complete or failed.
+
+    Polls with exponential backoff (initial_delay doubling up to max_delay),
+    waiting as long as the service asks when it responds with Retry-After.
+    Returns the deployment as last fetched, once it has succeeded.
+    """
+    deadline = time.monotonic() + max_wait_minutes * 60
+    attempt = 0
+    while time.monotonic() < deadline:
+        delay = min(max_delay, initial_delay * 2**attempt)
+        attempt += 1
         try:
-            deployment = ml_client.online_deployments.get(deployment_name, endpoint_name)
-            state = deployment.provisioning_state
-            print(f"  [{i+1}/{max_iterations}] Deployment state: {state}")
-            
-            if state == "Succeeded":
-                return state
-            elif state in ("Failed", "Canceled"):
-                raise RuntimeError(f"Deployment {state}: check Azure portal for details")
-            
-            time.sleep(poll_interval)
+            # One list call per poll covers every deployment on the endpoint
+            deployment = next(
+                (
+                    d
+                    for d in ml_client.online_deployments.list(endpoint_name)
+                    if d.name == deployment_name
+                ),
+                None,
+            )
         except Exception as e:
-            if "not found" in str(e).lower():
+            retry_after = retry_after_seconds(e)
+            if retry_after is None:
+                raise
+            delay = retry_after
+        else:
+            if deployment is None:
                 print(f"  Deployment not found yet, waiting...")
-                time.sleep(poll_interval)
             else:
-                raise
+                state = deployment.provisioning_state
+                print(f"  [{attempt}] Deployment state: {state}")
+                
+                if state == "Succeeded":
+                    return deployment
+                elif state in ("Failed", "Canceled"):
+                    raise RuntimeError(f"Deployment {state}: check Azure portal for details")
+        
+        if _cancel.wait(max(0.0, min(delay, deadline - time.monotonic()))):
+            raise KeyboardInterrupt
     
     raise TimeoutError(f"Deployment did not complete within {max_wait_minutes} minutes")
 
 
+def _try_get_deployment(
+    ml_client: MLClient,
+    endpoint_name: str,
+    deployment_name: str,
+) -> ManagedOnlineDeployment | None:
+    """Fetch a deployment, or None if it doesn't exist."""
+    try:
+        return ml_client.online_deployments.get(deployment_name, endpoint_name)
+    except ResourceNotFoundError:
+        return None
+
+
+def _create_deployment(
+    ml_client: MLClient,
+    endpoint_name: str,
+    deployment_name: str,
+    model_name: str,
+    model_version: str,
+) -> ManagedOnlineDeployment:
+    """Create (or replace) the deployment and wait for it to succeed."""
+    print(f"Deploying {model_name}:{model_version} to {endpoint_name}/{deployment_name}...")
+    
+    deployment = ManagedOnlineDeployment(
+        name=deployment_name,
+        endpoint_name=endpoint_name,
+        model=f"azureml:{model_name}:{model_version}",
+        instance_type="Standard_DS3_v2",
+        instance_count=1,
+        request_settings=OnlineRequestSettings(
+            request_timeout_ms=30000,
+            max_concurrent_requests_per_instance=10,
+        ),
+        liveness_probe=ProbeSettings(
+            initial_delay=30,
+            period=10,
+            timeout=2,
+            failure_threshold=30,
+        ),
+        tags={
+            "model_version": model_version,
+            "project": "no-show-demo",
+        },
+    )
+    
+    print("Starting deployment (this may take 5-10 minutes)...")
+    # Start deployment without blocking
+    ml_client.online_deployments.begin_create_or_update(deployment)
+    
+    # Poll for completion
+    return wait_for_deployment(ml_client, endpoint_name, deployment_name)
+
+
 def deploy_model(
     ml_client: MLClient,
     endpoint_name: str,
@@ -216,69 +346,38 @@ def deploy_model(
     """Deploy model to endpoint using no-code MLflow deployment."""
     
     # Check if deployment already exists and is in progress
-    try:
-        existing = ml_client.online_deployments.get(deployment_name, endpoint_name)
+    existing = _try_get_deployment(ml_client, endpoint_name, deployment_name)
+    if existing is None:
+        deployed = _create_deployment(
+            ml_client, endpoint_name, deployment_name, model_name, model_version
+        )
+    else:
         state = existing.provisioning_state
         print(f"Deployment '{deployment_name}' exists (state: {state})")
+        deployed = existing
         
         if state == "Succeeded":
             print("Deployment already succeeded, skipping to traffic routing...")
         elif state in ("Creating", "Updating"):
             print("Deployment in progress, waiting for completion...")
-            wait_for_deployment(ml_client, endpoint_name, deployment_name)
+            deployed = wait_for_deployment(ml_client, endpoint_name, deployment_name)
         elif state in ("Failed", "Canceled"):
             print(f"Previous deployment {state}, will recreate...")
-            # Fall through to create new deployment
-            raise Exception("recreate")
-    except Exception as e:
-        if "not found" not in str(e).lower() and "recreate" not in str(e):
-            raise
-        
-        # Create new deployment
-        print(f"Deploying {model_name}:{model_version} to {endpoint_name}/{deployment_name}...")
-        
-        deployment = ManagedOnlineDeployment(
-            name=deployment_name,
-            endpoint_name=endpoint_name,
-            model=f"azureml:{model_name}:{model_version}",
-            instance_type="Standard_DS3_v2",
-            instance_count=1,
-            request_settings=OnlineRequestSettings(
-                request_timeout_ms=30000,
-                max_concurrent_requests_per_instance=10,
-            ),
-            liveness_probe=ProbeSettings(
-                initial_delay=30,
-                period=10,
-                timeout=2,
-                failure_threshold=30,
-            ),
-            tags={
-                "model_version": model_version,
-                "project": "no-show-demo",
-            },
-        )
-        
-        print("Starting deployment (this may take 5-10 minutes)...")
-        # Start deployment without blocking
-        ml_client.online_deployments.begin_create_or_update(deployment)
-        
-        # Poll for completion
-        wait_for_deployment(ml_client, endpoint_name, deployment_name)
+            deployed = _create_deployment(
+                ml_client, endpoint_name, deployment_name, model_name, model_version
+            )
     
     # Set 100% traffic to this deployment
     print("Routing 100% traffic to deployment...")
     endpoint = ml_client.online_endpoints.get(endpoint_name)
     endpoint.traffic = {deployment_name: 100}
-    ml_client.online_endpoints.begin_create_or_update(endpoint).result()
+    # The poller's result is the updated endpoint, scoring URI included
+    endpoint = ml_client.online_endpoints.begin_create_or_update(endpoint).result()
     
     print(f"Deployment complete: {endpoint_name}/{deployment_name}")
-    
-    # Get endpoint scoring URI
-    endpoint = ml_client.online_endpoints.get(endpoint_name)
     print(f"Scoring URI: {endpoint.scoring_uri}")
     
-    return ml_client.online_deployments.get(deployment_name, endpoint_name)
+    return deployed
 
 
 def main():
@@ -321,6 +420,7 @@ def main():
     )
     
     args = parser.parse_args()
+    signal.signal(signal.SIGINT, _handle_sigint)
     
     print("=" * 60)
     print("No-Show Prediction Model Deployment")
@@ -329,20 +429,25 @@ def main():
     ml_client = get_ml_client()
     print(f"Workspace: {ml_client.workspace_name}")
     
-    # Step 1: Register model
-    if not args.skip_registration:
-        register_model(
-            ml_client,
-            args.job_name,
-            args.child_run_suffix,
-            args.model_name,
-            args.model_version,
-        )
-    else:
-        print(f"Skipping registration, using existing model {args.model_name}:{args.model_version}")
-    
-    # Step 2: Ensure endpoint exists
-    ensure_endpoint(ml_client, args.endpoint_name)
+    # Steps 1 and 2 are independent: the endpoint is created/checked on a
+    # worker thread while the best run is resolved and the model registered
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # Step 2: Ensure endpoint exists
+        endpoint_future = executor.submit(ensure_endpoint, ml_client, args.endpoint_name)
+        
+        # Step 1: Register model
+        if not args.skip_registration:
+            register_model(
+                ml_client,
+                args.job_name,
+                args.child_run_suffix,
+                args.model_name,
+                args.model_version,
+            )
+        else:
+            print(f"Skipping registration, using existing model {args.model_name}:{args.model_version}")
+        
+        endpoint_future.result()
     
     # Step 3: Deploy model
     deploy_model(
@@ -0,0 +1,156 @@
+"""Tests for ML data preparation.
+
+Validates:
+- Historical no-show features count prior appointments only
+- Same-day appointments keep their input order
+- Time-based features (day of week, hour, lead time)
+- Stratified split sizes, class ratios, and determinism
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.prepare_ml_data import compute_all_features, stratified_split_indices
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+def _appointments(rows: list[tuple[int, str, int]]) -> pd.DataFrame:
+    """Appointments frame from (patientid, appointmentdate, no_show) rows."""
+    patient_ids, dates, no_shows = zip(*rows)
+    appointment_dates = pd.to_datetime(list(dates))
+    return pd.DataFrame({
+        "patientid": np.array(patient_ids, dtype=np.int32),
+        "appointmentdate": appointment_dates,
+        "appointmentstarttime": ["09:30"] * len(rows),
+        "appointmentscheduleddatetime": appointment_dates - pd.Timedelta(days=3, hours=6),
+        "no_show": np.array(no_shows, dtype=np.int8),
+    })
+
+
+# =============================================================================
+# Feature Tests
+# =============================================================================
+
+
+class TestComputeAllFeatures:
+    """Tests for the time-based and historical no-show features."""
+
+    @pytest.fixture
+    def interleaved(self):
+        # Patient 1 by date: rows 1 (no-show), 4 (no-show), 3 (attended)
+        # Patient 2 by date: rows 2 (attended), 0 (no-show), 5 (attended)
+        return _appointments([
+            (2, "2024-01-10", 1),
+            (1, "2024-01-05", 1),
+            (2, "2024-01-01", 0),
+            (1, "2024-01-20", 0),
+            (1, "2024-01-12", 1),
+            (2, "2024-01-15", 0),
+        ])
+
+    def test_counts_prior_no_shows_only(self, interleaved):
+        """Each count covers the patient's earlier appointments, not the current one."""
+        features = compute_all_features(interleaved)
+
+        assert features["historical_no_show_count"].tolist() == [0, 0, 0, 2, 1, 1]
+
+    def test_rate_over_prior_appointments(self, interleaved):
+        """The rate divides prior no-shows by the number of prior appointments."""
+        features = compute_all_features(interleaved)
+
+        np.testing.assert_allclose(
+            features["historical_no_show_rate"], [0.0, 0.0, 0.0, 1.0, 1.0, 0.5]
+        )
+
+    def test_first_visit_rate_is_zero(self, interleaved):
+        """A patient's first appointment has no history and a rate of 0."""
+        features = compute_all_features(interleaved)
+
+        first_visits = features.loc[[1, 2]]
+        assert first_visits["historical_no_show_count"].tolist() == [0, 0]
+        assert first_visits["historical_no_show_rate"].tolist() == [0.0, 0.0]
+
+    def test_input_row_order_preserved(self, interleaved):
+        """Features line up with the input rows; the frame is not re-sorted."""
+        features = compute_all_features(interleaved)
+
+        pd.testing.assert_index_equal(features.index, interleaved.index)
+        pd.testing.assert_series_equal(features["patientid"], interleaved["patientid"])
+
+    def test_same_day_appointments_keep_input_order(self):
+        """Same-day appointments count each other in the order they appear."""
+        features = compute_all_features(_appointments([
+            (7, "2024-03-01", 1),
+            (7, "2024-03-01", 0),
+            (7, "2024-03-04", 0),
+        ]))
+
+        assert features["historical_no_show_count"].tolist() == [0, 1, 1]
+        np.testing.assert_allclose(features["historical_no_show_rate"], [0.0, 1.0, 0.5])
+
+    def test_time_features(self, interleaved):
+        """Day of week, hour, and lead time come from the date and start time."""
+        features = compute_all_features(interleaved)
+
+        # 2024-01-10 is a Wednesday; scheduled 3 days 6 hours earlier is 4 calendar days
+        assert features["day_of_week"].iloc[0] == 2
+        assert features["hour_of_day"].tolist() == [9] * len(interleaved)
+        assert features["lead_time_days"].tolist() == [4] * len(interleaved)
+
+
+# =============================================================================
+# Split Tests
+# =============================================================================
+
+
+class TestStratifiedSplitIndices:
+    """Tests for the stratified train/test split."""
+
+    @pytest.fixture
+    def target(self):
+        # 100 attended, 25 no-shows, interleaved
+        return np.tile([0, 0, 0, 0, 1], 25).astype(np.int8)
+
+    def test_split_sizes(self, target):
+        """Train and test partition every row exactly once."""
+        train_idx, test_idx = stratified_split_indices(target, test_size=0.2)
+
+        assert len(train_idx) == 100
+        assert len(test_idx) == 25
+        assert sorted(np.concatenate([train_idx, test_idx])) == list(range(len(target)))
+
+    def test_class_counts_per_split(self, target):
+        """Each class contributes round(test_size * class size) rows to test."""
+        train_idx, test_idx = stratified_split_indices(target, test_size=0.2)
+
+        assert np.bincount(target[test_idx]).tolist() == [20, 5]
+        assert np.bincount(target[train_idx]).tolist() == [80, 20]
+
+    def test_rounding_per_class(self):
+        """Class test counts are rounded separately (0.2 * 7 -> 1, 0.2 * 3 -> 1)."""
+        target = np.array([0] * 7 + [1] * 3)
+
+        train_idx, test_idx = stratified_split_indices(target, test_size=0.2)
+
+        assert np.bincount(target[test_idx]).tolist() == [1, 1]
+        assert np.bincount(target[train_idx]).tolist() == [6, 2]
+
+    def test_deterministic_for_fixed_seed(self, target):
+        """The same random_state gives the same indices in the same order."""
+        first = stratified_split_indices(target, random_state=7)
+        second = stratified_split_indices(target, random_state=7)
+
+        np.testing.assert_array_equal(first[0], second[0])
+        np.testing.assert_array_equal(first[1], second[1])
+
+    def test_seed_changes_split(self, target):
+        """A different random_state picks a different test set."""
+        _, test_a = stratified_split_indices(target, random_state=1)
+        _, test_b = stratified_split_indices(target, random_state=2)
+
+        assert set(test_a) != set(test_b)
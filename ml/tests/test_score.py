@@ -0,0 +1,654 @@
+"""Tests for the online endpoint scoring script.
+
+Validates:
+- Both request formats (dataframe_split and appointments)
+- Probabilities and risk levels match scoring the model directly
+- Response keys, including echoed appointment IDs
+- feature_importances shape against the inference contract
+- ONNX session validation and scoring
+- Signature dtype casting
+- Micro-batching of concurrent requests
+- Error responses
+"""
+
+import importlib.util
+import json
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.compose import ColumnTransformer
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import OneHotEncoder
+
+# score.py is deployed as a standalone script, not part of the src package
+SCORE_PATH = Path(__file__).resolve().parents[1] / "deployment" / "code" / "score.py"
+_spec = importlib.util.spec_from_file_location("score", SCORE_PATH)
+score = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(score)
+
+FEATURE_COLUMNS = score.FEATURE_COLUMNS
+
+CATEGORICAL_COLUMNS = [
+    "patient_age_bucket", "patient_gender", "patient_zip_code", "patient_race_ethnicity",
+    "sipg2", "appointmenttypename", "virtual_flag", "new_patient_flag",
+    "provider_specialty", "providertype", "departmentspecialty", "placeofservicetype", "market",
+]
+NUMERIC_COLUMNS = [col for col in FEATURE_COLUMNS if col not in CATEGORICAL_COLUMNS]
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+def _training_frame(n: int, seed: int = 0) -> pd.DataFrame:
+    """Build a feature frame with realistic column types."""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "patient_age_bucket": rng.choice(["0-17", "18-39", "40-64", "65+"], n),
+        "patient_gender": rng.choice(["M", "F"], n),
+        "patient_zip_code": rng.choice(["53715", "53705"], n),
+        "patient_race_ethnicity": ["Unknown"] * n,
+        "portal_engaged": rng.choice([True, False], n),
+        "historical_no_show_rate": rng.uniform(0, 0.5, n),
+        "historical_no_show_count": rng.integers(0, 5, n),
+        "sipg2": rng.choice(["Commercial", "Medicare", "Medicaid", "Self-Pay"], n),
+        "lead_time_days": rng.integers(1, 30, n),
+        "appointmenttypename": rng.choice(["E&M EST PCP 3", "E&M NEW ADT"], n),
+        "virtual_flag": rng.choice(["Non-Virtual", "Virtual-Video"], n),
+        "new_patient_flag": rng.choice(["EST PATIENT", "NEW PATIENT"], n),
+        "day_of_week": rng.integers(0, 7, n),
+        "hour_of_day": rng.integers(7, 18, n),
+        "appointmentduration": rng.choice([15, 30, 45], n),
+        "webschedulableyn": rng.integers(0, 2, n),
+        "provider_specialty": rng.choice(["Family Medicine", "Internal Medicine"], n),
+        "providertype": ["Physician"] * n,
+        "departmentspecialty": rng.choice(["Family Medicine", "Internal Medicine"], n),
+        "placeofservicetype": ["Office"] * n,
+        "market": rng.choice(["Madison", "Milwaukee"], n),
+    })
+
+
+def _labels(frame: pd.DataFrame) -> np.ndarray:
+    """No-show labels loosely driven by history and lead time."""
+    risk = frame["historical_no_show_rate"] * 4 + frame["lead_time_days"] / 30
+    return (risk > risk.median()).astype(int).to_numpy()
+
+
+def _legacy_risk_level(probability: float) -> str:
+    """Risk thresholds from data-model.md."""
+    if probability < 0.3:
+        return "Low"
+    elif probability <= 0.6:
+        return "Medium"
+    return "High"
+
+
+def _rows(frame: pd.DataFrame) -> list[list]:
+    """Rows as plain JSON values, the way a client sends them."""
+    return json.loads(frame.to_json(orient="values"))
+
+
+def _request(payload: dict) -> list[dict]:
+    """Score a request payload and return its predictions."""
+    response = json.loads(score.run(json.dumps(payload)))
+    assert "error" not in response, response
+    return response["predictions"]
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture(scope="module")
+def pipeline_model():
+    """Preprocessing pipeline fitted on a DataFrame (scored via DataFrames)."""
+    frame = _training_frame(300)
+    preprocess = ColumnTransformer([
+        ("categorical", OneHotEncoder(handle_unknown="ignore"), CATEGORICAL_COLUMNS),
+        ("numeric", "passthrough", NUMERIC_COLUMNS),
+    ])
+    pipeline = Pipeline([
+        ("preprocess", preprocess),
+        ("classifier", LogisticRegression(max_iter=1000)),
+    ])
+    return pipeline.fit(frame, _labels(frame))
+
+
+@pytest.fixture(scope="module")
+def numeric_frame():
+    """Feature frame with every column already numeric."""
+    frame = _training_frame(300, seed=1)
+    for col in CATEGORICAL_COLUMNS + ["portal_engaged"]:
+        frame[col] = frame[col].astype("category").cat.codes
+    return frame.astype(float)
+
+
+@pytest.fixture(scope="module")
+def array_model(numeric_frame):
+    """Tree model fitted on a plain array (scored via positional ndarrays)."""
+    model = RandomForestClassifier(n_estimators=10, random_state=42)
+    return model.fit(numeric_frame.to_numpy(), _labels(numeric_frame))
+
+
+@pytest.fixture
+def install(monkeypatch):
+    """Install a fitted model as if init() had loaded it."""
+
+    def _install(model, explain=False):
+        monkeypatch.setattr(score, "model", model)
+        monkeypatch.setattr(score, "_SESSION", None)
+        monkeypatch.setattr(score, "_EXPECTED_DTYPES", {})
+        monkeypatch.setattr(score, "_BATCHER", None)
+        score._prepare_model(model, explain=explain)
+        return model
+
+    return _install
+
+
+# =============================================================================
+# dataframe_split Format Tests
+# =============================================================================
+
+
+class TestDataframeSplit:
+    """Tests for the MLflow dataframe_split request format."""
+
+    def test_probabilities_match_model(self, install, pipeline_model):
+        """Probabilities match predict_proba on the same rows."""
+        install(pipeline_model)
+        frame = _training_frame(25, seed=7)
+
+        predictions = _request({
+            "input_data": {"columns": FEATURE_COLUMNS, "data": _rows(frame)}
+        })
+
+        expected = pipeline_model.predict_proba(frame)[:, 1]
+        assert [p["no_show_probability"] for p in predictions] == np.round(expected, 3).tolist()
+
+    def test_risk_levels(self, install, pipeline_model):
+        """Risk levels follow the Low/Medium/High thresholds."""
+        install(pipeline_model)
+        frame = _training_frame(25, seed=8)
+
+        predictions = _request({
+            "input_data": {"columns": FEATURE_COLUMNS, "data": _rows(frame)}
+        })
+
+        expected = pipeline_model.predict_proba(frame)[:, 1]
+        assert [p["risk_level"] for p in predictions] == [
+            _legacy_risk_level(prob) for prob in expected
+        ]
+
+    def test_reordered_columns(self, install, pipeline_model):
+        """Columns sent in a different order are realigned to training order."""
+        install(pipeline_model)
+        frame = _training_frame(10, seed=9)
+        shuffled = frame[FEATURE_COLUMNS[::-1]]
+
+        predictions = _request({
+            "input_data": {"columns": list(shuffled.columns), "data": _rows(shuffled)}
+        })
+
+        expected = pipeline_model.predict_proba(frame)[:, 1]
+        assert [p["no_show_probability"] for p in predictions] == np.round(expected, 3).tolist()
+
+    def test_array_model(self, install, array_model, numeric_frame):
+        """Models fitted on arrays score the same rows identically."""
+        install(array_model)
+        frame = numeric_frame.head(20)
+
+        predictions = _request({
+            "input_data": {"columns": FEATURE_COLUMNS, "data": _rows(frame)}
+        })
+
+        expected = array_model.predict_proba(frame.to_numpy())[:, 1]
+        assert [p["no_show_probability"] for p in predictions] == np.round(expected, 3).tolist()
+        assert [p["risk_level"] for p in predictions] == [
+            _legacy_risk_level(prob) for prob in expected
+        ]
+
+    def test_response_keys(self, install, pipeline_model):
+        """Predictions carry probability and risk level, no appointment ID."""
+        install(pipeline_model)
+        frame = _training_frame(3, seed=10)
+
+        predictions = _request({
+            "input_data": {"columns": FEATURE_COLUMNS, "data": _rows(frame)}
+        })
+
+        assert len(predictions) == 3
+        for prediction in predictions:
+            assert set(prediction) - {"feature_importances"} == {
+                "no_show_probability",
+                "risk_level",
+            }
+
+
+# =============================================================================
+# appointments Format Tests
+# =============================================================================
+
+
+class TestAppointments:
+    """Tests for the custom appointments request format."""
+
+    def test_probabilities_and_ids(self, install, pipeline_model):
+        """Appointments are scored in one batch and their IDs echoed back."""
+        install(pipeline_model)
+        frame = _training_frame(15, seed=11)
+        appointments = [
+            {"appointment_id": 1000 + i, **record}
+            for i, record in enumerate(json.loads(frame.to_json(orient="records")))
+        ]
+
+        predictions = _request({"appointments": appointments})
+
+        expected = pipeline_model.predict_proba(frame)[:, 1]
+        assert [p["no_show_probability"] for p in predictions] == np.round(expected, 3).tolist()
+        assert [p["risk_level"] for p in predictions] == [
+            _legacy_risk_level(prob) for prob in expected
+        ]
+        assert [p["appointment_id"] for p in predictions] == list(range(1000, 1015))
+
+    def test_without_ids(self, install, pipeline_model):
+        """Appointments without IDs get no appointment_id key."""
+        install(pipeline_model)
+        frame = _training_frame(4, seed=12)
+
+        predictions = _request({"appointments": json.loads(frame.to_json(orient="records"))})
+
+        for prediction in predictions:
+            assert set(prediction) - {"feature_importances"} == {
+                "no_show_probability",
+                "risk_level",
+            }
+
+    def test_array_model(self, install, array_model, numeric_frame):
+        """Models fitted on arrays score appointment records identically."""
+        install(array_model)
+        frame = numeric_frame.head(12)
+        appointments = [
+            {"appointment_id": f"A{i}", **record}
+            for i, record in enumerate(json.loads(frame.to_json(orient="records")))
+        ]
+
+        predictions = _request({"appointments": appointments})
+
+        expected = array_model.predict_proba(frame.to_numpy())[:, 1]
+        assert [p["no_show_probability"] for p in predictions] == np.round(expected, 3).tolist()
+        assert [p["appointment_id"] for p in predictions] == [f"A{i}" for i in range(12)]
+
+
+# =============================================================================
+# Feature Importance Tests
+# =============================================================================
+
+
+class TestFeatureImportances:
+    """Tests for per-prediction feature_importances (FeatureImportance contract)."""
+
+    def test_contract_shape(self, install, array_model, numeric_frame):
+        """Each entry has feature, direction and a relative importance."""
+        install(array_model, explain=True)
+        if score._EXPLAINER is None:
+            pytest.skip("shap is not installed")
+        frame = numeric_frame.head(5)
+
+        predictions = _request({
+            "input_data": {"columns": FEATURE_COLUMNS, "data": _rows(frame)}
+        })
+
+        for prediction in predictions:
+            importances = prediction["feature_importances"]
+            assert 0 < len(importances) <= score.TOP_FEATURE_COUNT
+            for entry in importances:
+                assert {"feature", "importance", "direction"} <= set(entry)
+                assert entry["feature"] in FEATURE_COLUMNS
+                assert entry["direction"] in ("Increases", "Decreases")
+                assert 0.0 <= entry["importance"] <= 1.0
+            # Shares of one row's total attribution (allowing for rounding)
+            assert sum(entry["importance"] for entry in importances) <= 1.0 + 1e-3
+
+    def test_disabled_by_default(self, install, array_model, numeric_frame):
+        """Tree models skip TreeSHAP unless explanations are enabled."""
+        install(array_model)
+        frame = numeric_frame.head(3)
+
+        predictions = _request({
+            "input_data": {"columns": FEATURE_COLUMNS, "data": _rows(frame)}
+        })
+
+        assert all("feature_importances" not in p for p in predictions)
+
+    def test_omitted_without_explainer(self, install, pipeline_model):
+        """Models without per-row attributions return no feature_importances."""
+        install(pipeline_model)
+        frame = _training_frame(3, seed=13)
+
+        predictions = _request({
+            "input_data": {"columns": FEATURE_COLUMNS, "data": _rows(frame)}
+        })
+
+        assert all("feature_importances" not in p for p in predictions)
+
+    def test_omitted_when_explainer_fails(self, install, array_model, numeric_frame, monkeypatch):
+        """A failing explainer drops feature_importances but still scores."""
+        install(array_model, explain=True)
+
+        class BrokenExplainer:
+            def shap_values(self, *args, **kwargs):
+                raise RuntimeError("boom")
+
+        monkeypatch.setattr(score, "_EXPLAINER", BrokenExplainer())
+        frame = numeric_frame.head(3)
+
+        predictions = _request({
+            "input_data": {"columns": FEATURE_COLUMNS, "data": _rows(frame)}
+        })
+
+        assert len(predictions) == 3
+        assert all("feature_importances" not in p for p in predictions)
+
+
+# =============================================================================
+# Signature Dtype Tests
+# =============================================================================
+
+
+class TestExpectedDtypes:
+    """Tests for casting request columns to the model signature's dtypes."""
+
+    @pytest.fixture
+    def expected_dtypes(self, monkeypatch):
+        dtypes = {
+            "historical_no_show_count": np.dtype("int64"),
+            "historical_no_show_rate": np.dtype("float64"),
+            "portal_engaged": np.dtype(bool),
+        }
+        monkeypatch.setattr(score, "_EXPECTED_DTYPES", dtypes)
+        return dtypes
+
+    def test_casts_clean_columns(self, expected_dtypes):
+        """Columns without nulls take the signature dtypes."""
+        frame = pd.DataFrame(
+            np.array([[1, 0.2, True], [2, 0.4, False]], dtype=object),
+            columns=list(expected_dtypes),
+        )
+
+        cast, complete = score._apply_expected_dtypes(frame)
+
+        assert complete
+        assert cast.dtypes.to_dict() == expected_dtypes
+
+    def test_failed_column_does_not_block_others(self, expected_dtypes):
+        """A null in an integer column leaves only that column uncast."""
+        frame = pd.DataFrame(
+            np.array([[1, 0.2, True], [None, None, True]], dtype=object),
+            columns=list(expected_dtypes),
+        )
+
+        cast, complete = score._apply_expected_dtypes(frame)
+
+        assert not complete
+        assert cast["historical_no_show_count"].dtype == object
+        assert cast["historical_no_show_rate"].dtype == np.float64
+        assert cast["portal_engaged"].dtype == bool
+
+    def test_null_bool_not_cast_to_false(self, expected_dtypes):
+        """None in a bool column stays None rather than becoming False."""
+        frame = pd.DataFrame(
+            np.array([[1, 0.2, True], [2, 0.4, None]], dtype=object),
+            columns=list(expected_dtypes),
+        )
+
+        cast, complete = score._apply_expected_dtypes(frame)
+
+        assert not complete
+        assert cast["portal_engaged"].tolist() == [True, None]
+
+
+class RecordingModel:
+    """DataFrame-fitted model stand-in that records the dtypes it is given."""
+
+    feature_names_in_ = np.array(FEATURE_COLUMNS, dtype=object)
+    n_features_in_ = len(FEATURE_COLUMNS)
+
+    def __init__(self):
+        self.dtypes = None
+
+    def predict_proba(self, features):
+        self.dtypes = features.dtypes.to_dict()
+        return np.full((len(features), 2), 0.5)
+
+
+class TestSignatureFastPath:
+    """Tests for dataframe_split rows typed straight from the signature."""
+
+    @pytest.fixture
+    def signature_dtypes(self):
+        """Signature dtypes matching the training frame's columns."""
+        frame = _training_frame(1)
+        return {
+            col: (np.dtype(object) if col in CATEGORICAL_COLUMNS else frame[col].dtype)
+            for col in FEATURE_COLUMNS
+        }
+
+    def test_clean_rows_get_signature_dtypes(self, install, signature_dtypes, monkeypatch):
+        """Rows that cast cleanly reach the model with the signature dtypes."""
+        recorder = RecordingModel()
+        install(recorder)
+        monkeypatch.setattr(score, "_EXPECTED_DTYPES", signature_dtypes)
+
+        _request({
+            "input_data": {"columns": FEATURE_COLUMNS, "data": _rows(_training_frame(5, seed=40))}
+        })
+
+        assert recorder.dtypes == signature_dtypes
+
+    def test_null_integer_falls_back_to_inference(self, install, signature_dtypes, monkeypatch):
+        """A null in an integer column gives the pre-cast float64, not object columns."""
+        recorder = RecordingModel()
+        install(recorder)
+        monkeypatch.setattr(score, "_EXPECTED_DTYPES", signature_dtypes)
+        rows = _rows(_training_frame(5, seed=41))
+        rows[1][FEATURE_COLUMNS.index("historical_no_show_count")] = None
+
+        _request({"input_data": {"columns": FEATURE_COLUMNS, "data": rows}})
+
+        assert recorder.dtypes["historical_no_show_count"] == np.float64
+        for col, dtype in signature_dtypes.items():
+            if col != "historical_no_show_count":
+                assert recorder.dtypes[col] == dtype, col
+
+    def test_null_bool_stays_missing(self, install, signature_dtypes, monkeypatch):
+        """A null in a bool column is passed through, never cast to False."""
+        captured = {}
+
+        class CapturingModel(RecordingModel):
+            def predict_proba(self, features):
+                captured["portal_engaged"] = features["portal_engaged"].tolist()
+                return super().predict_proba(features)
+
+        install(CapturingModel())
+        monkeypatch.setattr(score, "_EXPECTED_DTYPES", signature_dtypes)
+        rows = _rows(_training_frame(2, seed=42))
+        rows[0][FEATURE_COLUMNS.index("portal_engaged")] = None
+
+        _request({"input_data": {"columns": FEATURE_COLUMNS, "data": rows}})
+
+        assert captured["portal_engaged"][0] is None
+
+
+# =============================================================================
+# ONNX Tests
+# =============================================================================
+
+
+class FakeSession:
+    """ONNX Runtime session stand-in returning fixed probabilities."""
+
+    def __init__(self, probabilities, inputs=None):
+        self._probabilities = np.asarray(probabilities, dtype=np.float32)
+        self._inputs = inputs or [
+            SimpleNamespace(name="input", type="tensor(float)", shape=[None, len(FEATURE_COLUMNS)])
+        ]
+
+    def get_inputs(self):
+        return self._inputs
+
+    def run(self, output_names, feeds):
+        n = len(next(iter(feeds.values())))
+        return [np.zeros(n, dtype=np.int64), np.repeat(self._probabilities, n, axis=0)]
+
+
+@pytest.fixture(scope="module")
+def onnx_session(array_model):
+    """Real ONNX session converted from the array-fitted tree model."""
+    ort = pytest.importorskip("onnxruntime")
+    skl2onnx = pytest.importorskip("skl2onnx")
+    from skl2onnx.common.data_types import FloatTensorType
+
+    onnx_model = skl2onnx.convert_sklearn(
+        array_model,
+        initial_types=[("input", FloatTensorType([None, len(FEATURE_COLUMNS)]))],
+    )
+    return ort.InferenceSession(
+        onnx_model.SerializeToString(), providers=["CPUExecutionProvider"]
+    )
+
+
+class TestOnnx:
+    """Tests for ONNX Runtime scoring and its init-time validation."""
+
+    def test_converted_session_accepted(self, install, array_model, onnx_session):
+        """A faithful conversion passes validation."""
+        install(array_model)
+        assert score._onnx_session_matches(onnx_session, array_model)
+
+    def test_run_with_session(self, install, array_model, numeric_frame, onnx_session, monkeypatch):
+        """Scoring through ONNX matches the sklearn model."""
+        install(array_model)
+        monkeypatch.setattr(score, "_SESSION", onnx_session)
+        frame = numeric_frame.head(20)
+
+        predictions = _request({
+            "input_data": {"columns": FEATURE_COLUMNS, "data": _rows(frame)}
+        })
+
+        expected = array_model.predict_proba(frame.to_numpy())[:, 1]
+        assert [p["no_show_probability"] for p in predictions] == np.round(expected, 3).tolist()
+
+    def test_unknown_input_names_rejected(self, install, array_model):
+        """Per-column graphs must name their inputs after FEATURE_COLUMNS."""
+        install(array_model)
+        inputs = [
+            SimpleNamespace(name=name, type="tensor(float)", shape=[None, 1])
+            for name in ["age", "lead_time"]
+        ]
+        assert not score._onnx_session_matches(FakeSession([[0.5, 0.5]], inputs), array_model)
+
+    def test_wrong_input_width_rejected(self, install, array_model):
+        """Single-tensor graphs must take every feature column."""
+        install(array_model)
+        inputs = [SimpleNamespace(name="input", type="tensor(float)", shape=[None, 5])]
+        assert not score._onnx_session_matches(FakeSession([[0.5, 0.5]], inputs), array_model)
+
+    def test_wrong_output_shape_rejected(self, install, array_model):
+        """Graphs must return one probability per model class."""
+        install(array_model)
+        assert not score._onnx_session_matches(FakeSession([[0.2, 0.3, 0.5]]), array_model)
+
+    def test_disagreeing_session_rejected(self, install, array_model):
+        """Graphs whose probabilities differ from sklearn are not used."""
+        install(array_model)
+        expected = array_model.predict_proba(np.zeros((1, len(FEATURE_COLUMNS))))
+        flipped = expected[:, ::-1] if expected[0, 0] != 0.5 else [[0.9, 0.1]]
+        assert not score._onnx_session_matches(FakeSession(flipped), array_model)
+
+
+# =============================================================================
+# Micro-batching Tests
+# =============================================================================
+
+
+def _pending(features) -> dict:
+    """A queued request as _MicroBatcher.submit() enqueues it."""
+    return {"features": features, "done": threading.Event()}
+
+
+class TestMicroBatcher:
+    """Tests for coalescing concurrent requests into one model call."""
+
+    def test_results_match_individual_scoring(self, pipeline_model):
+        """Each caller gets its own slice of the combined batch."""
+        batcher = score._MicroBatcher(pipeline_model.predict_proba, 0.001, 1000)
+        frames = [_training_frame(n, seed=20 + n) for n in (1, 4, 2)]
+        batch = [_pending(frame) for frame in frames]
+
+        batcher._score(batch)
+
+        for pending, frame in zip(batch, frames):
+            assert pending["done"].is_set()
+            np.testing.assert_allclose(pending["result"], pipeline_model.predict_proba(frame))
+
+    def test_malformed_request_fails_alone(self, pipeline_model):
+        """A request the model rejects doesn't fail the rest of the batch."""
+        batcher = score._MicroBatcher(pipeline_model.predict_proba, 0.001, 1000)
+        good = _training_frame(3, seed=30)
+        bad = _training_frame(2, seed=31)
+        bad.loc[0, "historical_no_show_rate"] = np.nan
+        batch = [_pending(good), _pending(bad), _pending(good)]
+
+        batcher._score(batch)
+
+        assert "error" in batch[1]
+        for pending in (batch[0], batch[2]):
+            assert "error" not in pending
+            np.testing.assert_allclose(pending["result"], pipeline_model.predict_proba(good))
+
+    def test_mismatched_dtypes_not_coalesced(self):
+        """Frames with different dtypes are scored in separate calls."""
+        calls = []
+
+        def predict_fn(features):
+            calls.append((len(features), features["lead_time_days"].dtype))
+            return np.full((len(features), 2), 0.5)
+
+        batcher = score._MicroBatcher(predict_fn, 0.001, 1000)
+        numeric = pd.DataFrame({"lead_time_days": [1.0, 2.0]})
+        mixed = pd.DataFrame({"lead_time_days": [3.0, None]}, dtype=object)
+
+        batcher._score([_pending(numeric), _pending(mixed), _pending(numeric)])
+
+        assert sorted(calls, key=str) == sorted(
+            [(4, np.dtype(np.float64)), (2, np.dtype(object))], key=str
+        )
+
+
+# =============================================================================
+# Error Handling Tests
+# =============================================================================
+
+
+class TestErrors:
+    """Tests for error responses."""
+
+    def test_unknown_format(self, install, pipeline_model):
+        """Requests in neither format return an error."""
+        install(pipeline_model)
+        response = json.loads(score.run(json.dumps({"rows": []})))
+        assert "Unknown input format" in response["error"]
+
+    def test_model_not_initialized(self, monkeypatch):
+        """Requests before init() return an error."""
+        monkeypatch.setattr(score, "model", None)
+        response = json.loads(score.run(json.dumps({"appointments": []})))
+        assert response == {"error": "Model not initialized"}
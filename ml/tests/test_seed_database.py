@@ -0,0 +1,253 @@
+"""Tests for database seeding helpers.
+
+Validates:
+- Column projection and derived appointment columns
+- JSON serialization for OPENJSON bulk inserts
+- Multi-row VALUES statement grouping
+"""
+
+import json
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# seed_database imports the SQL driver and Azure credential at module level
+pytest.importorskip("pyodbc")
+pytest.importorskip("azure.identity")
+
+from src.data.seed_database import (  # noqa: E402
+    MAX_SQL_PARAMETERS,
+    TABLE_COLUMNS,
+    dataframe_to_json_rows,
+    insert_frames,
+    project_dataframe,
+)
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+class RecordingCursor:
+    """Cursor stand-in recording every statement it runs."""
+
+    fast_executemany = False
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def execute(self, sql, params):
+        self.connection.calls.append((sql, [params]))
+
+    def executemany(self, sql, params):
+        self.connection.calls.append((sql, list(params)))
+
+    def close(self):
+        pass
+
+
+class RecordingConnection:
+    """Connection stand-in collecting statements and commits."""
+
+    def __init__(self):
+        self.calls = []
+        self.commits = 0
+
+    def cursor(self):
+        return RecordingCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        pass
+
+
+def _insurance_frame(n: int) -> pd.DataFrame:
+    """Insurance rows with a nullable column and a column not in the table."""
+    return pd.DataFrame({
+        "primarypatientinsuranceid": np.arange(1, n + 1),
+        "patientid": np.arange(1001, 1001 + n),
+        "sipg1": ["Commercial"] * n,
+        "sipg2": ["Commercial"] * n,
+        "insurance_plan_1_company_description": ["Acme Health"] * n,
+        "insurance_group_id": [None if i % 3 == 0 else f"G{i}" for i in range(n)],
+        "not_a_column": range(n),
+    })
+
+
+def _values_rows(sql: str) -> int:
+    """Number of VALUES rows in an INSERT statement."""
+    return sql.split(" VALUES ", 1)[1].count("(")
+
+
+# =============================================================================
+# Projection Tests
+# =============================================================================
+
+
+class TestProjectDataframe:
+    """Tests for selecting and deriving the columns to insert."""
+
+    @pytest.fixture
+    def appointments(self):
+        return pd.DataFrame({
+            "appointmentid": [1, 2],
+            "appointmentdate": [date(2024, 1, 5), date(2024, 12, 31)],
+            "appointmentstarttime": ["08:30", "17:05"],
+            "appointmentduration": [30, 45],
+            "not_a_column": ["x", "y"],
+        })
+
+    def test_appointment_datetime_from_date_and_time(self, appointments):
+        """appointmentdatetime combines the date with the HH:MM start time."""
+        projected = project_dataframe(appointments, "Appointments")
+
+        assert projected["appointmentdatetime"].tolist() == [
+            pd.Timestamp("2024-01-05 08:30"),
+            pd.Timestamp("2024-12-31 17:05"),
+        ]
+        assert projected["appointmentdate"].tolist() == ["2024-01-05", "2024-12-31"]
+
+    def test_columns_follow_table_definition(self, appointments):
+        """Only table columns are kept, in table order."""
+        projected = project_dataframe(appointments, "Appointments")
+
+        expected = [
+            col for col in TABLE_COLUMNS["Appointments"]
+            if col in appointments.columns or col == "appointmentdatetime"
+        ]
+        assert list(projected.columns) == expected
+
+    def test_input_not_modified(self, appointments):
+        """The source frame keeps its own columns and values."""
+        before = appointments.copy()
+
+        project_dataframe(appointments, "Appointments")
+
+        pd.testing.assert_frame_equal(appointments, before)
+
+    @pytest.mark.parametrize(
+        "start_time",
+        [None, "x9:3z", "8:30", "0830", "08-30", "24:00", "12:60", "08:30:00"],
+    )
+    def test_malformed_start_time_becomes_null(self, appointments, start_time):
+        """Start times not formatted as a valid HH:MM give a NULL datetime."""
+        appointments["appointmentstarttime"] = appointments["appointmentstarttime"].astype(object)
+        appointments.loc[1, "appointmentstarttime"] = start_time
+
+        projected = project_dataframe(appointments, "Appointments")
+
+        assert projected["appointmentdatetime"].tolist()[0] == pd.Timestamp("2024-01-05 08:30")
+        assert pd.isna(projected["appointmentdatetime"].iloc[1])
+
+
+# =============================================================================
+# OPENJSON Serialization Tests
+# =============================================================================
+
+
+class TestDataframeToJsonRows:
+    """Tests for the JSON documents sent to OPENJSON."""
+
+    def test_nulls_become_json_null(self):
+        """Missing values in any column are written as null."""
+        df = pd.DataFrame({
+            "text": ["a", None],
+            "number": [1.5, np.nan],
+            "when": pd.to_datetime(["2024-01-05 08:30", None]),
+        })
+
+        rows = json.loads(dataframe_to_json_rows(df))
+
+        assert rows[1] == [None, None, None]
+
+    def test_integral_floats_become_integers(self):
+        """Float columns holding whole numbers (nullable ints) are written as integers."""
+        df = pd.DataFrame({"parentappointmentid": [12.0, np.nan, 7.0]})
+
+        text = dataframe_to_json_rows(df)
+
+        assert json.loads(text) == [[12], [None], [7]]
+        assert "12.0" not in text
+
+    def test_fractional_floats_unchanged(self):
+        """Float columns with fractional values stay floats."""
+        df = pd.DataFrame({"historical_no_show_rate": [0.25, 1.0]})
+
+        assert json.loads(dataframe_to_json_rows(df)) == [[0.25], [1.0]]
+
+    def test_timezone_aware_timestamps_written_as_naive_utc(self):
+        """Aware timestamps are converted to UTC and written without an offset."""
+        local = pd.to_datetime(["2024-01-05 07:00"]).tz_localize("US/Central")
+        df = pd.DataFrame({"portal_last_login": local})
+
+        assert json.loads(dataframe_to_json_rows(df)) == [["2024-01-05T13:00:00.000000"]]
+
+    def test_naive_timestamps_unchanged(self):
+        """Naive timestamps are written as-is."""
+        df = pd.DataFrame({"appointmentdatetime": pd.to_datetime(["2024-01-05 08:30"])})
+
+        assert json.loads(dataframe_to_json_rows(df)) == [["2024-01-05T08:30:00.000000"]]
+
+
+# =============================================================================
+# Multi-row VALUES Tests
+# =============================================================================
+
+
+class TestInsertFrames:
+    """Tests for grouping rows into multi-row VALUES statements."""
+
+    COLUMNS = TABLE_COLUMNS["Insurance"]
+    ROWS_PER_STATEMENT = MAX_SQL_PARAMETERS // len(TABLE_COLUMNS["Insurance"]) - 1
+
+    def _insert(self, df: pd.DataFrame, batch_size: int) -> RecordingConnection:
+        connection = RecordingConnection()
+        inserted, _ = insert_frames(connection, [df], "Insurance", len(df), batch_size=batch_size)
+        assert inserted == len(df)
+        return connection
+
+    def test_statements_within_parameter_limit(self):
+        """Full statements carry as many rows as fit under the parameter limit."""
+        connection = self._insert(_insurance_frame(2 * self.ROWS_PER_STATEMENT + 5), 10_000)
+
+        multi_sql, groups = connection.calls[0]
+        assert _values_rows(multi_sql) == self.ROWS_PER_STATEMENT
+        assert len(groups) == 2
+        assert all(len(group) == self.ROWS_PER_STATEMENT * len(self.COLUMNS) for group in groups)
+        assert all(len(group) <= MAX_SQL_PARAMETERS for group in groups)
+
+    def test_remainder_uses_single_row_statement(self):
+        """Rows that don't fill a statement go through the single-row INSERT."""
+        connection = self._insert(_insurance_frame(2 * self.ROWS_PER_STATEMENT + 5), 10_000)
+
+        single_sql, remainder = connection.calls[1]
+        assert _values_rows(single_sql) == 1
+        assert len(remainder) == 5
+        assert len(connection.calls) == 2
+
+    def test_rows_inserted_once_in_order(self):
+        """Every row is bound exactly once, in order, across batches and remainders."""
+        df = _insurance_frame(2 * self.ROWS_PER_STATEMENT + 5)
+        connection = self._insert(df, batch_size=self.ROWS_PER_STATEMENT + 10)
+
+        bound = []
+        for sql, param_sets in connection.calls:
+            for params in param_sets:
+                bound.extend(params)
+        expected = df[self.COLUMNS].astype(object).where(df[self.COLUMNS].notna(), None)
+        assert bound == [value for row in expected.itertuples(index=False) for value in row]
+
+    def test_batch_smaller_than_statement(self):
+        """Batches too small for a full statement are all single-row inserts."""
+        connection = self._insert(_insurance_frame(7), 10_000)
+
+        assert len(connection.calls) == 1
+        single_sql, remainder = connection.calls[0]
+        assert _values_rows(single_sql) == 1
+        assert len(remainder) == 7
+        assert remainder[0][5] is None
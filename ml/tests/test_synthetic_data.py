@@ -6,6 +6,7 @@ Validates:
 - No-show rate target (~22%)
 - Patient journey patterns
 - Seasonality effects
+- Parquet export schema for streamed chunks
 """
 
 from collections import Counter
@@ -13,21 +14,28 @@ from datetime import date, datetime
 
 import pytest
 
+import pandas as pd
+import pyarrow as pa
+
 from src.data.generate_synthetic import (
     BASE_NO_SHOW_RATE,
+    _arrow_schema,
     generate_all_data,
     generate_appointments,
     generate_departments,
     generate_insurance,
     generate_patients,
     generate_providers,
+    write_entity_chunks_parquet,
 )
 from src.data.schema import (
     AgeBucket,
     AppointmentStatus,
+    Department,
     Gender,
     NewPatientFlag,
     PayerGrouping,
+    PlaceOfServiceType,
     VirtualFlag,
 )
 
@@ -538,6 +546,48 @@ class TestDataIntegrity:
             assert ins.patientid in patient_ids, f"Invalid patient reference: {ins.patientid}"
 
 
+# =============================================================================
+# Parquet Export Tests
+# =============================================================================
+
+
+class TestParquetExport:
+    """Tests for streaming entities to Parquet."""
+
+    def test_schema_from_annotations(self):
+        """Column types follow the annotations, including Optional fields."""
+        schema = _arrow_schema(Department)
+
+        assert schema.field("departmentid").type == pa.int64()
+        assert schema.field("providergroupid").type == pa.int64()
+        assert schema.field("departmentspecialty").type == pa.string()
+        assert schema.field("placeofservicetype").type == pa.dictionary(pa.int8(), pa.string())
+
+    def test_values_first_seen_in_later_chunk(self, tmp_path):
+        """Fields empty in the first chunk still accept values in later chunks."""
+        path = tmp_path / "departments.parquet"
+        chunks = [
+            [Department(departmentid=1, departmentname="Clinic A")],
+            [
+                Department(
+                    departmentid=2,
+                    departmentname="Clinic B",
+                    departmentspecialty="Cardiology",
+                    placeofservicetype=PlaceOfServiceType.OFFICE,
+                    providergroupid=7,
+                )
+            ],
+        ]
+
+        rows = write_entity_chunks_parquet(iter(chunks), path)
+
+        df = pd.read_parquet(path)
+        assert rows == 2
+        assert df["departmentspecialty"].tolist() == [None, "Cardiology"]
+        assert df["placeofservicetype"].astype(object).tolist()[1] == "Office"
+        assert df["providergroupid"].tolist()[1] == 7
+
+
 # =============================================================================
 # Full Generation Test
 # =============================================================================